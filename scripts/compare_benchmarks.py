@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Compares two benchmark result files written with `pytest --benchmark-results PATH`
+
+# Standard
+import argparse
+import json
+import sys
+
+parser = argparse.ArgumentParser(
+    description="Compares two benchmark result files and reports the regressions"
+)
+parser.add_argument("baseline", help="the results of the reference release")
+parser.add_argument("current", help="the results to compare")
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=0.2,
+    help="the relative slowdown reported as a regression (default 0.2 is 20%%)",
+)
+args = parser.parse_args()
+
+
+def load(path):
+    with open(path) as file:
+        report = json.load(file)
+    results = {(r["test"], r["name"]): r["rate"] for r in report["results"]}
+    return report, results
+
+
+baseline_report, baseline = load(args.baseline)
+current_report, current = load(args.current)
+print(f"baseline: {baseline_report['version']} ({baseline_report['timestamp']})")
+print(f"current:  {current_report['version']} ({current_report['timestamp']})")
+print("-------------------------------")
+
+regressions = 0
+for key in sorted(baseline.keys() & current.keys()):
+    change = current[key] / baseline[key] - 1
+    regression = change < -args.threshold
+    regressions += regression
+    print(
+        f"{'REGRESSION ' if regression else ''}{key[0]} [{key[1]}]: "
+        f"{baseline[key]:.0f} -> {current[key]:.0f}/s ({change:+.1%})"
+    )
+for key in sorted(baseline.keys() - current.keys()):
+    print(f"missing: {key[0]} [{key[1]}]")
+
+sys.exit(1 if regressions else 0)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Serves a recorded SICK Tag-LOC stream over a local WebSocket
+
+# Standard
+import argparse
+import logging
+
+# InOrbit
+from sick_tag_loc_connector.api.replay import ReplayServer
+
+parser = argparse.ArgumentParser(
+    description="Serves a recorded SICK Tag-LOC stream over a local WebSocket"
+)
+parser.add_argument("recording", help="the recording file (see sick_rtls_record_path)")
+parser.add_argument("--host", default="127.0.0.1", help="the host to listen on")
+parser.add_argument("--port", type=int, default=8080, help="the port to listen on")
+parser.add_argument(
+    "--speed",
+    type=float,
+    default=1.0,
+    help="the replay speed; 1 is real time and 0 is as fast as possible",
+)
+parser.add_argument("--loop", action="store_true", help="replay over and over")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+server = ReplayServer(args.recording, args.host, args.port, args.speed, args.loop)
+server.start()
+try:
+    server.wait_done()
+except KeyboardInterrupt:
+    pass
+finally:
+    server.stop()
+print(f"Sent {server.frames_sent} frames")
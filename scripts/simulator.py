@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Simulates a SICK RTLS server with thousands of moving tags for scale testing
+
+# Standard
+import argparse
+import logging
+import time
+
+# InOrbit
+from sick_tag_loc_connector.api.simulator import (
+    DEFAULT_AREA,
+    DEFAULT_NUM_TAGS,
+    DEFAULT_SPEED,
+    DEFAULT_UPDATE_RATE,
+    RtlsSimulator,
+)
+
+parser = argparse.ArgumentParser(
+    description="Simulates a SICK RTLS server with thousands of moving tags"
+)
+parser.add_argument(
+    "--tags", type=int, default=DEFAULT_NUM_TAGS, help="the number of tags"
+)
+parser.add_argument(
+    "--rate",
+    type=float,
+    default=DEFAULT_UPDATE_RATE,
+    help="the position updates per second of each tag",
+)
+parser.add_argument(
+    "--speed", type=float, default=DEFAULT_SPEED, help="the tag speed in m/s"
+)
+parser.add_argument(
+    "--area",
+    type=float,
+    nargs=2,
+    default=DEFAULT_AREA,
+    metavar=("WIDTH", "HEIGHT"),
+    help="the size of the area the tags move in, in meters",
+)
+parser.add_argument("--host", default="127.0.0.1", help="the host to listen on")
+parser.add_argument(
+    "--port", type=int, default=8080, help="the REST API and WebSocket port"
+)
+parser.add_argument("--api-key", help="the API key required by the REST API")
+parser.add_argument("--seed", type=int, help="the seed of the tag movements")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+simulator = RtlsSimulator(
+    args.tags,
+    args.rate,
+    args.speed,
+    tuple(args.area),
+    args.host,
+    args.port,
+    args.api_key,
+    args.seed,
+)
+simulator.start()
+try:
+    while True:
+        sent = simulator.messages_sent
+        time.sleep(10)
+        print(
+            f"{(simulator.messages_sent - sent) / 10:.0f} msg/s, "
+            f"{simulator.late_ticks} late steps"
+        )
+except KeyboardInterrupt:
+    pass
+finally:
+    simulator.stop()
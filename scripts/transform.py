@@ -3,7 +3,18 @@
 # License: MIT License
 # Copyright 2024 InOrbit, Inc.
 
-# Computes the translational transform between SICK Tag-LOC and InOrbit
+# Computes the transform between SICK Tag-LOC and InOrbit from point correspondences
+
+# Standard
+import argparse
+import math
+
+# InOrbit
+from sick_tag_loc_connector.calibration import (
+    CALIBRATION_MODES,
+    CALIBRATION_RIGID,
+    fit_transform,
+)
 
 # An ordered set of ground truth points in the InOrbit coordinate system
 inorbit = [
@@ -21,20 +32,29 @@ rtls = [
     {"x": 11.77, "y": -3.41},
 ]
 
-# Calculate average translations
-translation_x = sum((b["x"] - a["x"]) for a, b in zip(inorbit, rtls)) / len(inorbit)
-# The coordinate system for "Y" in SICK is reversed so negate everything
-translation_y = -sum((b["y"] + a["y"]) for a, b in zip(inorbit, rtls)) / len(inorbit)
-
-# Calculate average rotation - Since no theta in the SICK system, assume rotation based
-# on coordinate changes might need to align system InOrbit's theta with the coordinate
-# changes only. If thetas from the SICK system were known, they would be subtracted from
-# each corresponding InOrbit theta.
-theta_inorbit = [p["theta"] for p in inorbit]
-# This is not directly useful without SICK system thetas
-average_theta_inorbit = sum(theta_inorbit) / len(theta_inorbit)
-
-print(f"translation_x: {translation_x}")
-print(f"translation_y: {translation_y}")
+parser = argparse.ArgumentParser(
+    description="Computes the transform between SICK Tag-LOC and InOrbit"
+)
+parser.add_argument(
+    "--mode",
+    choices=CALIBRATION_MODES,
+    default=CALIBRATION_RIGID,
+    help="rotation and translation (rigid), plus uniform scale (similarity) or a "
+    "full affine transform (affine)",
+)
+args = parser.parse_args()
+
+calibration = fit_transform(
+    [(p["x"], p["y"]) for p in rtls], [(p["x"], p["y"]) for p in inorbit], args.mode
+)
+
+print(f"{args.mode} fit of {len(rtls)} points")
+print(f"rotation: {math.degrees(calibration.rotation):.3f} deg")
+print(f"scale: {calibration.scale:.6f}")
+for i, residual in enumerate(calibration.residuals):
+    print(f"residual {i}: {residual:.3f} m")
+print(f"rms: {calibration.rms:.3f} m, max: {calibration.max_residual:.3f} m")
 print("-------------------------------")
-print(f"average_theta_inorbit: {average_theta_inorbit}")
+print("transform_matrix:")
+for row in calibration.matrix:
+    print(f"  - [{', '.join(repr(value) for value in row)}]")
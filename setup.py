@@ -46,6 +46,10 @@ setup(
             "sick-tag-loc-connector=sick_tag_loc_connector.main:start",
         ]
     },
+    extras_require={
+        "asyncio": ["websockets>=13.0,<18.0"],
+        "orjson": ["orjson>=3.8,<4.0"],
+    },
     install_requires=install_requirements,
     keywords=["inorbit", "robops", "robotics"],
     license="MIT",
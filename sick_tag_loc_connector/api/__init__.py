@@ -8,11 +8,25 @@
 ENDPOINT_FEEDS: str = "feeds"
 ENDPOINT_TAGS: str = "tags"
 HEADER_API_KEY: str = "X-ApiKey"
+PARAM_LIMIT: str = "limit"
+PARAM_OFFSET: str = "offset"
+DEFAULT_PAGE_SIZE: int = 100
 REST_ENDPOINT = "/sensmapserver/api"
+WEBSOCKET_ENGINE_THREAD: str = "thread"
+WEBSOCKET_ENGINE_ASYNCIO: str = "asyncio"
 
 # Clients
 from .rest import RestClient, FeedTypes  # noqa: F401, E402
 from .websocket import WebSocketClient  # noqa: F401, E402
+from .async_websocket import AsyncWebSocketClient  # noqa: F401, E402
+from .recorder import StreamRecorder  # noqa: F401, E402
+from .stream import StreamManager  # noqa: F401, E402
+
+# Available WebSocket client implementations
+WEBSOCKET_ENGINES = {
+    WEBSOCKET_ENGINE_THREAD: WebSocketClient,
+    WEBSOCKET_ENGINE_ASYNCIO: AsyncWebSocketClient,
+}
 
 # Models
 from .feed import Feed  # noqa: F401, E402
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Callable, Coroutine, Union
+
+# Third-party
+try:
+    from websockets.asyncio.client import ClientConnection, connect
+    from websockets.exceptions import ConnectionClosed, WebSocketException
+except ImportError:  # pragma: no cover
+    ClientConnection = None
+    connect = None
+    ConnectionClosed = Exception
+    WebSocketException = Exception
+
+# InOrbit
+from sick_tag_loc_connector.api.websocket import (
+    DEFAULT_OPEN_TIMEOUT,
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+    DEFAULT_RECONNECT_BACKOFF,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    WebSocketClient,
+)
+
+
+class EventLoopThread:
+    """An asyncio event loop running on a background thread.
+
+    A single instance is shared by every AsyncWebSocketClient so all the streams are
+    driven by one event loop, regardless of how many connections are open.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """EventLoopThread Constructor
+
+        The loop is started right away on a daemon thread.
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name=self.__class__.__name__, daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def shared(cls) -> "EventLoopThread":
+        """Get the event loop shared by all the asyncio clients.
+
+        Returns:
+            EventLoopThread: The shared event loop, started on first use
+        """
+        with cls._shared_lock:
+            if cls._shared is None or not cls._shared.loop.is_running():
+                cls._shared = cls()
+            return cls._shared
+
+    def run(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the event loop from any thread.
+
+        Args:
+            coro (Coroutine): The coroutine to run
+
+        Returns:
+            Future: A future holding the result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def in_loop(self) -> bool:
+        """Check if the caller is running on the event loop thread.
+
+        Returns:
+            bool: If the current thread is the event loop thread
+        """
+        return threading.current_thread() is self._thread
+
+    def stop(self) -> None:
+        """Stop the event loop and wait for its thread to finish."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class AsyncWebSocketClient(WebSocketClient):
+    """asyncio WebSocketClient for SICK Streams
+
+    Same contract as the WebSocketClient, but connections are driven by a shared
+    asyncio event loop instead of one blocking thread per connection. The public
+    methods can be called from any thread.
+
+    The keepalive pings are sent by the client itself rather than by "websockets", so
+    every round-trip time is recorded and a dead link is aborted right away instead of
+    waiting for a closing handshake that will never complete.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        feed_id: str | None,
+        on_message_cb: Callable,
+        open_timeout: float | None = DEFAULT_OPEN_TIMEOUT,
+        reconnect: bool = True,
+        reconnect_backoff: float = DEFAULT_RECONNECT_BACKOFF,
+        reconnect_max_delay: float = DEFAULT_RECONNECT_MAX_DELAY,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        ping_timeout: float = DEFAULT_PING_TIMEOUT,
+        name: str | None = None,
+        loop_thread: EventLoopThread | None = None,
+    ):
+        """AsyncWebSocketClient Constructor
+
+        Initializes the AsyncWebSocketClient.
+
+        Args:
+            url (str): The WebSocket server URL to connect to
+            api_key (str): The API Key to authenticate to the WebSocket
+            feed_id (str | None): The SICK feed ID for this WebSocket client; can be
+                                  None for connections shared by several feeds
+            on_message_cb (Callable): Callback to execute when a message is received
+            open_timeout (float | None, optional): Seconds to wait for the connection
+                                                   to open (None waits forever)
+            reconnect (bool, optional): If the connection is reopened when it is lost
+            reconnect_backoff (float, optional): The upper bound in seconds of the
+                                                 first reconnect delay
+            reconnect_max_delay (float, optional): The upper bound in seconds of the
+                                                   reconnect delay
+            ping_interval (float, optional): Seconds between keepalive pings (0
+                                             disables them)
+            ping_timeout (float, optional): Seconds to wait for the pong of a
+                                            keepalive ping
+            name (str | None, optional): The name of the stream in the metrics;
+                                         defaults to the feed ID or the URL
+            loop_thread (EventLoopThread | None, optional): The event loop to run on;
+                                                            defaults to the shared loop
+
+        Raises:
+            ImportError: If the optional "websockets" package is not installed
+        """
+        if connect is None:
+            raise ImportError(
+                "The asyncio WebSocket engine requires the 'websockets' package; "
+                "install it with 'pip install sick-tag-loc-connector[asyncio]'"
+            )
+        super().__init__(
+            url,
+            api_key,
+            feed_id,
+            on_message_cb,
+            open_timeout,
+            reconnect,
+            reconnect_backoff,
+            reconnect_max_delay,
+            ping_interval,
+            ping_timeout,
+            name,
+        )
+        self._loop_thread = loop_thread or EventLoopThread.shared()
+        self._reader = None
+        self._keepalive = None
+
+    def send(self, data: Union[bytes, str]) -> None:
+        """Main send function.
+
+        Queue a message to be sent through the WebSocket connection. This does not
+        wait for the message to be written.
+
+        Args:
+            data (bytes | str): The data to send.
+        """
+        if self.ws and self.connected():
+            self._loop_thread.run(self.ws.send(data)).add_done_callback(
+                self._on_send_done
+            )
+        else:
+            self.logger.warning("WebSocket not connected - data not sent")
+
+    def open(self) -> None:
+        """Main connection method.
+
+        Establish the WebSocket connection and start listening for messages on the
+        event loop. Blocks until the connection is open.
+
+        Raises:
+            TimeoutError: If the connection is not open within the open timeout
+            WebSocketException: If the server rejects the opening handshake
+        """
+        self._loop_thread.run(self._open()).result()
+
+    def close(self) -> None:
+        """Main disconnection method.
+
+        Close the WebSocket connection and wait for the listening task to finish.
+        """
+        if self._loop_thread.in_loop():
+            self._loop_thread.loop.create_task(self._close())
+        else:
+            self._loop_thread.run(self._close()).result()
+
+    async def _open(self) -> None:
+        """Open the connection and start the reader task."""
+        self._closing.clear()
+        await self._connect()
+        self.on_open()
+        self._reader = asyncio.get_running_loop().create_task(self._read())
+
+    async def _connect(self) -> None:
+        """Open the connection, reporting errors, and start the keepalive task."""
+        try:
+            # The built-in keepalive is replaced by the client's own
+            self.ws = await connect(
+                self.url, open_timeout=self.open_timeout, ping_interval=None
+            )
+        except (OSError, asyncio.TimeoutError, WebSocketException) as e:
+            # i.e., a handshake rejected with HTTP 503 while the server restarts
+            self.on_error(str(e))
+            raise
+        if self.ping_interval:
+            self._keepalive = asyncio.get_running_loop().create_task(
+                self._ping(self.ws)
+            )
+
+    async def _ping(self, ws: ClientConnection) -> None:
+        """Send keepalive pings, aborting the connection if a pong is late.
+
+        Args:
+            ws (ClientConnection): The connection to keep alive
+        """
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                pong = await ws.ping()
+                self.on_pong(await asyncio.wait_for(pong, self.ping_timeout))
+            except asyncio.TimeoutError:
+                self.on_ping_timeout()
+                # No closing handshake over a dead link, the reader sees it closed
+                ws.transport.abort()
+                return
+            except ConnectionClosed:
+                return
+
+    def _stop_keepalive(self) -> None:
+        """Stop sending keepalive pings on the current connection."""
+        if self._keepalive:
+            self._keepalive.cancel()
+            self._keepalive = None
+
+    async def _read(self) -> None:
+        """Dispatch every received message, reconnecting until the client is closed."""
+        while True:
+            try:
+                async for msg in self.ws:
+                    try:
+                        self.on_message(msg)
+                    except Exception as e:
+                        self.on_error(str(e))
+            except ConnectionClosed:
+                pass
+            self._stop_keepalive()
+            self.on_close(self.ws.close_code, self.ws.close_reason)
+            if not self.reconnecting() or not await self._reconnect():
+                return
+
+    async def _reconnect(self) -> bool:
+        """Reopen a lost connection, retrying with backoff.
+
+        Returns:
+            bool: If the connection was reopened, False if reconnecting is disabled or
+                  the client was closed meanwhile
+        """
+        while self.reconnect:
+            await asyncio.sleep(self._next_reconnect_delay())
+            try:
+                await self._connect()
+            except (OSError, asyncio.TimeoutError, WebSocketException):
+                continue
+            if self._closing.is_set():
+                self._stop_keepalive()
+                await self.ws.close()
+                return False
+            self.on_open()
+            return True
+        return False
+
+    async def _close(self) -> None:
+        """Close the connection and wait for the reader task."""
+        self._closing.set()
+        self._stop_keepalive()
+        if self.ws:
+            await self.ws.close()
+        if self._reader:
+            if self.reconnecting():
+                # Waiting to reconnect, there is nothing else to wait for
+                self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        self._end_downtime()
+
+    def _on_send_done(self, future: Future) -> None:
+        """Report errors of messages sent in the background.
+
+        Args:
+            future (Future): The completed send operation
+        """
+        if not future.cancelled() and (error := future.exception()):
+            self.on_error(str(error))
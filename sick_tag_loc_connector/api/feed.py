@@ -4,7 +4,9 @@
 # Copyright 2024 InOrbit, Inc.
 
 # Standard
-from typing import Type, TypeVar, Set, Any, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Type, TypeVar, Set, Any, Callable, Iterator, List
 from urllib.parse import urlparse
 
 # InOrbit
@@ -13,6 +15,9 @@ from sick_tag_loc_connector.api import (
     WebSocketClient,
     ENDPOINT_FEEDS,
     HEADER_API_KEY,
+    PARAM_LIMIT,
+    PARAM_OFFSET,
+    DEFAULT_PAGE_SIZE,
 )
 
 T: TypeVar = TypeVar("T", bound="Feed")
@@ -128,22 +133,49 @@ class Feed:
         return cls(rest_client, **data)
 
     @staticmethod
-    def get_all(rest_client: RestClient) -> Set[T]:
+    def get_all(
+        rest_client: RestClient, page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = 0
+    ) -> Set[T]:
         """Get all the feeds from the system.
 
         This static method will attempt to load all the feeds from the SICK
-        Tag-LOC system via the REST API.
+        Tag-LOC system via the REST API. Prefer iter_all() for large systems.
 
         Args:
             rest_client (RestClient): The client to communicate with the REST API
+            page_size (int, optional): The number of feeds requested per page
+            prefetch (int, optional): The number of pages requested concurrently ahead
+                                      of the page being consumed
 
         Returns:
             A set of Feed instances, representing the retrieved feeds
         """
-        # TODO(elvio.aruta): add pagination to this get call
-        data = rest_client.get(ENDPOINT_FEEDS)
-        feed_set = {Feed(rest_client, **feed) for feed in data["results"]}
-        return feed_set
+        return set(Feed.iter_all(rest_client, page_size, prefetch))
+
+    @classmethod
+    def iter_all(
+        cls: Type[T],
+        rest_client: RestClient,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+    ) -> Iterator[T]:
+        """Iterate over all the feeds in the system.
+
+        Feeds are requested page by page and yielded as each page arrives, so the whole
+        list is never held in memory.
+
+        Args:
+            rest_client (RestClient): The client to communicate with the REST API
+            page_size (int, optional): The number of feeds requested per page
+            prefetch (int, optional): The number of pages requested concurrently ahead
+                                      of the page being consumed
+
+        Yields:
+            Instances of the Feed class, representing the retrieved feeds
+        """
+        for page in iter_pages(rest_client, ENDPOINT_FEEDS, page_size, prefetch):
+            for feed in page:
+                yield cls(rest_client, **feed)
 
     @classmethod
     def create(cls: Type[T], rest_client: RestClient, data: dict) -> T:
@@ -263,7 +295,13 @@ class Feed:
         """
         return f"{SICK_RTLS_ID_PREFIX}-{self._type}_{self._id}_{self.title}"
 
-    def get_websocket_client(self, port: int, callback: Callable) -> WebSocketClient:
+    def get_websocket_client(
+        self,
+        port: int,
+        callback: Callable,
+        client_class: Type[WebSocketClient] = WebSocketClient,
+        **kwargs,
+    ) -> WebSocketClient:
         """Constructs and returns a WebSocketClient object.
 
         This will create a connection based on the feed ID.
@@ -274,6 +312,10 @@ class Feed:
                                  received from the WebSocket connection; The callback
                                  function should accept a single argument, which is the
                                  received message.
+            client_class (Type[WebSocketClient], optional): The WebSocket client
+                implementation to use (see WEBSOCKET_ENGINES)
+            **kwargs: Other arguments of the client (i.e., the open timeout and the
+                reconnect settings)
 
         Returns:
             WebSocketClient: The initialized WebSocketClient object.
@@ -289,6 +331,68 @@ class Feed:
         )
         url = f"{scheme}://{netloc}:{port}"
 
-        return WebSocketClient(
-            url, self.rest_client.headers[HEADER_API_KEY], self.get_id(), callback
+        return client_class(
+            url,
+            self.rest_client.headers[HEADER_API_KEY],
+            self.get_id(),
+            callback,
+            **kwargs,
         )
+
+
+def iter_pages(
+    rest_client: RestClient,
+    endpoint: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+) -> Iterator[List[dict]]:
+    """Iterate over the pages of results of a REST API listing.
+
+    Pages are requested with the limit/offset query parameters until a short page is
+    received. Servers that ignore the parameters are detected (the same results are
+    returned again, or more than requested) and end the iteration.
+
+    Args:
+        rest_client (RestClient): The client to communicate with the REST API
+        endpoint (str): The listing endpoint
+        page_size (int, optional): The number of results requested per page
+        prefetch (int, optional): The number of pages requested concurrently ahead of
+                                  the page being consumed
+
+    Yields:
+        List[dict]: The results of each page that were not seen in previous pages
+    """
+    if page_size < 1:
+        raise ValueError("The page size must be at least 1")
+
+    def fetch(page: int) -> List[dict]:
+        params = {PARAM_LIMIT: page_size, PARAM_OFFSET: page * page_size}
+        return rest_client.get(endpoint, params=params)["results"]
+
+    executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch > 0 else None
+    pending = deque()
+    next_page = 0
+    seen = set()
+    try:
+        while True:
+            if executor:
+                # Keep the following pages in flight while this one is consumed
+                while len(pending) <= prefetch:
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+                results = pending.popleft().result()
+            else:
+                results = fetch(next_page)
+                next_page += 1
+
+            new_results = [result for result in results if result["id"] not in seen]
+            seen.update(result["id"] for result in new_results)
+            if new_results:
+                yield new_results
+            if len(results) != page_size or not new_results:
+                return
+    finally:
+        if executor:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+import re
+from datetime import datetime, timezone, tzinfo
+from typing import Callable, Dict, Union
+
+# Third-party
+try:
+    # Optional, faster drop-in replacement for json.loads
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+# Parsers
+PARSER_JSON: str = "json"
+PARSER_TARGETED: str = "targeted"
+
+# Datastream IDs holding the tag position
+DATASTREAM_POS_X: str = "posX"
+DATASTREAM_POS_Y: str = "posY"
+
+# Matches the ID of each position datastream object
+DATASTREAM_ID_PATTERNS = {
+    "x": re.compile(r'"id"\s*:\s*"posX"'),
+    "y": re.compile(r'"id"\s*:\s*"posY"'),
+}
+# Captures the current value of a datastream object, quoted or not
+CURRENT_VALUE_PATTERN = re.compile(r'"current_value"\s*:\s*"?\s*([^"\s,}]+)')
+# Captures the timestamp of a datastream object (i.e., "2024-06-10 15:05:31.425717")
+AT_PATTERN = re.compile(r'"at"\s*:\s*"([^"]*)"')
+
+
+def parse_position_json(msg: Union[bytes, str]) -> Dict[str, float | str] | None:
+    """Parse the tag position decoding the whole SICK stream message.
+
+    orjson is used when it is installed, otherwise the standard library json module.
+
+    Args:
+        msg (bytes | str): The message received from the WebSocket
+
+    Returns:
+        dict | None: A dict with the x,y values (and the "at" timestamp of the position,
+                     if present) or None if the message has no position
+    """
+    datastreams = json_loads(msg)["body"]["datastreams"]
+    position = {}
+    for datastream in datastreams:
+        if (ds_id := datastream["id"]) == DATASTREAM_POS_X:
+            position["x"] = float(datastream["current_value"])
+            if "at" in datastream:
+                position["at"] = datastream["at"]
+        elif ds_id == DATASTREAM_POS_Y:
+            position["y"] = float(datastream["current_value"])
+    if "x" in position and "y" in position:
+        return position
+    return None
+
+
+def parse_position_targeted(msg: Union[bytes, str]) -> Dict[str, float | str] | None:
+    """Parse the tag position decoding only the two position datastreams.
+
+    The position datastream objects are located by their ID and only their current
+    values are converted; the rest of the message is never materialized. If a position
+    datastream has an unexpected layout, it falls back to parse_position_json().
+
+    Args:
+        msg (bytes | str): The message received from the WebSocket
+
+    Returns:
+        dict | None: A dict with the x,y values (and the "at" timestamp of the position,
+                     if present) or None if the message has no position
+    """
+    text = msg.decode() if isinstance(msg, bytes) else msg
+    position = {}
+    for axis, id_pattern in DATASTREAM_ID_PATTERNS.items():
+        if not (match := id_pattern.search(text)):
+            return None
+        # Only look for the value inside the datastream object holding the ID
+        start = text.rfind("{", 0, match.start())
+        end = text.find("}", match.end())
+        value = CURRENT_VALUE_PATTERN.search(text, start, end)
+        try:
+            position[axis] = float(value.group(1))
+        except (AttributeError, ValueError):
+            return parse_position_json(text)
+        if axis == "x" and (at := AT_PATTERN.search(text, start, end)):
+            position["at"] = at.group(1)
+    return position
+
+
+def parse_timestamp(value: str, tz: tzinfo = timezone.utc) -> float | None:
+    """Parse the timestamp of a SICK datastream value.
+
+    Args:
+        value (str): The "at" timestamp (i.e., "2024-06-10 15:05:31.425717")
+        tz (tzinfo, optional): The timezone of timestamps without an UTC offset
+
+    Returns:
+        float | None: The seconds since the epoch, or None if the timestamp is invalid
+    """
+    try:
+        timestamp = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=tz)
+    return timestamp.timestamp()
+
+
+# Available position parsers
+POSITION_PARSERS: Dict[
+    str, Callable[[Union[bytes, str]], Dict[str, float | str] | None]
+] = {
+    PARSER_JSON: parse_position_json,
+    PARSER_TARGETED: parse_position_targeted,
+}
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import gzip
+import struct
+import threading
+import time
+import zlib
+from typing import BinaryIO, Iterator, Tuple, Union
+
+# Every frame is stored as a header (receive time, payload length and whether the
+# frame was text) followed by the raw payload
+FRAME_HEADER = struct.Struct("<dI?")
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class StreamRecorder:
+    """Records raw SICK stream frames to an append-only file.
+
+    Frames are stored exactly as received, each with its receive time, in a compact
+    binary format. The file can optionally be gzip compressed; appending to an
+    existing compressed recording adds a new gzip member, which is still read back as
+    a single stream. Recordings are read with `read_recording` and can be served with
+    the ReplayServer.
+
+    Attributes:
+        path (str): The path of the recording
+        compress (bool): If the recording is gzip compressed
+        frames (int): The number of frames recorded
+    """
+
+    def __init__(self, path: str, compress: bool = False) -> None:
+        """StreamRecorder Constructor
+
+        The file is opened for appending right away.
+
+        Args:
+            path (str): The path of the recording
+            compress (bool, optional): If the recording is gzip compressed
+        """
+        self.path = path
+        self.compress = compress
+        self.frames = 0
+        self._file: BinaryIO = gzip.open(path, "ab") if compress else open(path, "ab")
+        self._lock = threading.Lock()
+
+    def record(self, msg: Union[bytes, str], ts: float | None = None) -> None:
+        """Append a frame to the recording.
+
+        Args:
+            msg (bytes | str): The frame received from the WebSocket
+            ts (float | None, optional): The receive time in seconds since the epoch;
+                                         defaults to now
+        """
+        is_text = isinstance(msg, str)
+        payload = msg.encode() if is_text else msg
+        header = FRAME_HEADER.pack(
+            time.time() if ts is None else ts, len(payload), is_text
+        )
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(header + payload)
+            self.frames += 1
+
+    def flush(self) -> None:
+        """Write the buffered frames to the file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the recording; later frames are ignored."""
+        with self._lock:
+            self._file.close()
+
+
+def read_recording(path: str) -> Iterator[Tuple[float, Union[bytes, str]]]:
+    """Read the frames of a recording, in the order they were recorded.
+
+    Compressed recordings are detected automatically. A frame truncated by an
+    interrupted recording ends the iteration, as does the missing end of a compressed
+    recording that was never closed.
+
+    Args:
+        path (str): The path of the recording
+
+    Returns:
+        Iterator[Tuple[float, bytes | str]]: The receive time and frame of each record
+    """
+    with open(path, "rb") as file:
+        compressed = file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    with gzip.open(path, "rb") if compressed else open(path, "rb") as file:
+        while len(header := _read(file, FRAME_HEADER.size)) == FRAME_HEADER.size:
+            ts, length, is_text = FRAME_HEADER.unpack(header)
+            payload = _read(file, length)
+            if len(payload) != length:
+                return
+            yield ts, payload.decode() if is_text else payload
+
+
+def _read(file: BinaryIO, size: int) -> bytes:
+    """Read from a recording, up to where it was interrupted.
+
+    Args:
+        file (BinaryIO): The recording file
+        size (int): The number of bytes to read
+
+    Returns:
+        bytes: The bytes read, fewer than `size` if the recording ends before
+    """
+    chunks = []
+    while size > 0:
+        try:
+            # Read in chunks, as a failed read drops everything it had decompressed
+            chunk = file.read1(size)
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            # A compressed recording without its end marker or cut short
+            break
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import asyncio
+import json
+import logging
+import threading
+from typing import Dict, Set
+
+# Third-party
+try:
+    from websockets.asyncio.server import serve
+    from websockets.exceptions import ConnectionClosed
+except ImportError:  # pragma: no cover
+    serve = None
+    ConnectionClosed = Exception
+
+# InOrbit
+from sick_tag_loc_connector.api.async_websocket import EventLoopThread
+from sick_tag_loc_connector.api.recorder import read_recording
+from sick_tag_loc_connector.api.stream import get_feed_id
+
+FEED_RESOURCE_PREFIX = "/feeds/"
+
+
+class ReplayServer:
+    """Serves a recorded SICK stream over a local WebSocket.
+
+    The server speaks the subscribe/unsubscribe protocol of the SICK RTLS streams:
+    every connected client receives the recorded frames of the feeds it subscribed
+    to (and frames that don't belong to any feed), with the recorded timing scaled by
+    `speed`. The replay starts with the first subscription, so all the clients share
+    the same timeline.
+
+    Attributes:
+        path (str): The path of the recording to replay
+        host (str): The host to listen on
+        speed (float): The replay speed (1 is real time, 0 is as fast as possible)
+        loop (bool): If the recording is replayed over and over
+        frames_sent (int): The number of frames sent to clients
+    """
+
+    def __init__(
+        self,
+        path: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        speed: float = 1.0,
+        loop: bool = False,
+        loop_thread: EventLoopThread | None = None,
+    ) -> None:
+        """ReplayServer Constructor
+
+        A call to start/stop should be made after initialization.
+
+        Args:
+            path (str): The path of the recording to replay
+            host (str, optional): The host to listen on
+            port (int, optional): The port to listen on (0 picks a free port)
+            speed (float, optional): The replay speed (1 is real time, 0 is as fast as
+                                     possible)
+            loop (bool, optional): If the recording is replayed over and over
+            loop_thread (EventLoopThread | None, optional): The event loop to run on;
+                                                            defaults to the shared loop
+
+        Raises:
+            ImportError: If the optional "websockets" package is not installed
+        """
+        if serve is None:
+            raise ImportError(
+                "The replay server requires the 'websockets' package; "
+                "install it with 'pip install sick-tag-loc-connector[asyncio]'"
+            )
+        if speed < 0:
+            raise ValueError("The replay speed must not be negative")
+
+        self.logger = logging.getLogger(name=self.__class__.__name__)
+        self.path = path
+        self.host = host
+        self.speed = speed
+        self.loop = loop
+        self.frames_sent = 0
+
+        self._port = port
+        self._loop_thread = loop_thread or EventLoopThread.shared()
+        self._clients: Dict[object, Set[str]] = {}
+        self._subscribed = None
+        self._server = None
+        self._replay_task = None
+        self._done = threading.Event()
+
+    @property
+    def port(self) -> int:
+        """The port the server listens on."""
+        return self._port
+
+    @property
+    def url(self) -> str:
+        """The WebSocket URL of the server."""
+        return f"ws://{self.host}:{self._port}"
+
+    def start(self) -> None:
+        """Start listening; the replay begins with the first subscription."""
+        self._loop_thread.run(self._start()).result()
+        self.logger.info(f"Replaying {self.path} on {self.url} at {self.speed}x")
+
+    def stop(self) -> None:
+        """Stop the replay and close all the connections."""
+        self._loop_thread.run(self._stop()).result()
+
+    def wait_done(self, timeout: float | None = None) -> bool:
+        """Wait for the replay to reach the end of the recording.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait (None waits forever)
+
+        Returns:
+            bool: If the replay finished
+        """
+        return self._done.wait(timeout)
+
+    async def _start(self) -> None:
+        """Start the server and the replay task."""
+        self._subscribed = asyncio.Event()
+        self._server = await serve(self._handle, self.host, self._port)
+        self._port = self._server.sockets[0].getsockname()[1]
+        self._replay_task = asyncio.get_running_loop().create_task(self._replay())
+
+    async def _stop(self) -> None:
+        """Cancel the replay task and close the server."""
+        if self._replay_task:
+            self._replay_task.cancel()
+            try:
+                await self._replay_task
+            except asyncio.CancelledError:
+                pass
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, ws) -> None:
+        """Track the subscriptions of a client until it disconnects.
+
+        Args:
+            ws: The client connection
+        """
+        subscriptions = self._clients[ws] = set()
+        try:
+            async for msg in ws:
+                try:
+                    request = json.loads(msg)
+                    resource = request["resource"]
+                    method = request["method"]
+                except (ValueError, KeyError, TypeError):
+                    self.logger.warning(f"Ignoring invalid request {msg!r}")
+                    continue
+                if not resource.startswith(FEED_RESOURCE_PREFIX):
+                    continue
+                feed_id = resource.removeprefix(FEED_RESOURCE_PREFIX)
+                if method == "subscribe":
+                    subscriptions.add(feed_id)
+                    self._subscribed.set()
+                elif method == "unsubscribe":
+                    subscriptions.discard(feed_id)
+        except ConnectionClosed:
+            pass
+        finally:
+            del self._clients[ws]
+
+    async def _replay(self) -> None:
+        """Send the recorded frames to the subscribed clients with their timing."""
+        await self._subscribed.wait()
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                start = loop.time()
+                first_ts = None
+                for ts, frame in read_recording(self.path):
+                    if first_ts is None:
+                        first_ts = ts
+                    if self.speed > 0:
+                        delay = (ts - first_ts) / self.speed - (loop.time() - start)
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    else:
+                        # Let the connections be served between frames
+                        await asyncio.sleep(0)
+                    await self._broadcast(frame)
+                if not self.loop:
+                    break
+        except Exception as e:
+            # Ends the replay rather than leaving the waiters blocked
+            self.logger.error(f"Replay of {self.path} failed: {e}")
+        self._done.set()
+
+    async def _broadcast(self, frame) -> None:
+        """Send a frame to every client subscribed to its feed.
+
+        Args:
+            frame (bytes | str): The recorded frame
+        """
+        feed_id = get_feed_id(frame)
+        for ws, subscriptions in list(self._clients.items()):
+            if feed_id is None or feed_id in subscriptions:
+                try:
+                    await ws.send(frame)
+                    self.frames_sent += 1
+                except ConnectionClosed:
+                    pass
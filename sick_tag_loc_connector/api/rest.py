@@ -5,13 +5,43 @@
 
 # Standard
 import json
+import time
 from enum import Enum
 
 # Third-party
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # InOrbit
 from sick_tag_loc_connector.api import HEADER_API_KEY
+from sick_tag_loc_connector.metrics import REGISTRY
+
+# Connection defaults
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+# Responses that are worth retrying
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Metrics
+REQUESTS = REGISTRY.counter(
+    "sick_rest_requests_total",
+    "SICK RTLS REST API responses by method and status code",
+    ["method", "status"],
+)
+REQUEST_ERRORS = REGISTRY.counter(
+    "sick_rest_request_errors_total",
+    "SICK RTLS REST API requests that got no response (connection errors, timeouts)",
+    ["method"],
+)
+REQUEST_DURATION = REGISTRY.histogram(
+    "sick_rest_request_duration_seconds",
+    "SICK RTLS REST API request duration, including retries",
+    ["method"],
+)
 
 
 class FeedTypes(Enum):
@@ -35,12 +65,27 @@ class RestClient:
 
     A helper class for making API requests using the RestClient.
 
+    Requests are sent through a pooled session, so connections to the server are kept
+    alive and reused. Every request has a timeout and idempotent requests are retried
+    with exponential backoff on connection errors and transient server errors.
+
     Attributes:
         url (str): The base URL of the API
         headers (dict): The headers to be included in every request
+        timeout (tuple): The (connect, read) timeouts in seconds
+        session (requests.Session): The session shared by all requests
     """
 
-    def __init__(self, url: str, api_key: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    ) -> None:
         """RestClient Constructor
 
         Initializes a new instance of the class.
@@ -48,27 +93,52 @@ class RestClient:
         Args:
             url (str): The URL to the API
             api_key (str): The API key for authentication
+            pool_size (int, optional): The maximum number of connections kept alive
+            connect_timeout (float, optional): Seconds to wait for a connection
+            read_timeout (float, optional): Seconds to wait for the server to respond
+            max_retries (int, optional): The maximum number of retries per request
+            backoff_factor (float, optional): The base delay in seconds between retries,
+                                              doubled on every attempt
         """
         self.url = url
         self.headers = {HEADER_API_KEY: api_key, "Content-Type": "application/json"}
+        self.timeout = (connect_timeout, read_timeout)
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close all the pooled connections."""
+        self.session.close()
 
-    def get(self, endpoint: str) -> dict:
+    def get(self, endpoint: str, params: dict | None = None) -> dict:
         """Helper Method for GET
 
         Sends a GET request to the specified endpoint.
 
         Args:
             endpoint (str): The endpoint to make the GET request to.
+            params (dict | None, optional): Query string parameters
 
         Returns:
             dict: The response in JSON format.
 
         Raises:
             requests.HTTPError: If the GET request returns a non-success status code.
+            requests.RequestException: If the server can't be reached or times out
         """
-        response = requests.get(f"{self.url}{endpoint}", headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", endpoint, params=params)
 
     def post(self, endpoint: str, data: dict) -> dict:
         """Helper Method for POST
@@ -84,12 +154,9 @@ class RestClient:
 
         Raises:
             requests.HTTPError: If the GET request returns a non-success status code
+            requests.RequestException: If the server can't be reached or times out
         """
-        response = requests.post(
-            f"{self.url}{endpoint}", headers=self.headers, data=json.dumps(data)
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._request("POST", endpoint, data=json.dumps(data))
 
     def put(self, endpoint: str, data: dict) -> dict:
         """Helper Method for PUT
@@ -105,12 +172,9 @@ class RestClient:
 
         Raises:
             requests.HTTPError: If the GET request returns a non-success status code
+            requests.RequestException: If the server can't be reached or times out
         """
-        response = requests.put(
-            f"{self.url}{endpoint}", headers=self.headers, data=json.dumps(data)
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._request("PUT", endpoint, data=json.dumps(data))
 
     def delete(self, endpoint: str) -> dict:
         """Helper Method for DELETE
@@ -125,7 +189,35 @@ class RestClient:
 
         Raises:
             requests.HTTPError: If the GET request returns a non-success status code
+            requests.RequestException: If the server can't be reached or times out
+        """
+        return self._request("DELETE", endpoint)
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Send a request through the session and report its metrics.
+
+        Args:
+            method (str): The HTTP method
+            endpoint (str): The endpoint the request is sent to
+            **kwargs: Additional arguments of the request (i.e., params or data)
+
+        Returns:
+            dict: The response content in JSON format
+
+        Raises:
+            requests.HTTPError: If the request returns a non-success status code
+            requests.RequestException: If the server can't be reached or times out
         """
-        response = requests.delete(f"{self.url}{endpoint}", headers=self.headers)
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method, f"{self.url}{endpoint}", timeout=self.timeout, **kwargs
+            )
+        except requests.RequestException:
+            REQUEST_ERRORS.labels(method).inc()
+            raise
+        finally:
+            REQUEST_DURATION.labels(method).observe(time.perf_counter() - start)
+        REQUESTS.labels(method, response.status_code).inc()
         response.raise_for_status()
         return response.json()
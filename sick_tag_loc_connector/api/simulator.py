@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import Dict, List, Set
+from urllib.parse import parse_qs, urlsplit
+
+# Third-party
+import numpy as np
+
+try:
+    from websockets.asyncio.server import serve
+    from websockets.exceptions import ConnectionClosed
+except ImportError:  # pragma: no cover
+    serve = None
+    ConnectionClosed = Exception
+
+# InOrbit
+from sick_tag_loc_connector.api import (
+    DEFAULT_PAGE_SIZE,
+    ENDPOINT_FEEDS,
+    ENDPOINT_TAGS,
+    HEADER_API_KEY,
+    PARAM_LIMIT,
+    PARAM_OFFSET,
+    REST_ENDPOINT,
+)
+from sick_tag_loc_connector.api.async_websocket import EventLoopThread
+from sick_tag_loc_connector.api.replay import FEED_RESOURCE_PREFIX
+from sick_tag_loc_connector.api.rest import FeedTypes
+
+# Simulation defaults
+DEFAULT_NUM_TAGS = 1000
+DEFAULT_UPDATE_RATE = 10.0
+DEFAULT_SPEED = 1.0
+DEFAULT_AREA = (50.0, 50.0)
+# Timestamp format of the datastream values
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+# The first tag title, every tag gets the following one (i.e., "0x240463870001")
+FIRST_TAG_ADDRESS = 0x240463870000
+
+# A stream update with the same layout as the ones sent by SICK RTLS
+_DATASTREAM = (
+    '{{{{"id":"{name}","current_value":"{{{name}:7.2f}}","at":"{{at}}","unit":"m",'
+    '"datastream_type":"position","tags":[]}}}}'
+)
+MESSAGE_TEMPLATE = (
+    '{{"body":{{"id":"{id}","resource_type":"feed","title":"{title}","type":"tag",'
+    '"datastreams":['
+    + ",".join(_DATASTREAM.format(name=name) for name in ("posX", "posY", "posZ"))
+    + '],"location":{{"x":0,"y":0,"ele":0}}}},"resource":"/feeds/{id}"}}'
+)
+
+
+class RtlsSimulator:
+    """A local stand-in for a SICK RTLS server with thousands of moving tags.
+
+    The simulator serves the REST API tag and feed listings and the WebSocket stream
+    subscribe/unsubscribe protocol on a single port, like the real server. Tags move
+    in straight lines at a constant speed, bouncing off the edges of the area, and
+    every subscribed tag sends its position `update_rate` times per second.
+
+    The positions of all the tags are advanced at once with vectorized operations, so
+    the simulator can keep up with fleets much larger than the connector under test.
+
+    Attributes:
+        num_tags (int): The number of simulated tags
+        update_rate (float): The number of position updates per second of each tag
+        speed (float): The speed of the tags in meters per second
+        area (tuple): The width and height of the area the tags move in, in meters
+        host (str): The host to listen on
+        api_key (str | None): The API key required by the REST API, if any
+        tags (List[dict]): The tags, as returned by the REST API
+        messages_sent (int): The number of stream updates sent to clients
+        ticks (int): The number of simulation steps run
+        late_ticks (int): The number of steps that started late because the previous
+                          one took longer than the update period
+    """
+
+    def __init__(
+        self,
+        num_tags: int = DEFAULT_NUM_TAGS,
+        update_rate: float = DEFAULT_UPDATE_RATE,
+        speed: float = DEFAULT_SPEED,
+        area: tuple = DEFAULT_AREA,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        api_key: str | None = None,
+        seed: int | None = None,
+        loop_thread: EventLoopThread | None = None,
+    ) -> None:
+        """RtlsSimulator Constructor
+
+        A call to start/stop should be made after initialization.
+
+        Args:
+            num_tags (int, optional): The number of simulated tags
+            update_rate (float, optional): The number of position updates per second
+                                           of each tag
+            speed (float, optional): The speed of the tags in meters per second
+            area (tuple, optional): The width and height of the area the tags move
+                                    in, in meters
+            host (str, optional): The host to listen on
+            port (int, optional): The port to listen on (0 picks a free port)
+            api_key (str | None, optional): The API key required by the REST API; any
+                                            key is accepted if None
+            seed (int | None, optional): The seed of the initial tag positions and
+                                         directions
+            loop_thread (EventLoopThread | None, optional): The event loop to run on;
+                                                            defaults to the shared loop
+
+        Raises:
+            ImportError: If the optional "websockets" package is not installed
+            ValueError: If the number of tags or the update rate are not positive
+        """
+        if serve is None:
+            raise ImportError(
+                "The RTLS simulator requires the 'websockets' package; "
+                "install it with 'pip install sick-tag-loc-connector[asyncio]'"
+            )
+        if num_tags < 1:
+            raise ValueError("The number of tags must be at least 1")
+        if update_rate <= 0:
+            raise ValueError("The update rate must be positive")
+
+        self.logger = logging.getLogger(name=self.__class__.__name__)
+        self.num_tags = num_tags
+        self.update_rate = update_rate
+        self.speed = speed
+        self.area = area
+        self.host = host
+        self.api_key = api_key
+        self.messages_sent = 0
+        self.ticks = 0
+        self.late_ticks = 0
+
+        self.tags: List[dict] = [
+            {
+                "id": str(i + 1),
+                "type": FeedTypes.TAG.value,
+                "title": f"0x{FIRST_TAG_ADDRESS + i:012X}",
+                "alias": f"Simulated tag {i + 1}",
+                "private": "0",
+            }
+            for i in range(num_tags)
+        ]
+        self._index = {tag["id"]: i for i, tag in enumerate(self.tags)}
+
+        rng = np.random.default_rng(seed)
+        self._size = np.asarray(area, dtype=float)
+        self._positions = rng.uniform(0, 1, (num_tags, 2)) * self._size
+        angles = rng.uniform(-np.pi, np.pi, num_tags)
+        self._velocities = speed * np.column_stack([np.cos(angles), np.sin(angles)])
+
+        self._port = port
+        self._loop_thread = loop_thread or EventLoopThread.shared()
+        self._clients: Dict[object, Set[int]] = {}
+        self._server = None
+        self._task = None
+
+    @property
+    def port(self) -> int:
+        """The port the server listens on."""
+        return self._port
+
+    @property
+    def url(self) -> str:
+        """The WebSocket URL of the server."""
+        return f"ws://{self.host}:{self._port}"
+
+    @property
+    def rest_url(self) -> str:
+        """The REST API URL of the server."""
+        return f"http://{self.host}:{self._port}{REST_ENDPOINT}"
+
+    def start(self) -> None:
+        """Start serving and moving the tags."""
+        self._loop_thread.run(self._start()).result()
+        self.logger.info(
+            f"Simulating {self.num_tags} tags at {self.update_rate} Hz on {self.url}"
+        )
+
+    def stop(self) -> None:
+        """Stop the simulation and close all the connections."""
+        self._loop_thread.run(self._stop()).result()
+
+    def positions(self) -> np.ndarray:
+        """Get the current position of every tag.
+
+        Returns:
+            np.ndarray: A (num_tags, 2) array with the SICK X and Y coordinates
+        """
+        return self._positions.copy()
+
+    def step(self, dt: float) -> None:
+        """Move the tags, bouncing them off the edges of the area.
+
+        Args:
+            dt (float): The elapsed time in seconds
+        """
+        positions = self._positions + self._velocities * dt
+        # Reflect the positions (and directions) that went past an edge
+        below, above = positions < 0, positions > self._size
+        positions[below] = -positions[below]
+        positions[above] = (2 * self._size - positions)[above]
+        self._velocities[below | above] *= -1
+        self._positions = np.clip(positions, 0, self._size)
+
+    def build_message(self, index: int, at: str) -> str:
+        """Build the stream update of a tag at its current position.
+
+        Args:
+            index (int): The index of the tag
+            at (str): The timestamp of the update
+
+        Returns:
+            str: The serialized stream update
+        """
+        tag = self.tags[index]
+        x, y = self._positions[index]
+        return MESSAGE_TEMPLATE.format(
+            id=tag["id"], title=tag["title"], posX=x, posY=y, posZ=1.2, at=at
+        )
+
+    async def _start(self) -> None:
+        """Start the server and the simulation task."""
+        self._server = await serve(
+            self._handle, self.host, self._port, process_request=self._process_request
+        )
+        self._port = self._server.sockets[0].getsockname()[1]
+        self._task = asyncio.get_running_loop().create_task(self._simulate())
+
+    async def _stop(self) -> None:
+        """Cancel the simulation task and close the server."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def _process_request(self, connection, request):
+        """Answer the REST API requests; WebSocket handshakes go through.
+
+        Args:
+            connection: The client connection
+            request: The HTTP request
+
+        Returns:
+            The HTTP response, or None to continue with the WebSocket handshake
+        """
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return None
+        if self.api_key and request.headers.get(HEADER_API_KEY) != self.api_key:
+            return self._respond(connection, HTTPStatus.UNAUTHORIZED, {})
+
+        url = urlsplit(request.path)
+        resource = url.path.removeprefix(REST_ENDPOINT).strip("/").split("/")
+        if len(resource) > 2 or resource[0] not in (ENDPOINT_TAGS, ENDPOINT_FEEDS):
+            return self._respond(connection, HTTPStatus.NOT_FOUND, {})
+        if len(resource) == 2:
+            if (index := self._index.get(resource[1])) is None:
+                return self._respond(connection, HTTPStatus.NOT_FOUND, {})
+            return self._respond(connection, HTTPStatus.OK, self.tags[index])
+
+        query = parse_qs(url.query)
+        try:
+            limit = int(query.get(PARAM_LIMIT, [DEFAULT_PAGE_SIZE])[0])
+            offset = int(query.get(PARAM_OFFSET, [0])[0])
+        except ValueError:
+            return self._respond(connection, HTTPStatus.BAD_REQUEST, {})
+        end = offset + limit
+        return self._respond(
+            connection, HTTPStatus.OK, {"results": self.tags[offset:end]}
+        )
+
+    @staticmethod
+    def _respond(connection, status: HTTPStatus, body: dict):
+        """Build a JSON response.
+
+        Args:
+            connection: The client connection
+            status (HTTPStatus): The response status
+            body (dict): The response content
+
+        Returns:
+            The HTTP response
+        """
+        response = connection.respond(status, json.dumps(body))
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+    async def _handle(self, ws) -> None:
+        """Track the subscriptions of a client until it disconnects.
+
+        Args:
+            ws: The client connection
+        """
+        subscriptions = self._clients[ws] = set()
+        try:
+            async for msg in ws:
+                try:
+                    request = json.loads(msg)
+                    resource = request["resource"]
+                    method = request["method"]
+                except (ValueError, KeyError, TypeError):
+                    self.logger.warning(f"Ignoring invalid request {msg!r}")
+                    continue
+                feed_id = resource.removeprefix(FEED_RESOURCE_PREFIX)
+                if (index := self._index.get(feed_id)) is None:
+                    continue
+                if method == "subscribe":
+                    subscriptions.add(index)
+                elif method == "unsubscribe":
+                    subscriptions.discard(index)
+        except ConnectionClosed:
+            pass
+        finally:
+            del self._clients[ws]
+
+    async def _simulate(self) -> None:
+        """Move the tags and send their positions at the update rate."""
+        loop = asyncio.get_running_loop()
+        period = 1 / self.update_rate
+        next_tick = loop.time()
+        while True:
+            self.step(period)
+            self.ticks += 1
+            at = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+            messages = {}
+            for ws, subscriptions in list(self._clients.items()):
+                for index in list(subscriptions):
+                    if index not in messages:
+                        messages[index] = self.build_message(index, at)
+                    try:
+                        await ws.send(messages[index])
+                        self.messages_sent += 1
+                    except ConnectionClosed:
+                        break
+
+            next_tick += period
+            if (delay := next_tick - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Don't try to catch up, it would only make the bursts larger
+                self.late_ticks += 1
+                next_tick = loop.time()
+                await asyncio.sleep(0)
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+import logging
+import re
+import threading
+from typing import Callable, Dict, List, Union
+
+# InOrbit
+from sick_tag_loc_connector.api.recorder import StreamRecorder
+from sick_tag_loc_connector.api.websocket import (
+    DEFAULT_OPEN_TIMEOUT,
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+    DEFAULT_RECONNECT_BACKOFF,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    WebSocketClient,
+)
+from sick_tag_loc_connector.metrics import REGISTRY
+
+# Matches the feed resource SICK adds to every stream update (i.e., "/feeds/12")
+FEED_RESOURCE_PATTERN = re.compile(r'"resource"\s*:\s*"/feeds/([^"]+)"')
+
+# Metrics
+MESSAGES_DROPPED = REGISTRY.counter(
+    "sick_stream_messages_dropped_total",
+    "Stream messages dropped because their feed is not subscribed",
+)
+SUBSCRIPTIONS = REGISTRY.gauge(
+    "sick_stream_subscriptions", "Feeds subscribed through the shared connections"
+)
+CONNECTIONS = REGISTRY.gauge(
+    "sick_stream_connections", "WebSocket connections of the shared pool"
+)
+
+
+class StreamManager:
+    """Shared SICK stream connections for many feeds.
+
+    Instead of opening one WebSocket connection (and thread) per feed, the
+    StreamManager holds a small pool of connections to the SICK RTLS server, sends one
+    subscription per feed over them and dispatches incoming messages to the callback
+    registered for the feed they belong to. Lost connections are reopened by the
+    clients themselves, which subscribe again to their feeds.
+
+    Attributes:
+        url (str): The WebSocket server URL to connect to
+        api_key (str): The API Key to authenticate to the WebSocket
+        pool_size (int): The maximum number of WebSocket connections to open
+        open_timeout (float | None): Seconds to wait for each connection to open
+        recorder (StreamRecorder | None): Records every received message, if set
+        reconnect (bool): If lost connections are reopened
+        reconnect_backoff (float): The upper bound in seconds of the first reconnect
+                                   delay, doubled on every failed attempt
+        reconnect_max_delay (float): The upper bound in seconds of the reconnect delay
+        ping_interval (float): Seconds between keepalive pings (0 disables them)
+        ping_timeout (float): Seconds to wait for the pong of a keepalive ping before
+                              dropping the connection
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        pool_size: int = 1,
+        client_factory: Callable[..., WebSocketClient] = WebSocketClient,
+        open_timeout: float | None = DEFAULT_OPEN_TIMEOUT,
+        recorder: StreamRecorder | None = None,
+        reconnect: bool = True,
+        reconnect_backoff: float = DEFAULT_RECONNECT_BACKOFF,
+        reconnect_max_delay: float = DEFAULT_RECONNECT_MAX_DELAY,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        ping_timeout: float = DEFAULT_PING_TIMEOUT,
+    ) -> None:
+        """StreamManager Constructor
+
+        Connections are created lazily, the first time a feed is subscribed to them.
+
+        Args:
+            url (str): The WebSocket server URL to connect to
+            api_key (str): The API Key to authenticate to the WebSocket
+            pool_size (int, optional): The maximum number of WebSocket connections
+            client_factory (Callable, optional): Builds the pooled connections; it is
+                called with the same arguments as the WebSocketClient constructor
+            open_timeout (float | None, optional): Seconds to wait for each connection
+                                                   to open (None waits forever)
+            recorder (StreamRecorder | None, optional): Records every received
+                                                        message
+            reconnect (bool, optional): If lost connections are reopened
+            reconnect_backoff (float, optional): The upper bound in seconds of the
+                                                 first reconnect delay
+            reconnect_max_delay (float, optional): The upper bound in seconds of the
+                                                   reconnect delay
+            ping_interval (float, optional): Seconds between keepalive pings (0
+                                             disables them)
+            ping_timeout (float, optional): Seconds to wait for the pong of a
+                                            keepalive ping
+        """
+        if pool_size < 1:
+            raise ValueError("The pool size must be at least 1")
+
+        self.logger = logging.getLogger(name=self.__class__.__name__)
+        self.url = url
+        self.api_key = api_key
+        self.pool_size = pool_size
+        self.open_timeout = open_timeout
+        self.recorder = recorder
+        self.reconnect = reconnect
+        self.reconnect_backoff = reconnect_backoff
+        self.reconnect_max_delay = reconnect_max_delay
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+
+        self._client_factory = client_factory
+        self._clients: List[WebSocketClient] = []
+        self._callbacks: Dict[str, Callable] = {}
+        self._assignments: Dict[str, WebSocketClient] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, feed_id: str, callback: Callable) -> None:
+        """Subscribe to updates for a feed.
+
+        The feed is assigned to the pooled connection with the fewest subscriptions,
+        opening a new connection while the pool is not full.
+
+        Args:
+            feed_id (str): The SICK feed ID to subscribe to
+            callback (Callable): The callback function to call whenever a message for
+                                 this feed is received; it should accept a single
+                                 argument, which is the received message.
+
+        Raises:
+            TimeoutError: If a new connection is not open within the open timeout
+        """
+        with self._lock:
+            if feed_id in self._assignments:
+                self.logger.warning(f"Feed {feed_id} is already subscribed")
+                self._callbacks[feed_id] = callback
+                return
+            client = self._select_client()
+            # Register the callback first so no early message is dropped, and the
+            # assignment so concurrent subscriptions are balanced
+            self._callbacks[feed_id] = callback
+            self._assignments[feed_id] = client
+            self._update_gauges()
+        # Opening the connection may take up to the open timeout, so it is not done
+        # with the lock held, which would hold back every other subscription
+        try:
+            client.subscribe(feed_id)
+        except Exception:
+            with self._lock:
+                if self._assignments.get(feed_id) is client:
+                    del self._assignments[feed_id]
+                    self._callbacks.pop(feed_id, None)
+                    self._update_gauges()
+            raise
+        with self._lock:
+            unsubscribed = self._assignments.get(feed_id) is not client
+        if unsubscribed:
+            # Unsubscribed while the subscription was being sent
+            client.unsubscribe(feed_id)
+
+    def unsubscribe(self, feed_id: str) -> None:
+        """Stop receiving updates for a feed.
+
+        Args:
+            feed_id (str): The SICK feed ID to unsubscribe from
+        """
+        with self._lock:
+            self._callbacks.pop(feed_id, None)
+            if client := self._assignments.pop(feed_id, None):
+                client.unsubscribe(feed_id)
+            self._update_gauges()
+
+    def close(self) -> None:
+        """Close all the pooled connections and drop every subscription."""
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+            self._callbacks.clear()
+            self._assignments.clear()
+            self._update_gauges()
+
+    def subscriptions(self) -> int:
+        """Get the number of subscribed feeds.
+
+        Returns:
+            int: The number of feeds currently subscribed
+        """
+        return len(self._assignments)
+
+    def connections(self) -> int:
+        """Get the number of pooled connections.
+
+        Returns:
+            int: The number of WebSocket connections created by this manager
+        """
+        return len(self._clients)
+
+    def open_connections(self) -> int:
+        """Get the number of pooled connections currently open.
+
+        Returns:
+            int: The number of WebSocket connections of this manager that are open
+        """
+        return sum(client.connected() for client in list(self._clients))
+
+    def _update_gauges(self) -> None:
+        """Report the subscriptions and connections; must be called with the lock."""
+        SUBSCRIPTIONS.set(len(self._assignments))
+        CONNECTIONS.set(len(self._clients))
+
+    def _select_client(self) -> WebSocketClient:
+        """Select the connection a new feed will be assigned to.
+
+        Must be called with the lock held.
+
+        Returns:
+            WebSocketClient: The least loaded connection of the pool
+        """
+        if len(self._clients) < self.pool_size:
+            client = self._client_factory(
+                self.url,
+                self.api_key,
+                None,
+                self._dispatch,
+                self.open_timeout,
+                reconnect=self.reconnect,
+                reconnect_backoff=self.reconnect_backoff,
+                reconnect_max_delay=self.reconnect_max_delay,
+                ping_interval=self.ping_interval,
+                ping_timeout=self.ping_timeout,
+                name=f"shared-{len(self._clients)}",
+            )
+            self._clients.append(client)
+            return client
+
+        load = {id(client): 0 for client in self._clients}
+        for client in self._assignments.values():
+            load[id(client)] += 1
+        return min(self._clients, key=lambda c: load[id(c)])
+
+    def _dispatch(self, msg: Union[bytes, str]) -> None:
+        """Forward a message received by any pooled connection to its feed callback.
+
+        Args:
+            msg (bytes | str): The message received from the WebSocket
+        """
+        if self.recorder:
+            self.recorder.record(msg)
+        feed_id = get_feed_id(msg)
+        if callback := self._callbacks.get(feed_id):
+            callback(msg)
+        else:
+            MESSAGES_DROPPED.inc()
+            self.logger.debug(f"Dropping message for unsubscribed feed {feed_id}")
+
+
+def get_feed_id(msg: Union[bytes, str]) -> str | None:
+    """Get the ID of the feed a SICK stream message belongs to.
+
+    The feed resource is looked up without decoding the message, falling back to the
+    ID of the message body.
+
+    Args:
+        msg (bytes | str): The message received from the WebSocket
+
+    Returns:
+        str | None: The feed ID or None if the message does not belong to any feed
+    """
+    text = msg.decode() if isinstance(msg, bytes) else msg
+    if match := FEED_RESOURCE_PATTERN.search(text):
+        return match.group(1)
+    try:
+        body = json.loads(text).get("body")
+    except (ValueError, AttributeError):
+        return None
+    if isinstance(body, dict) and body.get("id") is not None:
+        return str(body["id"])
+    return None
@@ -4,11 +4,11 @@
 # Copyright 2024 InOrbit, Inc.
 
 # Standard
-from typing import Type, TypeVar, Set, Any
+from typing import Type, TypeVar, Set, Any, Iterator
 
 # InOrbit
-from sick_tag_loc_connector.api import RestClient, ENDPOINT_TAGS
-from sick_tag_loc_connector.api.feed import Feed
+from sick_tag_loc_connector.api import RestClient, ENDPOINT_TAGS, DEFAULT_PAGE_SIZE
+from sick_tag_loc_connector.api.feed import Feed, iter_pages
 from sick_tag_loc_connector.api.rest import FeedTypes
 
 # Type hint definition
@@ -110,22 +110,49 @@ class Tag(Feed):
         return cls(rest_client, **data)
 
     @staticmethod
-    def get_all(rest_client: RestClient) -> Set[T]:
+    def get_all(
+        rest_client: RestClient, page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = 0
+    ) -> Set[T]:
         """Get all the Tags from the system
 
         This static method will attempt to load all the tags from the SICK
-        Tag-LOC system via the REST API.
+        Tag-LOC system via the REST API. Prefer iter_all() for large systems.
 
         Args:
             rest_client (RestClient): The client to communicate with the REST API
+            page_size (int, optional): The number of tags requested per page
+            prefetch (int, optional): The number of pages requested concurrently ahead
+                                      of the page being consumed
 
         Returns:
             A set of Tag instances, representing the retrieved tags
         """
-        # TODO(elvio.aruta): add pagination to this get call
-        data = rest_client.get(f"/{ENDPOINT_TAGS}")
-        tag_set = {Tag(rest_client, **tag) for tag in data["results"]}
-        return tag_set
+        return set(Tag.iter_all(rest_client, page_size, prefetch))
+
+    @classmethod
+    def iter_all(
+        cls: Type[T],
+        rest_client: RestClient,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+    ) -> Iterator[T]:
+        """Iterate over all the Tags in the system.
+
+        Tags are requested page by page and yielded as each page arrives, so the whole
+        list is never held in memory.
+
+        Args:
+            rest_client (RestClient): The client to communicate with the REST API
+            page_size (int, optional): The number of tags requested per page
+            prefetch (int, optional): The number of pages requested concurrently ahead
+                                      of the page being consumed
+
+        Yields:
+            Instances of the Tag class, representing the retrieved tags
+        """
+        for page in iter_pages(rest_client, f"/{ENDPOINT_TAGS}", page_size, prefetch):
+            for tag in page:
+                yield cls(rest_client, **tag)
 
     @classmethod
     def create(cls: Type[T], rest_client: RestClient, tag_data: dict) -> T:
@@ -6,14 +6,83 @@
 # Standard
 import json
 import logging
+import random
 import threading
-from typing import Callable, Union
+import time
+from typing import Callable, Set, Union
 
 # Third-party
 import websocket
 
 # InOrbit
 from sick_tag_loc_connector.api import HEADER_API_KEY
+from sick_tag_loc_connector.metrics import REGISTRY
+
+# Seconds to wait for a connection to open
+DEFAULT_OPEN_TIMEOUT = 10.0
+# The delay before the first reconnect attempt is picked at random up to this many
+# seconds, doubling on every failed attempt up to the maximum delay
+DEFAULT_RECONNECT_BACKOFF = 0.5
+DEFAULT_RECONNECT_MAX_DELAY = 30.0
+# A ping is sent every interval and the connection is dropped as dead if its pong
+# doesn't arrive within the timeout
+DEFAULT_PING_INTERVAL = 10.0
+DEFAULT_PING_TIMEOUT = 5.0
+
+# Metrics (the message counter is resolved once, it is updated on every message)
+MESSAGES_RECEIVED = REGISTRY.counter(
+    "sick_websocket_messages_received_total",
+    "Messages received from the SICK RTLS streams",
+).labels()
+CONNECTIONS_OPENED = REGISTRY.counter(
+    "sick_websocket_connections_opened_total", "SICK RTLS stream connections opened"
+)
+CONNECTIONS_CLOSED = REGISTRY.counter(
+    "sick_websocket_connections_closed_total", "SICK RTLS stream connections closed"
+)
+ERRORS = REGISTRY.counter(
+    "sick_websocket_errors_total", "Errors of the SICK RTLS stream connections"
+)
+RECONNECTS = REGISTRY.counter(
+    "sick_websocket_reconnects_total",
+    "SICK RTLS stream connections reopened after being lost, by stream",
+    ["stream"],
+)
+DOWNTIME = REGISTRY.counter(
+    "sick_websocket_downtime_seconds_total",
+    "Seconds the SICK RTLS streams were down after losing their connection, by "
+    "stream",
+    ["stream"],
+)
+RTT = REGISTRY.summary(
+    "sick_websocket_rtt_seconds",
+    "Round-trip time of the keepalive pings of the SICK RTLS streams, by stream",
+    ["stream"],
+)
+PING_TIMEOUTS = REGISTRY.counter(
+    "sick_websocket_ping_timeouts_total",
+    "SICK RTLS stream connections dropped because a keepalive ping was not answered "
+    "in time, by stream",
+    ["stream"],
+)
+
+
+def backoff_delay(attempt: int, backoff: float, max_delay: float) -> float:
+    """Get the delay before a reconnect attempt, with exponential backoff and jitter.
+
+    The delay is picked at random between 0 and the backoff doubled on every attempt
+    (capped to the maximum delay), so many connections lost at the same time don't
+    reconnect at the same time.
+
+    Args:
+        attempt (int): The number of failed attempts since the connection was lost
+        backoff (float): The upper bound in seconds of the first delay
+        max_delay (float): The upper bound in seconds of any delay
+
+    Returns:
+        float: The delay in seconds
+    """
+    return random.uniform(0, min(max_delay, backoff * 2 ** min(attempt, 32)))
 
 
 class WebSocketClient:
@@ -21,9 +90,44 @@ class WebSocketClient:
 
     A helper class that handles connections to a WebSocket server, listens for messages,
     and executes a callback function upon receiving messages.
+
+    If the connection is lost, it is reopened with exponential backoff and jitter, and
+    every feed subscribed through it is subscribed again. Keepalive pings measure the
+    round-trip time of the connection and detect dead links (i.e., half-open TCP
+    connections) long before the operating system does, so a quiet stream can be told
+    apart from a dead one.
+
+    Attributes:
+        url (str): The WebSocket server URL to connect to
+        feed_id (str | None): The SICK feed ID for this WebSocket client
+        name (str): The name of the stream in the metrics
+        open_timeout (float | None): Seconds to wait for the connection to open
+        reconnect (bool): If the connection is reopened when it is lost
+        reconnect_backoff (float): The upper bound in seconds of the first reconnect
+                                   delay, doubled on every failed attempt
+        reconnect_max_delay (float): The upper bound in seconds of the reconnect delay
+        reconnects (int): The number of times the connection was reopened
+        ping_interval (float): Seconds between keepalive pings (0 disables them)
+        ping_timeout (float): Seconds to wait for the pong of a keepalive ping before
+                              dropping the connection
+        rtt (float | None): The round-trip time in seconds of the last keepalive ping
+        ping_timeouts (int): The number of connections dropped for a late pong
     """
 
-    def __init__(self, url: str, api_key: str, feed_id: str, on_message_cb: Callable):
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        feed_id: str | None,
+        on_message_cb: Callable,
+        open_timeout: float | None = DEFAULT_OPEN_TIMEOUT,
+        reconnect: bool = True,
+        reconnect_backoff: float = DEFAULT_RECONNECT_BACKOFF,
+        reconnect_max_delay: float = DEFAULT_RECONNECT_MAX_DELAY,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        ping_timeout: float = DEFAULT_PING_TIMEOUT,
+        name: str | None = None,
+    ):
         """WebSocketClient Constructor
 
         Initializes the WebSocketClient.
@@ -31,8 +135,23 @@ class WebSocketClient:
         Args:
             url (str): The WebSocket server URL to connect to
             api_key (str): The API Key to authenticate to the WebSocket
-            feed_id (str): The SICK feed ID for this WebSocket client
+            feed_id (str | None): The SICK feed ID for this WebSocket client; can be
+                                  None for connections shared by several feeds
             on_message_cb (Callable): Callback to execute when a message is received
+            open_timeout (float | None, optional): Seconds to wait for the connection
+                                                   to open (None waits forever)
+            reconnect (bool, optional): If the connection is reopened when it is lost
+            reconnect_backoff (float, optional): The upper bound in seconds of the
+                                                 first reconnect delay
+            reconnect_max_delay (float, optional): The upper bound in seconds of the
+                                                   reconnect delay
+            ping_interval (float, optional): Seconds between keepalive pings (0
+                                             disables them)
+            ping_timeout (float, optional): Seconds to wait for the pong of a
+                                            keepalive ping; must be shorter than the
+                                            ping interval
+            name (str | None, optional): The name of the stream in the metrics;
+                                         defaults to the feed ID or the URL
         """
         self.logger = logging.getLogger(name=self.__class__.__name__)
         self.url = url
@@ -40,9 +159,34 @@ class WebSocketClient:
 
         self.ws = None
         self.feed_id = feed_id
+        self.name = name or feed_id or url
+        self.open_timeout = open_timeout
+        self.reconnect = reconnect
+        self.reconnect_backoff = reconnect_backoff
+        self.reconnect_max_delay = reconnect_max_delay
+        self.reconnects = 0
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.rtt: float | None = None
+        self.ping_timeouts = 0
         self._on_message_cb = on_message_cb
         self._thread = None
         self.__connection_open = threading.Event()
+        # Set by close(), so a closed connection is not reopened
+        self._closing = threading.Event()
+        # Held while the connection is opened on subscription, so it is opened once
+        self._open_lock = threading.Lock()
+        # The feeds subscribed through this connection, subscribed again on reconnect
+        self._feeds: Set[str] = set()
+        # When the connection was lost, while it is down
+        self._down_since: float | None = None
+        self._downtime = 0.0
+        # Reconnect attempts since the connection was lost
+        self._attempts = 0
+        self._reconnects = RECONNECTS.labels(self.name)
+        self._rtt = RTT.labels(self.name)
+        self._ping_timeouts = PING_TIMEOUTS.labels(self.name)
+        self._export_downtime()
 
     def on_error(self, error: str) -> None:
         """Error Callback
@@ -53,6 +197,7 @@ class WebSocketClient:
         Args:
             error (str): The error message
         """
+        ERRORS.inc()
         self.logger.error(f"error: {error}")
 
     def on_close(self, code: int, msg: str) -> None:
@@ -64,16 +209,67 @@ class WebSocketClient:
             code (int): Connection disconnect code
             msg (str): The disconnect message
         """
+        CONNECTIONS_CLOSED.inc()
         self.logger.info(f"Connection closed for {self.url} -> {code}:'{msg}'")
+        was_open = self.__connection_open.is_set()
         self.__connection_open.clear()
+        if was_open and not self._closing.is_set() and self._down_since is None:
+            self._down_since = time.monotonic()
+
+    def on_reconnect(self) -> None:
+        """Reconnect Callback
+
+        Callback function to handle the reopening of a lost connection. It subscribes
+        again to every feed subscribed through the connection.
+        """
+        self._downtime += time.monotonic() - self._down_since
+        self._down_since = None
+        self._attempts = 0
+        self.reconnects += 1
+        self._reconnects.inc()
+        self.logger.info(
+            f"Connection reopened for {self.url}, subscribing again to "
+            f"{len(self._feeds)} feeds"
+        )
+        for feed_id in list(self._feeds):
+            self.send(self._build_message("subscribe", feed_id))
 
     def on_open(self) -> None:
         """Open Callback
 
         Callback function to handle the opening of the WebSocket connection.
         """
+        CONNECTIONS_OPENED.inc()
+        # Exported again if the connection is reopened after being closed
+        self._export_downtime()
         self.logger.info(f"Connection opened for {self.url}")
         self.__connection_open.set()
+        if self._down_since is not None:
+            self.on_reconnect()
+
+    def on_pong(self, rtt: float) -> None:
+        """Pong Callback
+
+        Callback function to handle the pong of a keepalive ping.
+
+        Args:
+            rtt (float): The round-trip time of the ping in seconds
+        """
+        self.rtt = rtt
+        self._rtt.observe(rtt)
+
+    def on_ping_timeout(self) -> None:
+        """Ping Timeout Callback
+
+        Callback function to handle a keepalive ping not answered in time. The
+        connection is dropped right after, and reopened if reconnecting is enabled.
+        """
+        self.ping_timeouts += 1
+        self._ping_timeouts.inc()
+        self.logger.warning(
+            f"No pong from {self.url} within {self.ping_timeout}s, dropping the "
+            f"connection"
+        )
 
     def on_message(self, msg: str) -> None:
         """
@@ -82,6 +278,7 @@ class WebSocketClient:
         Args:
             msg (str): Message received from the web socket connection.
         """
+        MESSAGES_RECEIVED.inc()
         if self._on_message_cb:
             self._on_message_cb(msg)
         else:
@@ -104,29 +301,134 @@ class WebSocketClient:
         """Main connection method.
 
         Establish the WebSocket connection and start listening for messages.
+
+        Raises:
+            TimeoutError: If the connection is not open within the open timeout
         """
+        self._closing.clear()
         self.ws = websocket.WebSocketApp(
             self.url,
             on_message=lambda ws, msg: self.on_message(msg),
-            on_error=lambda ws, err: self.on_error(err),
+            on_error=self._on_app_error,
             on_close=lambda ws, code, msg: self.on_close(code, msg),
-            on_open=lambda ws: self.on_open(),
+            on_open=self._on_app_open,
+            on_pong=self._on_app_pong,
         )
-        self._thread = threading.Thread(target=self.ws.run_forever)
+        self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
         # Wait until connection is open
-        # TODO(russell): This needs a timeout
-        self.__connection_open.wait()
+        if not self.__connection_open.wait(self.open_timeout):
+            # The listening thread ends on its own once the connection attempt fails
+            self._closing.set()
+            self.ws.close()
+            raise TimeoutError(f"Timed out opening connection to {self.url}")
 
     def close(self) -> None:
         """Main disconnection method.
 
-        Close the WebSocket connection and stop the listening thread.
+        Close the WebSocket connection and stop the listening thread, including any
+        reconnect in progress.
         """
+        self._closing.set()
         if self.ws:
             self.ws.close()
         if self._thread:
             self._thread.join()
+        self._end_downtime()
+
+    def reconnecting(self) -> bool:
+        """Check if the connection was lost and is being reopened.
+
+        Returns:
+            bool: If the connection is down and will be reopened
+        """
+        return self._down_since is not None
+
+    def get_downtime(self) -> float:
+        """Get how long the connection was down after being lost.
+
+        Returns:
+            float: The total seconds without connection, including the current outage
+        """
+        if (down_since := self._down_since) is None:
+            return self._downtime
+        return self._downtime + time.monotonic() - down_since
+
+    def _export_downtime(self) -> None:
+        """Export the downtime of the connection, read on every scrape."""
+        DOWNTIME.labels(self.name).set_function(self.get_downtime)
+
+    def _end_downtime(self) -> None:
+        """Stop counting the current outage, if any, once the client is closed.
+
+        The downtime is no longer exported either, so the registry doesn't keep the
+        closed client alive.
+        """
+        if (down_since := self._down_since) is not None:
+            self._downtime += time.monotonic() - down_since
+            self._down_since = None
+        DOWNTIME.remove(self.name)
+
+    def _next_reconnect_delay(self) -> float:
+        """Get the delay before the next reconnect attempt.
+
+        Returns:
+            float: The delay in seconds
+        """
+        delay = backoff_delay(
+            self._attempts, self.reconnect_backoff, self.reconnect_max_delay
+        )
+        self._attempts += 1
+        self.logger.info(f"Reconnecting to {self.url} in {delay:.2f}s")
+        return delay
+
+    def _on_app_open(self, ws: websocket.WebSocketApp) -> None:
+        """Handle a connection opened by the listening thread.
+
+        Args:
+            ws (websocket.WebSocketApp): The opened connection
+        """
+        if self._closing.is_set():
+            # Closed while reconnecting
+            ws.close()
+        else:
+            self.on_open()
+
+    def _on_app_error(self, ws: websocket.WebSocketApp, error: Exception) -> None:
+        """Handle an error of the listening thread.
+
+        Args:
+            ws (websocket.WebSocketApp): The connection
+            error (Exception): The error
+        """
+        if isinstance(error, websocket.WebSocketTimeoutException) and self.connected():
+            # Raised by the keepalive when a pong is late
+            self.on_ping_timeout()
+        self.on_error(str(error))
+
+    def _on_app_pong(self, ws: websocket.WebSocketApp, data: bytes) -> None:
+        """Handle a pong received by the listening thread.
+
+        Args:
+            ws (websocket.WebSocketApp): The connection
+            data (bytes): The pong payload
+        """
+        if ws.last_ping_tm and ws.last_pong_tm >= ws.last_ping_tm:
+            self.on_pong(ws.last_pong_tm - ws.last_ping_tm)
+
+    def _run(self) -> None:
+        """Listen for messages, reconnecting until the client is closed."""
+        while True:
+            # The ping timeout also bounds how long the listening thread takes to
+            # notice the connection was closed
+            self.ws.run_forever(
+                ping_interval=self.ping_interval, ping_timeout=self.ping_timeout
+            )
+            # If the connection never opened, open() gives up on its own
+            if self._closing.is_set() or not self.reconnect or not self.reconnecting():
+                return
+            if self._closing.wait(self._next_reconnect_delay()):
+                return
 
     def connected(self) -> bool:
         """Connection Check
@@ -138,16 +440,50 @@ class WebSocketClient:
         """
         return self.__connection_open.is_set()
 
-    def subscribe(self) -> None:
-        """Subscribe to updates for the specific feed associated with this client.
+    def subscribe(self, feed_id: str | None = None) -> None:
+        """Subscribe to updates for a feed.
 
         This method constructs a subscription message and sends it via the WebSocket
-        connection.
+        connection. If no feed ID is given, the feed associated with this client is
+        used, which allows a single connection to be shared by several feeds.
+
+        While the connection is being reopened, the feed is subscribed once it is
+        open.
+
+        Args:
+            feed_id (str | None, optional): The feed to subscribe to
+        """
+        feed_id = feed_id or self.feed_id
+        with self._open_lock:
+            if not self.connected() and not self.reconnecting():
+                self.open()
+        self._feeds.add(feed_id)
+        if self.connected():
+            self.send(self._build_message("subscribe", feed_id))
+
+    def unsubscribe(self, feed_id: str | None = None) -> None:
+        """Unsubscribe from updates for a feed.
+
+        Args:
+            feed_id (str | None, optional): The feed to unsubscribe from; defaults to
+                                            the feed associated with this client
+        """
+        feed_id = feed_id or self.feed_id
+        self._feeds.discard(feed_id)
+        if self.connected():
+            self.send(self._build_message("unsubscribe", feed_id))
+
+    def _build_message(self, method: str, feed_id: str) -> str:
+        """Build a SICK stream request for a feed resource.
+
+        Args:
+            method (str): The stream method (i.e., "subscribe" or "unsubscribe")
+            feed_id (str): The feed ID used to build the resource path
+
+        Returns:
+            str: The serialized request
         """
-        if not self.connected():
-            self.open()
-        msg = (
+        return (
             f'{{"headers":{json.dumps(self.headers).replace(": ", ":")}, '
-            f'"method":"subscribe", "resource":"/feeds/{self.feed_id}"}}'
+            f'"method":"{method}", "resource":"/feeds/{feed_id}"}}'
         )
-        self.send(msg)
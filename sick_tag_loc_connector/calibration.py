@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+# Third-party
+import numpy as np
+
+CALIBRATION_RIGID = "rigid"
+CALIBRATION_SIMILARITY = "similarity"
+CALIBRATION_AFFINE = "affine"
+CALIBRATION_MODES = (CALIBRATION_RIGID, CALIBRATION_SIMILARITY, CALIBRATION_AFFINE)
+
+# The "Y" axis of the SICK coordinate system is reversed with respect to InOrbit's
+FLIP_Y = np.diag([1.0, -1.0])
+
+
+@dataclass
+class Calibration:
+    """A fitted transform from SICK to InOrbit coordinates.
+
+    Attributes:
+        matrix (List[List[float]]): The 2x3 affine matrix [[a, b, c], [d, e, f]] that
+            maps a SICK position (x, y) to (a*x + b*y + c, d*x + e*y + f) in InOrbit
+        residuals (List[float]): The distance in meters between each transformed
+            SICK point and its InOrbit counterpart
+        rotation (float): The rotation of the transform in radians
+        scale (float): The mean scale of the transform
+    """
+
+    matrix: List[List[float]]
+    residuals: List[float]
+    rotation: float
+    scale: float
+
+    @property
+    def rms(self) -> float:
+        """The root mean square of the residuals in meters."""
+        return float(np.sqrt(np.mean(np.square(self.residuals))))
+
+    @property
+    def max_residual(self) -> float:
+        """The largest residual in meters."""
+        return max(self.residuals)
+
+
+class FrameTransform:
+    """A SICK to InOrbit frame transform ready to be applied.
+
+    The coefficients of the matrix are unpacked once, so transforming a single
+    position costs a few multiply-adds, and many positions can be transformed at once
+    with vectorized operations.
+
+    Attributes:
+        matrix (np.ndarray): The 2x3 affine matrix
+    """
+
+    def __init__(self, matrix: Sequence[Sequence[float]]) -> None:
+        """FrameTransform Constructor
+
+        Args:
+            matrix (Sequence[Sequence[float]]): The 2x3 affine matrix
+        """
+        self.matrix = np.asarray(matrix, dtype=float).reshape(2, 3)
+        self._coefficients = tuple(self.matrix.ravel().tolist())
+
+    def apply(self, x: float, y: float) -> Tuple[float, float]:
+        """Transform a single position.
+
+        Args:
+            x (float): The SICK X coordinate
+            y (float): The SICK Y coordinate
+
+        Returns:
+            Tuple[float, float]: The InOrbit X and Y coordinates
+        """
+        a, b, c, d, e, f = self._coefficients
+        return a * x + b * y + c, d * x + e * y + f
+
+    def apply_batch(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Transform many positions at once.
+
+        Args:
+            x (np.ndarray): The SICK X coordinates
+            y (np.ndarray): The SICK Y coordinates
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The InOrbit X and Y coordinates
+        """
+        a, b, c, d, e, f = self._coefficients
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        return a * x + b * y + c, d * x + e * y + f
+
+
+def translation_matrix(translation_x: float, translation_y: float) -> List[List[float]]:
+    """Get the transform matrix of a translation-only calibration.
+
+    This is the transform applied by the `translation_x` and `translation_y` settings:
+    the SICK "Y" axis is reversed and the translation is subtracted.
+
+    Args:
+        translation_x (float): The coordinate translation in the X dimension
+        translation_y (float): The coordinate translation in the Y dimension
+
+    Returns:
+        List[List[float]]: The 2x3 affine matrix
+    """
+    return [[1.0, 0.0, -translation_x], [0.0, -1.0, -translation_y]]
+
+
+def fit_transform(
+    sick_points: Sequence[Tuple[float, float]],
+    inorbit_points: Sequence[Tuple[float, float]],
+    mode: str = CALIBRATION_RIGID,
+) -> Calibration:
+    """Fit the transform from SICK to InOrbit coordinates by least squares.
+
+    The rigid (rotation and translation) and similarity (plus uniform scale) fits use
+    the closed form solution by Umeyama, after reversing the SICK "Y" axis. The affine
+    fit solves for the full 2x3 matrix, which also absorbs shear, non-uniform scale
+    and the axis reversal.
+
+    Args:
+        sick_points (Sequence[Tuple[float, float]]): Positions in the SICK system
+        inorbit_points (Sequence[Tuple[float, float]]): The same positions, in the
+                                                        same order, in InOrbit
+        mode (str, optional): One of "rigid", "similarity" or "affine"
+
+    Returns:
+        Calibration: The fitted transform and its residuals
+
+    Raises:
+        ValueError: If the mode is unknown or there are not enough correspondences
+    """
+    if mode not in CALIBRATION_MODES:
+        raise ValueError(
+            f"Invalid calibration mode, expected one of {CALIBRATION_MODES}"
+        )
+    src = np.asarray(sick_points, dtype=float).reshape(-1, 2)
+    dst = np.asarray(inorbit_points, dtype=float).reshape(-1, 2)
+    if len(src) != len(dst):
+        raise ValueError("Every SICK point needs an InOrbit counterpart")
+    min_points = 3 if mode == CALIBRATION_AFFINE else 2
+    if len(src) < min_points:
+        raise ValueError(f"At least {min_points} points are needed for a {mode} fit")
+
+    if mode == CALIBRATION_AFFINE:
+        design = np.column_stack([src, np.ones(len(src))])
+        solution, *_ = np.linalg.lstsq(design, dst, rcond=None)
+        matrix = solution.T
+    else:
+        matrix = _fit_similarity(src @ FLIP_Y, dst, mode == CALIBRATION_SIMILARITY)
+        matrix[:, :2] = matrix[:, :2] @ FLIP_Y
+
+    linear = matrix[:, :2]
+    residuals = np.linalg.norm(src @ linear.T + matrix[:, 2] - dst, axis=1)
+    # The rotation and scale are measured without the axis reversal
+    unflipped = linear @ FLIP_Y
+    return Calibration(
+        matrix=matrix.tolist(),
+        residuals=residuals.tolist(),
+        rotation=float(np.arctan2(unflipped[1, 0], unflipped[0, 0])),
+        scale=float(np.sqrt(abs(np.linalg.det(linear)))),
+    )
+
+
+def _fit_similarity(src: np.ndarray, dst: np.ndarray, with_scale: bool) -> np.ndarray:
+    """Fit a rotation, translation and optionally uniform scale (Umeyama, 1991).
+
+    Args:
+        src (np.ndarray): The source points (one row per point)
+        dst (np.ndarray): The destination points (one row per point)
+        with_scale (bool): If the uniform scale is fitted as well
+
+    Returns:
+        np.ndarray: The 2x3 affine matrix mapping the source to the destination
+    """
+    src_mean, dst_mean = src.mean(axis=0), dst.mean(axis=0)
+    src_centered, dst_centered = src - src_mean, dst - dst_mean
+    u, s, vt = np.linalg.svd(dst_centered.T @ src_centered)
+    # Avoid a reflection
+    d = np.diag([1.0, np.sign(np.linalg.det(u @ vt)) or 1.0])
+    rotation = u @ d @ vt
+    scale = 1.0
+    if with_scale:
+        scale = np.trace(np.diag(s) @ d) / np.square(src_centered).sum()
+    linear = scale * rotation
+    return np.column_stack([linear, dst_mean - linear @ src_mean])
@@ -4,15 +4,49 @@
 # Copyright 2024 InOrbit, Inc.
 
 # Standard
-import json
-from typing import Union
+import math
+import threading
+import time
+from typing import Dict, Tuple, Union
 
 # Third-party
+import numpy as np
 from inorbit_connector.connector import Connector
 
 # InOrbit
 from sick_tag_loc_connector.models import SickTagLocConfig
+from sick_tag_loc_connector.api.parsers import POSITION_PARSERS, parse_timestamp
+from sick_tag_loc_connector.api.stream import StreamManager
 from sick_tag_loc_connector.api.tag import Tag
+from sick_tag_loc_connector.filters import PositionFilter
+from sick_tag_loc_connector.mailbox import PoseLetter, PoseMailbox
+from sick_tag_loc_connector.metrics import REGISTRY
+from sick_tag_loc_connector.publisher import (
+    POSES_PUBLISHED,
+    PUBLISH_MODE_EVENT,
+    PosePublisher,
+)
+from sick_tag_loc_connector.tracing import LatencyTracer, PoseTrace, publish_pose
+
+# Metrics
+TAG_MESSAGES = REGISTRY.counter(
+    "sick_tag_messages_total", "Stream messages received by tag", ["tag"]
+)
+TAG_PARSE_FAILURES = REGISTRY.counter(
+    "sick_tag_parse_failures_total",
+    "Stream messages without a valid position by tag",
+    ["tag"],
+)
+TAG_POSES_OVERWRITTEN = REGISTRY.counter(
+    "sick_tag_poses_overwritten_total",
+    "Poses replaced by a newer pose of the same tag before the execution loop took "
+    "them, by tag",
+    ["tag"],
+)
+MESSAGE_DURATION = REGISTRY.histogram(
+    "sick_message_processing_seconds",
+    "Time spent parsing, filtering and transforming each stream message",
+).labels()
 
 
 class SickTagLocConnector(Connector):
@@ -25,23 +59,76 @@ class SickTagLocConnector(Connector):
         config (SickTagLocConfig): The configuration for this connector
         tag (Tag): The SICK tag associated with this connector
         websocket_client (TagStreamWebSocketClient | None): The Tag WebSocket connection
+        frame_transform (FrameTransform): The transform from SICK to InOrbit
+            coordinates
+        stream_manager (StreamManager | None): The shared stream connections used
+            instead of a dedicated WebSocket connection, if any
+        publisher (PosePublisher | None): The shared publisher stage poses are
+            submitted to instead of being published by the execution loop, if any
+        position_filter (PositionFilter | None): The shared smoothing filter applied
+            to the positions before they are transformed, if any
+        mailbox (PoseMailbox): The handoff of the poses from the stream thread to the
+            execution loop
+        event_driven (bool): If poses are published as soon as they arrive instead of
+            on every execution loop tick
     """
 
-    def __init__(self, config: SickTagLocConfig, tag: Tag) -> None:
+    def __init__(
+        self,
+        config: SickTagLocConfig,
+        tag: Tag,
+        stream_manager: StreamManager | None = None,
+        publisher: PosePublisher | None = None,
+        position_filter: PositionFilter | None = None,
+    ) -> None:
         """
         Initialize a new SICK Tag connector.
 
         Args:
             tag (Tag): The SICK tag associated with this connector
             config (SickTagLocConfig): The configuration for this connector
+            stream_manager (StreamManager | None, optional): Shared stream connections
+                to subscribe through; if not provided, the connector opens its own
+                WebSocket connection
+            publisher (PosePublisher | None, optional): Shared publisher stage to
+                submit poses to; if not provided, the execution loop publishes them
+            position_filter (PositionFilter | None, optional): Shared smoothing filter
+                to apply to the positions; if not provided, they are not filtered
         """
         super().__init__(tag.get_inorbit_id(), config)
 
         self.config = config
         self.tag = tag
+        self.stream_manager = stream_manager
+        self.publisher = publisher
+        self.position_filter = position_filter
         self.websocket_client = None
-        self._last_pose = None
+        self.mailbox = PoseMailbox()
+        # The pose taken from the mailbox but held back by the deadband, if any
+        self._pending: PoseLetter | None = None
         self._last_pose_sent = None
+        self.frame_transform = config.connector_config.get_frame_transform()
+        self._heading = config.connector_config.get_heading_estimator()
+        self._deadband = config.connector_config.get_deadband(tag.get_inorbit_id())
+        self._parse_position = POSITION_PARSERS[config.connector_config.message_parser]
+        # Resolved once, they are updated on every message
+        self._messages = TAG_MESSAGES.labels(tag.get_id())
+        self._parse_failures = TAG_PARSE_FAILURES.labels(tag.get_id())
+        self._timezone = config.connector_config.get_timezone()
+        self._publish_source_timestamp = (
+            config.connector_config.publish_source_timestamp
+        )
+        self._tracer = (
+            LatencyTracer(tag.get_id())
+            if config.connector_config.latency_tracing
+            else None
+        )
+        self.event_driven = config.connector_config.publish_mode == PUBLISH_MODE_EVENT
+        self._min_publish_interval = 1.0 / config.connector_config.publish_max_rate
+        self._last_publish_at = -math.inf
+        # Wakes up the event-driven execution loop
+        self._wake = threading.Event()
+        self._stopping = False
 
     def _connect(self) -> None:
         """Connect the SICK Tag connector and subscribe to updates.
@@ -51,12 +138,33 @@ class SickTagLocConnector(Connector):
         """
         # Connect to InOrbit
         super()._connect()
-
-        self.websocket_client = self.tag.get_websocket_client(
-            self.config.connector_config.sick_rtls_websocket_port,
-            self._parse_pose_from_ws,
+        self._stopping = False
+        self._wake.clear()
+        # Exported while connected, removed on disconnect to release the connector
+        TAG_POSES_OVERWRITTEN.labels(self.tag.get_id()).set_function(
+            lambda: self.mailbox.overwritten
         )
-        self.websocket_client.subscribe()
+
+        if self.stream_manager:
+            self.stream_manager.subscribe(self.tag.get_id(), self._parse_pose_from_ws)
+        else:
+            connector_config = self.config.connector_config
+            self.websocket_client = self.tag.get_websocket_client(
+                connector_config.sick_rtls_websocket_port,
+                self._parse_pose_from_ws,
+                connector_config.get_websocket_client_class(),
+                open_timeout=connector_config.sick_rtls_websocket_open_timeout,
+                reconnect=connector_config.sick_rtls_websocket_reconnect,
+                reconnect_backoff=(
+                    connector_config.sick_rtls_websocket_reconnect_backoff
+                ),
+                reconnect_max_delay=(
+                    connector_config.sick_rtls_websocket_reconnect_max_delay
+                ),
+                ping_interval=connector_config.sick_rtls_websocket_ping_interval,
+                ping_timeout=connector_config.sick_rtls_websocket_ping_timeout,
+            )
+            self.websocket_client.subscribe()
 
         # If a footprint spec was provided, apply it
         tag_id = self.tag.get_inorbit_id()
@@ -71,47 +179,176 @@ class SickTagLocConnector(Connector):
         """
         super()._disconnect()
 
-        if self.websocket_client:
+        if self.stream_manager:
+            self.stream_manager.unsubscribe(self.tag.get_id())
+        elif self.websocket_client:
             self.websocket_client.close()
             self.websocket_client = None
-            self._last_pose = None
-            self._last_pose_sent = None
+        if self.publisher:
+            self.publisher.discard(self.tag.get_id())
+        if self.position_filter:
+            self.position_filter.reset(self.tag.get_id())
+        TAG_POSES_OVERWRITTEN.remove(self.tag.get_id())
+        self.mailbox.clear()
+        self._pending = None
+        self._last_pose_sent = None
+        self._last_publish_at = -math.inf
+        self._deadband.reset()
+        if self._heading:
+            self._heading.reset()
+
+    def stop(self) -> None:
+        """Stop the connector, waking up the event-driven execution loop if needed."""
+        self._stopping = True
+        self._wake.set()
+        super().stop()
 
     def _execution_loop(self):
         """Send updated poses.
 
-        This will only publish on a change in position.
+        This will only publish on a change in position that passes the deadband. Poses
+        are not published here when a shared publisher is used. In the event-driven
+        mode, this blocks until the connector is stopped, publishing the poses as they
+        arrive.
         """
-        if self._last_pose != self._last_pose_sent:
-            self._robot_session.publish_pose(**self._last_pose)
-            self._last_pose_sent = self._last_pose
+        if self.event_driven:
+            self._run_event_driven()
+        elif not self.publisher:
+            self._publish_latest_pose()
+
+    def _publish_latest_pose(self) -> bool:
+        """Publish the newest pose if it changed and passes the deadband.
+
+        The newest pose is taken from the mailbox. A pose held back by the deadband is
+        checked again on the next call, unless a newer pose replaced it.
+
+        Returns:
+            bool: If the pose was published
+        """
+        if letter := self.mailbox.take():
+            self._pending = letter
+        if (pending := self._pending) is None:
+            return False
+        if pending.pose == self._last_pose_sent:
+            self._pending = None
+            return False
+        if not self._deadband.check(pending.pose):
+            return False
+        publish_pose(self._robot_session, pending.pose, pending.trace)
+        self._last_pose_sent = pending.pose
+        self._pending = None
+        POSES_PUBLISHED.inc()
+        return True
+
+    def _run_event_driven(self) -> None:
+        """Publish the poses as soon as they arrive, until the connector is stopped.
+
+        The loop sleeps until a new pose arrives, so idle tags cost nothing. Poses are
+        published at most `publish_max_rate` times per second; the poses that arrive
+        in between are coalesced and the newest one is published when the interval is
+        over. Poses held back by the distance deadband are checked again when its time
+        is up.
+        """
+        timeout = None
+        while not self._stopping:
+            self._wake.wait(timeout)
+            self._wake.clear()
+            timeout = None
+            if self._stopping or self.publisher:
+                continue
+            now = time.monotonic()
+            if (delay := self._last_publish_at + self._min_publish_interval - now) > 0:
+                timeout = delay
+            elif self._publish_latest_pose():
+                self._last_publish_at = now
+            elif self._pending:
+                timeout = self._deadband.retry_after(now)
 
     def _parse_pose_from_ws(self, msg_from_ws: Union[bytes, str]) -> None:
         """Parse the pose data from the WebSocket message.
 
-        If a valid pose message is found, self._last_pose is set.
+        If a valid pose message is found, it is smoothed by the position filter (if
+        any), its yaw is estimated from the recent motion (if enabled, otherwise it is
+        unknown). Then, if a shared publisher is used, it is submitted to it along
+        with the deadband; otherwise, it is put in the mailbox for the execution
+        loop (and, in the event-driven mode, the execution loop is woken up). The
+        message is parsed with the parser selected by the `message_parser`
+        configuration.
+
+        The SICK timestamp of the position is kept along with the pose when it is
+        published with the pose (`publish_source_timestamp`) or its latencies are traced
+        (`latency_tracing`).
 
         Args:
             msg_from_ws (bytes | str): The message received from the WebSocket.
         """
-        parsed_json = json.loads(msg_from_ws)
-        datastreams = parsed_json["body"]["datastreams"]
-        pose_data = {}
-        for datastream in datastreams:
-            if (ds_id := datastream["id"]) == "posX":
-                pose_data["x"] = float(datastream["current_value"].strip())
-            elif ds_id == "posY":
-                pose_data["y"] = float(datastream["current_value"].strip())
-        if "x" in pose_data and "y" in pose_data:
-            pose_data["yaw"] = float("inf")
-            self._last_pose = self._transform(pose_data)
+        start = time.perf_counter()
+        self._messages.inc()
+        try:
+            pose_data = self._parse_position(msg_from_ws)
+        except Exception:
+            self._parse_failures.inc()
+            raise
+        if not pose_data:
+            self._parse_failures.inc()
+            return
+        at = pose_data.pop("at", None)
+        trace = None
+        if self._tracer or self._publish_source_timestamp:
+            trace = self._trace(at)
+        if self.position_filter:
+            pose_data["x"], pose_data["y"] = self.position_filter.update(
+                self.tag.get_id(), pose_data["x"], pose_data["y"], time.monotonic()
+            )
+        pose_data["yaw"] = float("inf")
+        pose = self._transform(pose_data)
+        if self._heading:
+            pose["yaw"] = self._heading.update(pose["x"], pose["y"])
+        if self.publisher:
+            # Poses held back by the deadband are published later by the publisher
+            self.publisher.submit(
+                self.tag.get_id(), self._robot_session, pose, trace, self._deadband
+            )
+        else:
+            self.mailbox.put(pose, trace)
+            if self.event_driven:
+                self._wake.set()
+        MESSAGE_DURATION.observe(time.perf_counter() - start)
+
+    def _trace(self, at: str | None) -> PoseTrace:
+        """Start the trace of a pose that was just received.
+
+        Args:
+            at (str | None): The SICK timestamp of the position, if any
+
+        Returns:
+            PoseTrace: The trace of the pose
+        """
+        received = time.time()
+        source = parse_timestamp(at, self._timezone) if at else None
+        trace = PoseTrace(received, source, tracer=self._tracer)
+        if self._publish_source_timestamp and source is not None:
+            trace.ts = int(source * 1000)
+        if self._tracer:
+            self._tracer.received(trace)
+        return trace
+
+    def get_latency_percentiles(self) -> Dict[str, Dict[float, float]]:
+        """Get the latency percentiles of the recent poses of the tag.
+
+        Returns:
+            Dict[str, Dict[float, float]]: The value in seconds of each quantile by
+                stage ("receive", "wait", "publish" and "total"), or an empty dict if
+                `latency_tracing` is disabled
+        """
+        return self._tracer.percentiles() if self._tracer else {}
 
     def _transform(self, pose: dict) -> dict:
         """Main transform between the SICK pose into an InOrbit pose.
 
-        This method will read values from the config. Note that no rotation applied
-        since the SICK system doesn't provide theta and is assumed to be aligned with
-        zero radians.
+        The position is mapped with the frame transform from the config (see
+        `transform_batch` to transform many positions at once). Note that the yaw is
+        passed through since the SICK system doesn't provide theta.
 
         Args:
             pose (dict): A dict with x,y values
@@ -119,9 +356,22 @@ class SickTagLocConnector(Connector):
         Returns:
             A fully transformed pose
         """
-        # Translation
-        x = pose["x"] - self.config.connector_config.translation_x
-        # Note that the "y" coordinates are reversed in the SICK system
-        y = -pose["y"] - self.config.connector_config.translation_y
-
+        x, y = self.frame_transform.apply(pose["x"], pose["y"])
         return {"x": x, "y": y, "yaw": pose["yaw"]}
+
+    def transform_batch(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Transform many SICK positions into InOrbit positions at once.
+
+        This applies the same transform as `_transform`, for replay, backfill or
+        batches of positions.
+
+        Args:
+            x (np.ndarray): The SICK X coordinates
+            y (np.ndarray): The SICK Y coordinates
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The InOrbit X and Y coordinates
+        """
+        return self.frame_transform.apply_batch(x, y)
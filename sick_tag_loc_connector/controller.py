@@ -3,21 +3,128 @@
 # License: MIT License
 # Copyright 2024 InOrbit, Inc.
 
+# Standard
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List
+
 # InOrbit
 from sick_tag_loc_connector.connector import SickTagLocConnector
 from sick_tag_loc_connector.api.tag import Tag
+from sick_tag_loc_connector.api.recorder import StreamRecorder
 from sick_tag_loc_connector.api.rest import RestClient
+from sick_tag_loc_connector.api.stream import StreamManager
+from sick_tag_loc_connector.metrics import REGISTRY, MetricsServer
 from sick_tag_loc_connector.models import SickTagLocConfig
+from sick_tag_loc_connector.publisher import PosePublisher
+from sick_tag_loc_connector.sharding import WORKER_SALT, shard_of
+
+
+# Outcomes of starting or stopping a connector
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+# Metrics
+CONNECTORS = REGISTRY.gauge("sick_connectors", "Tags managed by the controller")
+CONNECTOR_ACTIONS = REGISTRY.counter(
+    "sick_connector_actions_total",
+    "Connectors started or stopped, by action and outcome",
+    ["action", "status"],
+)
+REFRESH_DURATION = REGISTRY.histogram(
+    "sick_tag_refresh_duration_seconds", "Time spent reloading the tag list"
+)
+
+
+@dataclass
+class ConnectorReport:
+    """The outcome of starting or stopping the connector of a tag.
+
+    Attributes:
+        tag_id (str): The ID of the tag
+        status (str): One of STATUS_OK, STATUS_ERROR or STATUS_TIMEOUT
+        duration (float): The time it took (or was waited for) in seconds
+        error (str | None): The error message if it failed
+    """
+
+    tag_id: str
+    status: str
+    duration: float
+    error: str | None = None
+
+
+@dataclass
+class RefreshReport:
+    """The outcome of a tag refresh.
+
+    Attributes:
+        added (List[str]): The IDs of the tags whose connectors were started
+        removed (List[str]): The IDs of the tags whose connectors were stopped
+        duration (float): The time the refresh took in seconds
+    """
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+
+@dataclass
+class ControllerHealth:
+    """A snapshot of the state of a controller.
+
+    Attributes:
+        connectors (int): The number of connectors managed
+        failed (int): The number of connectors that failed or timed out to start
+        subscriptions (int): The number of feeds subscribed through the shared streams
+        connections (int): The number of shared stream connections
+        connected (int): The number of shared stream connections currently open
+    """
+
+    connectors: int = 0
+    failed: int = 0
+    subscriptions: int = 0
+    connections: int = 0
+    connected: int = 0
 
 
 class SickTagLocMasterController:
     """A controller class for managing SickTagLocConnectors.
 
     This class loads all tags from the system and creates and manages a set of
-    SickTagLocConnectors based on configuration provided by SickTagLocConfig.
+    SickTagLocConnectors based on configuration provided by SickTagLocConfig. If a
+    tag refresh interval is configured, the tags are reloaded periodically while
+    running and connectors are only added or removed for the tags that changed. If a
+    metrics port is configured, the metrics of the connector internals are served
+    while running.
+
+    Connectors are started and stopped concurrently, and the time each one took is
+    kept in the start and stop reports.
+
+    When the tags are split across several connector instances (`shard_count`), the
+    controller only manages the tags of the shard of its instance (`shard_index`).
+    When running as one of several worker processes, it only manages its own share of
+    those tags.
+
+    Attributes:
+        worker_index (int): The share of the tags of the instance managed by this
+                            controller
+        worker_count (int): The number of shares the tags of the instance are split
+                            into
+        start_report (List[ConnectorReport]): How starting each connector went
+        stop_report (List[ConnectorReport]): How stopping each connector went
+        refresh_count (int): The number of refreshes performed
+        refresh_total_duration (float): The time spent refreshing in seconds
+        last_refresh (RefreshReport | None): The report of the latest refresh
+        metrics_server (MetricsServer | None): Serves the metrics, if enabled
     """
 
-    def __init__(self, config: SickTagLocConfig):
+    def __init__(
+        self, config: SickTagLocConfig, worker_index: int = 0, worker_count: int = 1
+    ):
         """Initialize the SickTagLocMasterController
 
         A call to start/stop should be made after initialization.
@@ -25,29 +132,370 @@ class SickTagLocMasterController:
         Args:
             config (SickTagLocConfig): Configuration object containing settings for
                                        connectors and API clients
+            worker_index (int, optional): The share of the tags of the instance to
+                                          manage
+            worker_count (int, optional): The number of shares the tags of the
+                                          instance are split into (1 manages all of
+                                          them)
         """
+        if not 0 <= worker_index < worker_count:
+            raise ValueError("The worker index must be between 0 and the worker count")
+
+        self.logger = logging.getLogger(name=self.__class__.__name__)
         self.config = config
+        self.worker_index = worker_index
+        self.worker_count = worker_count
+        if config.connector_config.shard_count > 1:
+            self.logger.info(
+                f"Managing the tags of shard {config.connector_config.shard_index} of "
+                f"{config.connector_config.shard_count}"
+            )
 
         # Create (but don't start) the connection components
+        connector_config = self.config.connector_config
         self.rest_client = RestClient(
-            self.config.connector_config.get_rest_api_url(),
-            self.config.connector_config.sick_rtls_api_key,
+            connector_config.get_rest_api_url(),
+            connector_config.sick_rtls_api_key,
+            pool_size=connector_config.sick_rtls_http_pool_size,
+            connect_timeout=connector_config.sick_rtls_http_connect_timeout,
+            read_timeout=connector_config.sick_rtls_http_read_timeout,
+            max_retries=connector_config.sick_rtls_http_max_retries,
+            backoff_factor=connector_config.sick_rtls_http_backoff_factor,
+        )
+        # The received stream messages are recorded, if enabled
+        self.recorder = None
+        if connector_config.sick_rtls_record_path:
+            self.recorder = StreamRecorder(
+                connector_config.sick_rtls_record_path,
+                connector_config.sick_rtls_record_compress,
+            )
+        # All the tag streams share the same pool of WebSocket connections
+        self.stream_manager = StreamManager(
+            connector_config.get_websocket_url(),
+            connector_config.sick_rtls_api_key,
+            connector_config.sick_rtls_websocket_pool_size,
+            connector_config.get_websocket_client_class(),
+            connector_config.sick_rtls_websocket_open_timeout,
+            self.recorder,
+            connector_config.sick_rtls_websocket_reconnect,
+            connector_config.sick_rtls_websocket_reconnect_backoff,
+            connector_config.sick_rtls_websocket_reconnect_max_delay,
+            connector_config.sick_rtls_websocket_ping_interval,
+            connector_config.sick_rtls_websocket_ping_timeout,
         )
-        tags = Tag.get_all(self.rest_client)
-        self.connectors = [SickTagLocConnector(self.config, tag) for tag in tags]
+        # All the tag poses are coalesced and published together, if enabled
+        self.publisher = None
+        if connector_config.publish_batching:
+            self.publisher = PosePublisher(
+                connector_config.publish_max_rate, connector_config.publish_max_latency
+            )
+        # All the tags share one bank of position filters, if enabled
+        self.position_filter = connector_config.get_position_filter()
+        # The metrics are served while running, if enabled
+        self.metrics_server = None
+        if connector_config.metrics_port is not None:
+            self.metrics_server = MetricsServer(
+                REGISTRY, connector_config.metrics_host, connector_config.metrics_port
+            )
+        # Connectors are created as each page of tags arrives
+        self._connectors: Dict[str, SickTagLocConnector] = {
+            tag.get_id(): self._create_connector(tag) for tag in self._iter_tags()
+        }
+        CONNECTORS.set(len(self._connectors))
+
+        self.start_report: List[ConnectorReport] = []
+        self.stop_report: List[ConnectorReport] = []
+        self.refresh_count = 0
+        self.refresh_total_duration = 0.0
+        self.last_refresh: RefreshReport | None = None
+        # Guards the connectors, only briefly so readers are not held back
+        self._lock = threading.Lock()
+        # Held while connectors are started or stopped, one action at a time
+        self._action_lock = threading.Lock()
+        self._running = False
+        self._stop_event = threading.Event()
+        self._refresh_thread = None
+
+    @property
+    def connectors(self) -> List[SickTagLocConnector]:
+        """The SickTagLocConnectors currently managed by this controller."""
+        with self._lock:
+            return list(self._connectors.values())
 
     def start(self) -> None:
         """Start all SickTagLocConnectors managed by this controller.
 
-        The connector list is initialized in the constructor of the class.
+        The connector list is initialized in the constructor of the class. Connectors
+        are started concurrently and a connector that fails or times out does not
+        prevent the others from starting. If a tag refresh interval is configured, the
+        periodic refresh is started as well.
         """
-        [connector.start() for connector in self.connectors]
+        if self.metrics_server:
+            self.metrics_server.start()
+        if self.publisher:
+            self.publisher.start()
+        with self._action_lock:
+            with self._lock:
+                self._running = True
+                connectors = dict(self._connectors)
+            self.start_report = self._run_parallel("start", connectors)
+        self._log_report("Started", self.start_report)
+
+        if self.config.connector_config.tag_refresh_interval > 0:
+            self._stop_event.clear()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="TagRefresh", daemon=True
+            )
+            self._refresh_thread.start()
 
     def stop(self) -> None:
         """Stop all SickTagLocConnectors managed by this controller.
 
-        This method stops each active connector.
+        This method stops the periodic refresh, each active connector, the shared
+        publisher and the metrics server and closes the shared stream connections and
+        the stream recording.
+        """
+        self._stop_event.set()
+        if self._refresh_thread:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+        with self._action_lock:
+            with self._lock:
+                self._running = False
+                connectors = dict(self._connectors)
+            self.stop_report = self._run_parallel("stop", connectors)
+        self._log_report("Stopped", self.stop_report)
+        if self.publisher:
+            self.publisher.stop()
+        self.stream_manager.close()
+        if self.recorder:
+            self.recorder.close()
+        self.rest_client.close()
+        if self.metrics_server:
+            self.metrics_server.stop()
+
+    def get_health(self) -> ControllerHealth:
+        """Get a snapshot of the state of the controller.
+
+        Returns:
+            ControllerHealth: The connectors and shared streams of the controller
         """
-        [connector.stop() for connector in self.connectors]
+        return ControllerHealth(
+            connectors=len(self._connectors),
+            failed=sum(report.status != STATUS_OK for report in self.start_report),
+            subscriptions=self.stream_manager.subscriptions(),
+            connections=self.stream_manager.connections(),
+            connected=self.stream_manager.open_connections(),
+        )
+
+    def refresh(self) -> RefreshReport:
+        """Reconcile the managed connectors with the tags in the system.
+
+        Connectors are created (and started, if the controller is running) for new
+        tags, and stopped and dropped for tags that no longer exist. Connectors of
+        tags that are still present are left untouched.
+
+        Returns:
+            RefreshReport: The tags added and removed and how long it took
+        """
+        start = time.perf_counter()
+        report = RefreshReport()
+
+        # Only the new tags are kept while paging through the system
+        seen = set()
+        new_tags = []
+        for tag in self._iter_tags():
+            seen.add(tag_id := tag.get_id())
+            if tag_id not in self._connectors:
+                new_tags.append(tag)
 
-    # TODO(russell): add a "refresh" function to get and add new tags periodically
+        with self._action_lock:
+            added = {
+                tag.get_id(): self._create_connector(tag)
+                for tag in new_tags
+                if tag.get_id() not in self._connectors
+            }
+            # Only the connectors are swapped with the lock held, starting and
+            # stopping them can take up to the connector timeout
+            with self._lock:
+                removed = {
+                    tag_id: self._connectors.pop(tag_id)
+                    for tag_id in list(self._connectors)
+                    if tag_id not in seen
+                }
+                self._connectors.update(added)
+                CONNECTORS.set(len(self._connectors))
+                running = self._running
+            if running:
+                self._run_parallel("stop", removed)
+                self._run_parallel("start", added)
+        report.removed.extend(removed)
+        report.added.extend(added)
+
+        report.duration = time.perf_counter() - start
+        REFRESH_DURATION.observe(report.duration)
+        self.refresh_count += 1
+        self.refresh_total_duration += report.duration
+        self.last_refresh = report
+        self.logger.info(
+            f"Tag refresh took {report.duration:.3f}s: {len(report.added)} added, "
+            f"{len(report.removed)} removed, {len(self._connectors)} total"
+        )
+        return report
+
+    def _refresh_loop(self) -> None:
+        """Refresh the tags periodically until the controller is stopped."""
+        interval = self.config.connector_config.tag_refresh_interval
+        while not self._stop_event.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                self.logger.error(f"Tag refresh failed: {e}")
+
+    def _run_parallel(
+        self, action: str, connectors: Dict[str, SickTagLocConnector]
+    ) -> List[ConnectorReport]:
+        """Start or stop connectors concurrently.
+
+        At most `connector_concurrency` connectors are handled at the same time. A
+        connector still running after `connector_timeout` seconds is reported as timed
+        out and is no longer waited for.
+
+        Args:
+            action (str): The connector method to call ("start" or "stop")
+            connectors (Dict[str, SickTagLocConnector]): The connectors by tag ID
+
+        Returns:
+            List[ConnectorReport]: The outcome for each connector, in completion order
+        """
+        if not connectors:
+            return []
+
+        timeout = self.config.connector_config.connector_timeout
+        started_at: Dict[str, float] = {}
+
+        def run(tag_id: str, connector: SickTagLocConnector) -> float:
+            started_at[tag_id] = time.perf_counter()
+            getattr(connector, action)()
+            return time.perf_counter() - started_at[tag_id]
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.config.connector_config.connector_concurrency,
+            thread_name_prefix=f"connector-{action}",
+        )
+        futures: Dict[Future, str] = {
+            executor.submit(run, tag_id, connector): tag_id
+            for tag_id, connector in connectors.items()
+        }
+        pending = set(futures)
+        reports = []
+        try:
+            while pending:
+                # Wake up on the next completion or the earliest deadline
+                deadlines = [
+                    started_at[futures[f]] + timeout
+                    for f in pending
+                    if futures[f] in started_at
+                ]
+                wait_time = timeout
+                if deadlines:
+                    # An expired deadline is handled right away
+                    wait_time = max(0.0, min(deadlines) - time.perf_counter())
+                done, pending = wait(pending, wait_time, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    tag_id = futures[future]
+                    try:
+                        duration = future.result()
+                        reports.append(ConnectorReport(tag_id, STATUS_OK, duration))
+                    except Exception as e:
+                        duration = time.perf_counter() - started_at[tag_id]
+                        reports.append(
+                            ConnectorReport(tag_id, STATUS_ERROR, duration, str(e))
+                        )
+
+                now = time.perf_counter()
+                for future in list(pending):
+                    tag_id = futures[future]
+                    if tag_id in started_at and now - started_at[tag_id] >= timeout:
+                        pending.discard(future)
+                        duration = now - started_at[tag_id]
+                        reports.append(
+                            ConnectorReport(tag_id, STATUS_TIMEOUT, duration)
+                        )
+        finally:
+            # Connectors that timed out are left to finish in the background
+            executor.shutdown(wait=False)
+        for report in reports:
+            CONNECTOR_ACTIONS.labels(action, report.status).inc()
+        return reports
+
+    def _log_report(self, action: str, reports: List[ConnectorReport]) -> None:
+        """Log the outcome of starting or stopping connectors.
+
+        Args:
+            action (str): The past tense of the action to log (i.e., "Started")
+            reports (List[ConnectorReport]): The outcome for each connector
+        """
+        for report in reports:
+            if report.status == STATUS_OK:
+                self.logger.debug(f"{action} {report.tag_id} in {report.duration:.3f}s")
+            else:
+                self.logger.warning(
+                    f"{action} {report.tag_id} failed ({report.status}) after "
+                    f"{report.duration:.3f}s: {report.error or ''}"
+                )
+        ok = [report for report in reports if report.status == STATUS_OK]
+        summary = f"{action} {len(ok)}/{len(reports)} connectors"
+        if ok:
+            slowest = max(ok, key=lambda report: report.duration)
+            summary += f" (slowest: {slowest.tag_id} {slowest.duration:.3f}s)"
+        self.logger.info(summary)
+
+    def _iter_tags(self) -> Iterator[Tag]:
+        """Iterate over the tags in the system, page by page.
+
+        Only the tags managed by the controller are returned.
+
+        Returns:
+            Iterator[Tag]: The tags in the system
+        """
+        connector_config = self.config.connector_config
+        tags = Tag.iter_all(
+            self.rest_client,
+            connector_config.sick_rtls_page_size,
+            connector_config.sick_rtls_page_prefetch,
+        )
+        if connector_config.shard_count == 1 and self.worker_count == 1:
+            return tags
+        return (tag for tag in tags if self._manages(tag.get_id()))
+
+    def _manages(self, tag_id: str) -> bool:
+        """Check if a tag belongs to the shard of the instance and to this worker.
+
+        Args:
+            tag_id (str): The ID of the tag
+
+        Returns:
+            bool: If the tag is managed by this controller
+        """
+        connector_config = self.config.connector_config
+        return (
+            shard_of(tag_id, connector_config.shard_count)
+            == connector_config.shard_index
+            and shard_of(tag_id, self.worker_count, WORKER_SALT) == self.worker_index
+        )
+
+    def _create_connector(self, tag: Tag) -> SickTagLocConnector:
+        """Create (but don't start) the connector of a tag.
+
+        Args:
+            tag (Tag): The SICK tag to connect
+
+        Returns:
+            SickTagLocConnector: The connector of the tag
+        """
+        return SickTagLocConnector(
+            self.config, tag, self.stream_manager, self.publisher, self.position_filter
+        )
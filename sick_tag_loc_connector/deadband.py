@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import math
+import time
+
+
+class Deadband:
+    """Decides which poses of a tag are worth publishing.
+
+    A pose is published if the tag moved more than `distance` meters since the last
+    published pose, or if it changed and at least `time` seconds went by since then.
+    This filters out the positioning jitter of parked tags while poses of moving tags
+    are published right away.
+
+    Attributes:
+        distance (float): The minimum distance in meters to publish a pose right away;
+                          0 publishes every change
+        time (float): The seconds after which a changed pose is published regardless
+                      of the distance; 0 disables it
+    """
+
+    def __init__(self, distance: float = 0.0, time: float = 0.0) -> None:
+        """Deadband Constructor
+
+        Args:
+            distance (float, optional): The minimum distance in meters to publish a
+                                        pose right away
+            time (float, optional): The seconds after which a changed pose is
+                                    published regardless of the distance
+        """
+        self.distance = distance
+        self.time = time
+        self._last_pose = None
+        self._last_at = 0.0
+
+    def check(self, pose: dict, now: float | None = None) -> bool:
+        """Check if a pose should be published, and remember it if so.
+
+        Args:
+            pose (dict): The pose with "x" and "y" values
+            now (float | None, optional): The time.monotonic() time of the pose
+
+        Returns:
+            bool: If the pose should be published
+        """
+        now = time.monotonic() if now is None else now
+        if self._accepts(pose, now):
+            self._last_pose = pose
+            self._last_at = now
+            return True
+        return False
+
+    def retry_after(self, now: float | None = None) -> float | None:
+        """Get how long until a changed pose held back by the distance is published.
+
+        Args:
+            now (float | None, optional): The current time.monotonic() time
+
+        Returns:
+            float | None: The seconds until the time deadband lets the pose through, or
+                          None if only the distance counts
+        """
+        if self.time <= 0 or self._last_pose is None:
+            return None
+        now = time.monotonic() if now is None else now
+        return max(self._last_at + self.time - now, 0.0)
+
+    def reset(self) -> None:
+        """Forget the last published pose, so the next one is always published."""
+        self._last_pose = None
+        self._last_at = 0.0
+
+    def _accepts(self, pose: dict, now: float) -> bool:
+        """Check if a pose passes the deadband.
+
+        Args:
+            pose (dict): The pose with "x" and "y" values
+            now (float): The time.monotonic() time of the pose
+
+        Returns:
+            bool: If the pose passes the deadband
+        """
+        last = self._last_pose
+        if last is None:
+            return True
+        if pose == last:
+            return False
+        if self.distance <= 0:
+            return True
+        moved = math.hypot(pose["x"] - last["x"], pose["y"] - last["y"])
+        if moved > self.distance:
+            return True
+        return 0 < self.time <= now - self._last_at
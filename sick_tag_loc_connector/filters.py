@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Tuple
+
+# Third-party
+import numpy as np
+
+FILTER_NONE = "none"
+FILTER_ALPHA_BETA = "alpha_beta"
+FILTER_KALMAN = "kalman"
+
+DEFAULT_FILTER_ALPHA = 0.5
+DEFAULT_FILTER_BETA = 0.1
+DEFAULT_FILTER_PROCESS_NOISE = 1.0
+DEFAULT_FILTER_MEASUREMENT_NOISE = 0.1
+# Seconds without updates after which a tag filter starts over from its next position
+DEFAULT_FILTER_RESET_GAP = 5.0
+
+# Columns of the state array; the covariance terms are only used by the Kalman filter
+X, Y, VX, VY, T, P00, P01, P11 = range(8)
+STATE_SIZE = 8
+INITIAL_CAPACITY = 64
+
+
+class PositionFilter(ABC):
+    """A bank of constant velocity position filters, one per tag.
+
+    The state of every tag is kept in a single compact array (one row per tag) so
+    positions can be filtered one message at a time or for many tags at once with
+    vectorized operations. Tags are identified by a key (i.e., the tag ID) that is
+    mapped to a row the first time it is seen. A tag filter starts over from the
+    measured position on its first update, after a reset or after no updates for
+    `reset_gap` seconds.
+
+    Subclasses implement the filter update itself.
+
+    Attributes:
+        reset_gap (float): Seconds without updates after which a tag filter restarts
+    """
+
+    def __init__(self, reset_gap: float = DEFAULT_FILTER_RESET_GAP) -> None:
+        """PositionFilter Constructor
+
+        Args:
+            reset_gap (float, optional): Seconds without updates after which a tag
+                                         filter restarts
+        """
+        self.reset_gap = reset_gap
+        self._state = np.full((INITIAL_CAPACITY, STATE_SIZE), np.nan)
+        self._slots: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of tags with a filter.
+
+        Returns:
+            int: The number of tags
+        """
+        return len(self._slots)
+
+    def slot(self, key: str) -> int:
+        """Get the state row of a tag, allocating it if needed.
+
+        Args:
+            key (str): The tag key
+
+        Returns:
+            int: The row of the tag in the state array
+        """
+        with self._lock:
+            if (slot := self._slots.get(key)) is None:
+                slot = self._slots[key] = len(self._slots)
+                if slot >= len(self._state):
+                    grown = np.full((2 * len(self._state), STATE_SIZE), np.nan)
+                    grown[:slot] = self._state
+                    self._state = grown
+            return slot
+
+    def slots(self, keys: Iterable[str]) -> np.ndarray:
+        """Get the state rows of many tags, allocating them if needed.
+
+        Args:
+            keys (Iterable[str]): The tag keys
+
+        Returns:
+            np.ndarray: The rows of the tags in the state array
+        """
+        return np.fromiter((self.slot(key) for key in keys), dtype=np.intp)
+
+    def reset(self, key: str) -> None:
+        """Restart the filter of a tag from its next position.
+
+        Args:
+            key (str): The tag key
+        """
+        with self._lock:
+            if (slot := self._slots.get(key)) is not None:
+                self._state[slot] = np.nan
+
+    def update(self, key: str, x: float, y: float, t: float) -> Tuple[float, float]:
+        """Filter a new position of a tag.
+
+        Args:
+            key (str): The tag key
+            x (float): The measured X coordinate
+            y (float): The measured Y coordinate
+            t (float): The time of the measurement in seconds
+
+        Returns:
+            Tuple[float, float]: The filtered X and Y coordinates
+        """
+        slot = self.slot(key)
+        with self._lock:
+            state = self._state[slot].tolist()
+            dt = t - state[T]
+            # NaN (never updated) fails every comparison
+            if 0 <= dt <= self.reset_gap:
+                state = self._step(state, x, y, dt)
+            else:
+                state = self._initial_state(x, y)
+            state[T] = t
+            self._state[slot] = state
+        return state[X], state[Y]
+
+    def update_batch(
+        self, slots: np.ndarray, x: np.ndarray, y: np.ndarray, t: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Filter new positions of many tags at once.
+
+        Args:
+            slots (np.ndarray): The state rows of the tags (see `slots`); each tag can
+                                appear only once per batch
+            x (np.ndarray): The measured X coordinates
+            y (np.ndarray): The measured Y coordinates
+            t (np.ndarray): The times of the measurements in seconds
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The filtered X and Y coordinates
+        """
+        x, y, t = (np.asarray(values, dtype=float) for values in (x, y, t))
+        with self._lock:
+            state = self._state[slots]
+            dt = t - state[:, T]
+            valid = (dt >= 0) & (dt <= self.reset_gap)
+            state = self._step_batch(state, x, y, np.where(valid, dt, 0.0))
+            if not valid.all():
+                state[~valid] = self._initial_batch(x[~valid], y[~valid])
+            state[:, T] = t
+            self._state[slots] = state
+        return state[:, X], state[:, Y]
+
+    @abstractmethod
+    def _initial_state(self, x: float, y: float) -> list:
+        """Get the state of a tag filter starting over at a position.
+
+        Args:
+            x (float): The X coordinate to start from
+            y (float): The Y coordinate to start from
+
+        Returns:
+            list: The initial state
+        """
+
+    def _initial_batch(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Get the state of many tag filters starting over at new positions.
+
+        Args:
+            x (np.ndarray): The X coordinates to start from
+            y (np.ndarray): The Y coordinates to start from
+
+        Returns:
+            np.ndarray: The initial state (one row per tag)
+        """
+        return np.array([self._initial_state(*position) for position in zip(x, y)])
+
+    @abstractmethod
+    def _step(self, state: list, x: float, y: float, dt: float) -> list:
+        """Update the state of a tag filter with a new position.
+
+        Args:
+            state (list): The current state (one value per state column)
+            x (float): The measured X coordinate
+            y (float): The measured Y coordinate
+            dt (float): The seconds since the previous update
+
+        Returns:
+            list: The updated state
+        """
+
+    @abstractmethod
+    def _step_batch(
+        self, state: np.ndarray, x: np.ndarray, y: np.ndarray, dt: np.ndarray
+    ) -> np.ndarray:
+        """Update the state of many tag filters with new positions.
+
+        Args:
+            state (np.ndarray): The current state (one row per tag)
+            x (np.ndarray): The measured X coordinates
+            y (np.ndarray): The measured Y coordinates
+            dt (np.ndarray): The seconds since the previous update of each tag
+
+        Returns:
+            np.ndarray: The updated state
+        """
+
+
+class AlphaBetaFilter(PositionFilter):
+    """Alpha-beta (g-h) constant velocity position filter.
+
+    Attributes:
+        alpha (float): The weight of the position residual on the position estimate
+        beta (float): The weight of the position residual on the velocity estimate
+    """
+
+    def __init__(
+        self,
+        alpha: float = DEFAULT_FILTER_ALPHA,
+        beta: float = DEFAULT_FILTER_BETA,
+        reset_gap: float = DEFAULT_FILTER_RESET_GAP,
+    ) -> None:
+        """AlphaBetaFilter Constructor
+
+        Args:
+            alpha (float, optional): The weight of the position residual on the
+                                     position estimate, in (0, 1]
+            beta (float, optional): The weight of the position residual on the
+                                    velocity estimate, in [0, 2)
+            reset_gap (float, optional): Seconds without updates after which a tag
+                                         filter restarts
+        """
+        if not 0 < alpha <= 1 or not 0 <= beta < 2:
+            raise ValueError("Alpha must be in (0, 1] and beta in [0, 2)")
+        super().__init__(reset_gap)
+        self.alpha = alpha
+        self.beta = beta
+
+    def _initial_state(self, x: float, y: float) -> list:
+        return [x, y, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+
+    def _step(self, state: list, x: float, y: float, dt: float) -> list:
+        px = state[X] + state[VX] * dt
+        py = state[Y] + state[VY] * dt
+        rx, ry = x - px, y - py
+        gain = self.beta / dt if dt > 0 else 0.0
+        return [
+            px + self.alpha * rx,
+            py + self.alpha * ry,
+            state[VX] + gain * rx,
+            state[VY] + gain * ry,
+            state[T],
+            0.0,
+            0.0,
+            0.0,
+        ]
+
+    def _step_batch(
+        self, state: np.ndarray, x: np.ndarray, y: np.ndarray, dt: np.ndarray
+    ) -> np.ndarray:
+        px = state[:, X] + state[:, VX] * dt
+        py = state[:, Y] + state[:, VY] * dt
+        rx, ry = x - px, y - py
+        gain = np.divide(self.beta, dt, out=np.zeros_like(dt), where=dt > 0)
+        state[:, X] = px + self.alpha * rx
+        state[:, Y] = py + self.alpha * ry
+        state[:, VX] += gain * rx
+        state[:, VY] += gain * ry
+        return state
+
+
+class KalmanFilter(PositionFilter):
+    """Constant velocity Kalman position filter.
+
+    Each axis is filtered independently with the same noise model, so both axes share
+    a single 2x2 covariance (position and velocity) per tag.
+
+    Attributes:
+        process_noise (float): The standard deviation of the tag acceleration in m/s²
+        measurement_noise (float): The standard deviation of the positions in meters
+    """
+
+    # Initial velocity variance (m²/s²) of a tag filter
+    INITIAL_VELOCITY_VARIANCE = 1.0
+
+    def __init__(
+        self,
+        process_noise: float = DEFAULT_FILTER_PROCESS_NOISE,
+        measurement_noise: float = DEFAULT_FILTER_MEASUREMENT_NOISE,
+        reset_gap: float = DEFAULT_FILTER_RESET_GAP,
+    ) -> None:
+        """KalmanFilter Constructor
+
+        Args:
+            process_noise (float, optional): The standard deviation of the tag
+                                             acceleration in m/s²
+            measurement_noise (float, optional): The standard deviation of the
+                                                 positions in meters
+            reset_gap (float, optional): Seconds without updates after which a tag
+                                         filter restarts
+        """
+        if process_noise <= 0 or measurement_noise <= 0:
+            raise ValueError("The process and measurement noise must be positive")
+        super().__init__(reset_gap)
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self._q = process_noise**2
+        self._r = measurement_noise**2
+
+    def _initial_state(self, x: float, y: float) -> list:
+        return [x, y, 0.0, 0.0, 0.0, self._r, 0.0, self.INITIAL_VELOCITY_VARIANCE]
+
+    def _step(self, state: list, x: float, y: float, dt: float) -> list:
+        # Predict
+        px = state[X] + state[VX] * dt
+        py = state[Y] + state[VY] * dt
+        dt2 = dt * dt
+        p11 = state[P11]
+        p01 = state[P01] + dt * p11 + self._q * dt2 * dt / 2
+        p00 = state[P00] + 2 * dt * state[P01] + dt2 * p11 + self._q * dt2 * dt2 / 4
+        p11 += self._q * dt2
+
+        # Update
+        s = p00 + self._r
+        k0, k1 = p00 / s, p01 / s
+        rx, ry = x - px, y - py
+        return [
+            px + k0 * rx,
+            py + k0 * ry,
+            state[VX] + k1 * rx,
+            state[VY] + k1 * ry,
+            state[T],
+            (1 - k0) * p00,
+            (1 - k0) * p01,
+            p11 - k1 * p01,
+        ]
+
+    def _step_batch(
+        self, state: np.ndarray, x: np.ndarray, y: np.ndarray, dt: np.ndarray
+    ) -> np.ndarray:
+        # Predict
+        px = state[:, X] + state[:, VX] * dt
+        py = state[:, Y] + state[:, VY] * dt
+        dt2 = dt * dt
+        p11 = state[:, P11]
+        p01 = state[:, P01] + dt * p11 + self._q * dt2 * dt / 2
+        p00 = state[:, P00] + 2 * dt * state[:, P01] + dt2 * p11 + self._q * dt2**2 / 4
+        p11 = p11 + self._q * dt2
+
+        # Update
+        s = p00 + self._r
+        k0, k1 = p00 / s, p01 / s
+        rx, ry = x - px, y - py
+        state[:, X] = px + k0 * rx
+        state[:, Y] = py + k0 * ry
+        state[:, VX] += k1 * rx
+        state[:, VY] += k1 * ry
+        state[:, P00] = (1 - k0) * p00
+        state[:, P01] = (1 - k0) * p01
+        state[:, P11] = p11 - k1 * p01
+        return state
+
+
+POSITION_FILTERS = {
+    FILTER_ALPHA_BETA: AlphaBetaFilter,
+    FILTER_KALMAN: KalmanFilter,
+}
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import math
+from collections import deque
+
+DEFAULT_HEADING_MIN_DISPLACEMENT = 0.2
+DEFAULT_HEADING_SMOOTHING = 0.5
+DEFAULT_HEADING_HISTORY = 10
+
+
+class HeadingEstimator:
+    """Estimates the heading (yaw) of a tag from its recent trajectory.
+
+    The latest positions of the tag are kept in a ring buffer. On every update, the
+    heading is the direction from the oldest buffered position to the newest one,
+    provided the tag moved at least `min_displacement` meters between them; shorter
+    moves are treated as jitter and keep the previous heading. Headings are smoothed
+    with an exponential moving average of their unit vectors, so wrapping around ±π
+    is handled. Each update takes constant time regardless of the history length.
+
+    Attributes:
+        min_displacement (float): The minimum distance in meters across the buffered
+                                  positions to update the heading
+        smoothing (float): The weight of the newest heading in the moving average;
+                           1 disables smoothing
+        history (int): The number of positions kept in the ring buffer
+    """
+
+    def __init__(
+        self,
+        min_displacement: float = DEFAULT_HEADING_MIN_DISPLACEMENT,
+        smoothing: float = DEFAULT_HEADING_SMOOTHING,
+        history: int = DEFAULT_HEADING_HISTORY,
+    ) -> None:
+        """HeadingEstimator Constructor
+
+        Args:
+            min_displacement (float, optional): The minimum distance in meters across
+                                                the buffered positions to update the
+                                                heading
+            smoothing (float, optional): The weight of the newest heading in the
+                                         moving average, in (0, 1]
+            history (int, optional): The number of positions kept in the ring buffer
+        """
+        if min_displacement < 0 or not 0 < smoothing <= 1 or history < 2:
+            raise ValueError(
+                "The minimum displacement must not be negative, the smoothing must be "
+                "in (0, 1] and the history must keep at least 2 positions"
+            )
+        self.min_displacement = min_displacement
+        self.smoothing = smoothing
+        self.history = history
+        self._positions = deque(maxlen=history)
+        self._cos = 0.0
+        self._sin = 0.0
+        self._yaw = math.inf
+
+    @property
+    def yaw(self) -> float:
+        """The current heading in radians, or infinity if it is still unknown."""
+        return self._yaw
+
+    def update(self, x: float, y: float) -> float:
+        """Add a new position of the tag and estimate its heading.
+
+        Args:
+            x (float): The X coordinate
+            y (float): The Y coordinate
+
+        Returns:
+            float: The heading in radians in [-π, π], or infinity if still unknown
+        """
+        self._positions.append((x, y))
+        x0, y0 = self._positions[0]
+        dx, dy = x - x0, y - y0
+        distance = math.hypot(dx, dy)
+        if distance == 0 or distance < self.min_displacement:
+            return self._yaw
+
+        cos, sin = dx / distance, dy / distance
+        if math.isinf(self._yaw):
+            self._cos, self._sin = cos, sin
+        else:
+            self._cos += self.smoothing * (cos - self._cos)
+            self._sin += self.smoothing * (sin - self._sin)
+        # Opposite headings may cancel out; keep the previous one until they don't
+        if self._cos or self._sin:
+            self._yaw = math.atan2(self._sin, self._cos)
+        return self._yaw
+
+    def reset(self) -> None:
+        """Forget the trajectory and the heading of the tag."""
+        self._positions.clear()
+        self._cos = 0.0
+        self._sin = 0.0
+        self._yaw = math.inf
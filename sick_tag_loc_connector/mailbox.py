@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import threading
+from dataclasses import dataclass
+
+# InOrbit
+from sick_tag_loc_connector.tracing import PoseTrace
+
+
+@dataclass(frozen=True)
+class PoseLetter:
+    """A pose handed over through a PoseMailbox.
+
+    Attributes:
+        seq (int): The sequence number of the pose, starting at 1
+        pose (dict): The keyword arguments for `RobotSession.publish_pose`
+        trace (PoseTrace | None): The latency trace of the pose, if any
+    """
+
+    seq: int
+    pose: dict
+    trace: PoseTrace | None = None
+
+
+class PoseMailbox:
+    """A single-slot, latest-wins handoff of the poses of a tag.
+
+    The stream thread puts every new pose in the mailbox and the execution loop takes
+    the newest one; a pose put before the previous one was taken replaces it and is
+    counted as overwritten. Every pose gets a sequence number, so the reader can tell
+    how many poses it missed. All the operations are atomic.
+
+    Attributes:
+        seq (int): The sequence number of the newest pose put (0 if none)
+        overwritten (int): The number of poses replaced before being taken
+        taken (int): The number of poses taken
+    """
+
+    def __init__(self) -> None:
+        """PoseMailbox Constructor"""
+        self.seq = 0
+        self.overwritten = 0
+        self.taken = 0
+        self._letter: PoseLetter | None = None
+        self._lock = threading.Lock()
+
+    def put(self, pose: dict, trace: PoseTrace | None = None) -> int:
+        """Put a new pose in the mailbox, replacing the one not taken yet, if any.
+
+        Args:
+            pose (dict): The keyword arguments for `RobotSession.publish_pose`
+            trace (PoseTrace | None, optional): The latency trace of the pose, if any
+
+        Returns:
+            int: The sequence number of the pose
+        """
+        with self._lock:
+            self.seq += 1
+            if self._letter is not None:
+                self.overwritten += 1
+            self._letter = PoseLetter(self.seq, pose, trace)
+            return self.seq
+
+    def take(self) -> PoseLetter | None:
+        """Take the newest pose out of the mailbox.
+
+        Returns:
+            PoseLetter | None: The newest pose, or None if no pose was put since the
+                               last one taken
+        """
+        with self._lock:
+            letter, self._letter = self._letter, None
+            if letter is not None:
+                self.taken += 1
+            return letter
+
+    def clear(self) -> None:
+        """Drop the pose not taken yet, if any, without counting it as overwritten."""
+        with self._lock:
+            self._letter = None
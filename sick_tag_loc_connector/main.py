@@ -6,11 +6,79 @@
 # Standard
 import argparse
 import logging
-from time import sleep
+import signal
+import threading
 
 # InOrbit
 from sick_tag_loc_connector.controller import SickTagLocMasterController
 from sick_tag_loc_connector.models import load_and_validate
+from sick_tag_loc_connector.supervisor import WorkerSupervisor
+
+
+# Signals that trigger a clean shutdown
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+class ShutdownSignals:
+    """Catches the shutdown signals, from the moment it is entered until it exits.
+
+    A signal received before `wait` is called is not lost, so it can be entered before
+    a slow start and checked once the start returns. It must be used from the main
+    thread.
+    """
+
+    def __init__(self) -> None:
+        """ShutdownSignals Constructor"""
+        self._shutdown = threading.Event()
+        self._received = []
+        self._previous = {}
+
+    def __enter__(self) -> "ShutdownSignals":
+        """Install the handlers of SHUTDOWN_SIGNALS."""
+        self._previous = {
+            signum: signal.signal(signum, self._on_signal)
+            for signum in SHUTDOWN_SIGNALS
+        }
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Restore the previous handlers."""
+        for signum, handler in self._previous.items():
+            signal.signal(signum, handler)
+        self._previous = {}
+
+    def wait(self) -> signal.Signals:
+        """Block until a shutdown signal is received, if it was not received yet.
+
+        The calling thread sleeps without using any CPU.
+
+        Returns:
+            signal.Signals: The first signal that was received
+        """
+        self._shutdown.wait()
+        return self._received[0]
+
+    def _on_signal(self, signum: int, _) -> None:
+        """Record a shutdown signal and release the waiters.
+
+        Args:
+            signum (int): The signal received
+        """
+        self._received.append(signal.Signals(signum))
+        self._shutdown.set()
+
+
+def wait_for_shutdown() -> signal.Signals:
+    """Block until a shutdown signal is received.
+
+    The calling thread sleeps without using any CPU until one of SHUTDOWN_SIGNALS is
+    delivered. This must be called from the main thread.
+
+    Returns:
+        signal.Signals: The signal that was received
+    """
+    with ShutdownSignals() as shutdown:
+        return shutdown.wait()
 
 
 def start():
@@ -59,16 +127,21 @@ def start():
         logger.error(f"'{config_file}' configuration file does not exist")
         exit(1)
 
-    controller = SickTagLocMasterController(sic_tag_loc_config)
-    controller.start()
+    if sic_tag_loc_config.connector_config.multiprocess:
+        # The tags are split across worker processes
+        controller = WorkerSupervisor(sic_tag_loc_config)
+    else:
+        controller = SickTagLocMasterController(sic_tag_loc_config)
 
-    try:
-        while True:
-            # Yield execution to another thread
-            sleep(0)
-    except KeyboardInterrupt:
-        logger.info("...exiting")
-        controller.stop()
+    # Starting many connectors takes a while, a signal received meanwhile is handled
+    # once they are started
+    with ShutdownSignals() as shutdown:
+        try:
+            controller.start()
+            received = shutdown.wait()
+            logger.info(f"{received.name} received...exiting")
+        finally:
+            controller.stop()
 
 
 if __name__ == "__main__":
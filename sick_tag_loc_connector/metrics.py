@@ -0,0 +1,683 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import logging
+import math
+import threading
+from bisect import bisect_left
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+# Third-party
+import numpy as np
+
+METRIC_COUNTER = "counter"
+METRIC_GAUGE = "gauge"
+METRIC_HISTOGRAM = "histogram"
+METRIC_SUMMARY = "summary"
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+# The number of recent values the summary quantiles are computed from
+DEFAULT_SUMMARY_WINDOW = 128
+METRICS_PATH = "/metrics"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# A sample of a metric: the name suffix, the labels and the value
+Sample = Tuple[str, Dict[str, str], float]
+
+
+class _ThreadCells:
+    """Values that every thread updates in its own cells.
+
+    Each thread only ever writes to the cells it owns, so updates don't need a lock
+    and never contend with other threads. Reading sums the cells of all the threads,
+    which is only done when the metrics are collected. The cells of threads that
+    ended are folded into the retired totals, so short-lived threads don't pile up.
+    """
+
+    def __init__(self, size: int) -> None:
+        """_ThreadCells Constructor
+
+        Args:
+            size (int): The number of values of each thread
+        """
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[Tuple[threading.Thread, list]] = []
+        # The totals of the threads that ended
+        self._retired = [0] * size
+        self._lock = threading.Lock()
+
+    def _new_cells(self) -> list:
+        """Create the cells of the calling thread, on its first update.
+
+        Updates look up `self._local.cells` directly and only call this method when
+        it doesn't exist yet, which saves a call on every update.
+
+        Returns:
+            list: The values owned by the calling thread
+        """
+        cells = self._local.cells = [0] * self._size
+        with self._lock:
+            self._retire()
+            self._cells.append((threading.current_thread(), cells))
+        return cells
+
+    def _retire(self) -> None:
+        """Fold the cells of the threads that ended; must be called with the lock."""
+        alive = []
+        for thread, cells in self._cells:
+            if thread.is_alive():
+                alive.append((thread, cells))
+            else:
+                # The thread can no longer update its cells
+                self._retired = [
+                    total + value for total, value in zip(self._retired, cells)
+                ]
+        self._cells = alive
+
+    def totals(self) -> List[float]:
+        """Get the sum of the values of all the threads.
+
+        Returns:
+            List[float]: The totals of each value
+        """
+        with self._lock:
+            self._retire()
+            cells = [cells for _, cells in self._cells]
+            retired = self._retired
+        return [sum(values) for values in zip(retired, *cells)]
+
+
+class CounterValue(_ThreadCells):
+    """A monotonically increasing value."""
+
+    def __init__(self) -> None:
+        """CounterValue Constructor"""
+        super().__init__(1)
+        self._function = None
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the counter.
+
+        Args:
+            amount (float, optional): The amount to add; must not be negative
+        """
+        try:
+            self._local.cells[0] += amount
+        except AttributeError:
+            self._new_cells()[0] += amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the counter from a function when collected, instead of counting.
+
+        Args:
+            function (Callable[[], float]): Returns the current count
+        """
+        self._function = function
+
+    def get(self) -> float:
+        """Get the current count.
+
+        Returns:
+            float: The count
+        """
+        if self._function:
+            return self._function()
+        return self.totals()[0]
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the samples of the value.
+
+        Yields:
+            Sample: The sample name suffix, labels and value
+        """
+        yield "", {}, self.get()
+
+
+class GaugeValue:
+    """A value that can go up and down."""
+
+    def __init__(self) -> None:
+        """GaugeValue Constructor"""
+        self._value = 0.0
+        self._function = None
+
+    def set(self, value: float) -> None:
+        """Set the gauge; assigning a value is atomic.
+
+        Args:
+            value (float): The new value
+        """
+        self._value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the gauge from a function when collected.
+
+        Args:
+            function (Callable[[], float]): Returns the current value
+        """
+        self._function = function
+
+    def get(self) -> float:
+        """Get the current value.
+
+        Returns:
+            float: The value
+        """
+        if self._function:
+            return self._function()
+        return self._value
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the samples of the value.
+
+        Yields:
+            Sample: The sample name suffix, labels and value
+        """
+        yield "", {}, self.get()
+
+
+class HistogramValue(_ThreadCells):
+    """A distribution of observed values, counted in buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """HistogramValue Constructor
+
+        Args:
+            buckets (Sequence[float], optional): The bucket upper bounds, in order
+        """
+        # One cell per bucket, plus the values above the last bound and the sum
+        super().__init__(len(buckets) + 2)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float) -> None:
+        """Count a value in its bucket.
+
+        Args:
+            value (float): The observed value
+        """
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._new_cells()
+        cells[bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the cumulative bucket counts, the sum and the count of the values.
+
+        Yields:
+            Sample: The sample name suffix, labels and value
+        """
+        totals = self.totals()
+        count = 0
+        for bound, bucket_count in zip(self.buckets, totals):
+            count += bucket_count
+            yield "_bucket", {"le": _format_value(bound)}, count
+        count += totals[-2]
+        yield "_bucket", {"le": "+Inf"}, count
+        yield "_sum", {}, totals[-1]
+        yield "_count", {}, count
+
+
+class SummaryValue(_ThreadCells):
+    """Quantiles of the most recent observed values, plus their sum and count.
+
+    The recent values are kept in a fixed size ring buffer and the quantiles are
+    only computed when collected. Concurrent observations may rarely land in the same
+    slot of the buffer, which drops a value from the window; the sum and count are
+    always exact.
+    """
+
+    def __init__(
+        self,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        window: int = DEFAULT_SUMMARY_WINDOW,
+    ) -> None:
+        """SummaryValue Constructor
+
+        Args:
+            quantiles (Sequence[float], optional): The quantiles to report
+            window (int, optional): The number of recent values kept
+        """
+        # The count and the sum
+        super().__init__(2)
+        self.quantiles = tuple(quantiles)
+        self._window = np.full(window, np.nan)
+        self._window_size = window
+        self._next = 0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the window.
+
+        Args:
+            value (float): The observed value
+        """
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._new_cells()
+        cells[0] += 1
+        cells[1] += value
+        index = self._next
+        self._next = (index + 1) % self._window_size
+        self._window[index] = value
+
+    def get_quantiles(self) -> Dict[float, float]:
+        """Get the quantiles of the values in the window.
+
+        Returns:
+            Dict[float, float]: The value of each quantile (NaN if nothing was
+                                observed yet)
+        """
+        values = self._window[~np.isnan(self._window)]
+        if not len(values):
+            return {quantile: math.nan for quantile in self.quantiles}
+        return dict(zip(self.quantiles, np.quantile(values, self.quantiles).tolist()))
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the quantiles, the sum and the count of the values.
+
+        Yields:
+            Sample: The sample name suffix, labels and value
+        """
+        count, total = self.totals()
+        for quantile, value in self.get_quantiles().items():
+            yield "", {"quantile": _format_value(quantile)}, value
+        yield "_sum", {}, total
+        yield "_count", {}, count
+
+
+class Metric:
+    """A named metric with optional labels.
+
+    A metric without labels is updated directly (i.e., `counter.inc()`); a metric
+    with labels is updated through the value of each label combination (i.e.,
+    `counter.labels("12").inc()`). Resolving the labels costs a dict lookup, so hot
+    paths should keep the value around.
+
+    Attributes:
+        name (str): The metric name
+        documentation (str): The help text of the metric
+        kind (str): The metric type ("counter", "gauge", "histogram" or "summary")
+        labelnames (Tuple[str]): The names of the labels
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Sequence[str] = (),
+        **kwargs,
+    ) -> None:
+        """Metric Constructor
+
+        Args:
+            name (str): The metric name
+            documentation (str): The help text of the metric
+            kind (str): The metric type ("counter", "gauge", "histogram" or
+                        "summary")
+            labelnames (Sequence[str], optional): The names of the labels
+            **kwargs: Arguments of the values (i.e., the histogram buckets)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self._value_class = {
+            METRIC_COUNTER: CounterValue,
+            METRIC_GAUGE: GaugeValue,
+            METRIC_HISTOGRAM: HistogramValue,
+            METRIC_SUMMARY: SummaryValue,
+        }[kind]
+        self._kwargs = kwargs
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._values[()] = self._value_class(**kwargs)
+
+    def labels(self, *values: str):
+        """Get the value of a label combination, creating it on first use.
+
+        Args:
+            *values (str): The label values, in the order of the label names
+
+        Returns:
+            The CounterValue, GaugeValue, HistogramValue or SummaryValue of the
+            labels
+
+        Raises:
+            ValueError: If the number of label values doesn't match the label names
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects the labels {self.labelnames}")
+        values = tuple(str(value) for value in values)
+        if (value := self._values.get(values)) is None:
+            with self._lock:
+                value = self._values.setdefault(
+                    values, self._value_class(**self._kwargs)
+                )
+        return value
+
+    def remove(self, *values: str) -> None:
+        """Stop exporting a label combination, dropping its value.
+
+        A value backed by a function is dropped along with the function, releasing
+        whatever the function references.
+
+        Args:
+            *values (str): The label values, in the order of the label names
+
+        Raises:
+            ValueError: If the number of label values doesn't match the label names
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects the labels {self.labelnames}")
+        with self._lock:
+            self._values.pop(tuple(str(value) for value in values), None)
+
+    def __getattr__(self, name: str):
+        # Metrics without labels are updated directly
+        if name.startswith("_") or self.labelnames:
+            raise AttributeError(name)
+        return getattr(self._values[()], name)
+
+    def samples(self) -> Iterator[Sample]:
+        """Get the samples of every label combination.
+
+        Yields:
+            Sample: The sample name, labels and value
+        """
+        with self._lock:
+            values = list(self._values.items())
+        for labelvalues, value in values:
+            labels = dict(zip(self.labelnames, labelvalues))
+            for suffix, extra, sample in value.samples():
+                yield f"{self.name}{suffix}", {**labels, **extra}, sample
+
+
+class MetricsRegistry:
+    """A collection of metrics rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        """MetricsRegistry Constructor"""
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Metric:
+        """Get or create a counter.
+
+        Args:
+            name (str): The metric name, usually ending in "_total"
+            documentation (str): The help text of the metric
+            labelnames (Sequence[str], optional): The names of the labels
+
+        Returns:
+            Metric: The counter
+        """
+        return self._register(name, documentation, METRIC_COUNTER, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Metric:
+        """Get or create a gauge.
+
+        Args:
+            name (str): The metric name
+            documentation (str): The help text of the metric
+            labelnames (Sequence[str], optional): The names of the labels
+
+        Returns:
+            Metric: The gauge
+        """
+        return self._register(name, documentation, METRIC_GAUGE, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Metric:
+        """Get or create a histogram.
+
+        Args:
+            name (str): The metric name
+            documentation (str): The help text of the metric
+            labelnames (Sequence[str], optional): The names of the labels
+            buckets (Sequence[float], optional): The bucket upper bounds, in order
+
+        Returns:
+            Metric: The histogram
+        """
+        return self._register(
+            name, documentation, METRIC_HISTOGRAM, labelnames, buckets=buckets
+        )
+
+    def summary(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        window: int = DEFAULT_SUMMARY_WINDOW,
+    ) -> Metric:
+        """Get or create a summary.
+
+        Args:
+            name (str): The metric name
+            documentation (str): The help text of the metric
+            labelnames (Sequence[str], optional): The names of the labels
+            quantiles (Sequence[float], optional): The quantiles to report
+            window (int, optional): The number of recent values the quantiles are
+                                    computed from
+
+        Returns:
+            Metric: The summary
+        """
+        return self._register(
+            name,
+            documentation,
+            METRIC_SUMMARY,
+            labelnames,
+            quantiles=quantiles,
+            window=window,
+        )
+
+    def get(self, name: str) -> Metric | None:
+        """Get a registered metric.
+
+        Args:
+            name (str): The metric name
+
+        Returns:
+            Metric | None: The metric, or None if it is not registered
+        """
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, with their help and type
+        """
+        lines = []
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    label_text = ",".join(
+                        f'{key}="{_escape(label)}"' for key, label in labels.items()
+                    )
+                    name = f"{name}{{{label_text}}}"
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(
+        self, name: str, documentation: str, kind: str, labelnames, **kwargs
+    ) -> Metric:
+        """Get a registered metric, or register it.
+
+        Args:
+            name (str): The metric name
+            documentation (str): The help text of the metric
+            kind (str): The metric type
+            labelnames (Sequence[str]): The names of the labels
+            **kwargs: Arguments of the values (i.e., the histogram buckets)
+
+        Returns:
+            Metric: The metric
+
+        Raises:
+            ValueError: If a different metric is registered with the same name
+        """
+        with self._lock:
+            if metric := self._metrics.get(name):
+                if metric.kind != kind or metric.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metric {name} is already registered")
+                return metric
+            metric = self._metrics[name] = Metric(
+                name, documentation, kind, labelnames, **kwargs
+            )
+            return metric
+
+
+class MetricsServer:
+    """Serves the metrics of a registry over HTTP for Prometheus to scrape.
+
+    The metrics are rendered on every request to the `/metrics` path, from a
+    background thread.
+
+    Attributes:
+        registry (MetricsRegistry): The metrics to serve
+        host (str): The host to listen on
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """MetricsServer Constructor
+
+        A call to start/stop should be made after initialization.
+
+        Args:
+            registry (MetricsRegistry): The metrics to serve
+            host (str, optional): The host to listen on
+            port (int, optional): The port to listen on (0 picks a free port)
+        """
+        self.logger = logging.getLogger(name=self.__class__.__name__)
+        self.registry = registry
+        self.host = host
+        self._port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        """The port the server listens on."""
+        return self._port
+
+    @property
+    def url(self) -> str:
+        """The URL of the metrics."""
+        return f"http://{self.host}:{self._port}{METRICS_PATH}"
+
+    def start(self) -> None:
+        """Start serving the metrics."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != METRICS_PATH:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                    return
+                body = registry.render().encode()
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Scrapes are too frequent to be logged
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self._port), Handler)
+        self._server.daemon_threads = True
+        self._port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=self.__class__.__name__, daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Serving metrics on {self.url}")
+
+    def stop(self) -> None:
+        """Stop serving the metrics."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as Prometheus expects it.
+
+    Args:
+        value (float): The value
+
+    Returns:
+        str: The formatted value
+    """
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value.
+
+    Args:
+        value (str): The label value
+
+    Returns:
+        str: The escaped value
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# The metrics of the connector internals
+REGISTRY = MetricsRegistry()
@@ -5,8 +5,10 @@
 
 # Standard
 import os
+from datetime import tzinfo
 from typing import Optional, List, Dict, Any
 from urllib.parse import urlunparse
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Third Party
 from inorbit_edge.robot import RobotFootprintSpec
@@ -15,12 +17,101 @@ from inorbit_connector.utils import read_yaml
 from pydantic import BaseModel, HttpUrl, field_validator, model_validator
 
 # InOrbit
-from sick_tag_loc_connector.api import REST_ENDPOINT
+from sick_tag_loc_connector.api import (
+    DEFAULT_PAGE_SIZE,
+    REST_ENDPOINT,
+    WEBSOCKET_ENGINES,
+    WEBSOCKET_ENGINE_THREAD,
+)
+from sick_tag_loc_connector.api.parsers import POSITION_PARSERS, PARSER_TARGETED
+from sick_tag_loc_connector.api.websocket import (
+    DEFAULT_OPEN_TIMEOUT,
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+    DEFAULT_RECONNECT_BACKOFF,
+    DEFAULT_RECONNECT_MAX_DELAY,
+)
+from sick_tag_loc_connector.calibration import FrameTransform, translation_matrix
+from sick_tag_loc_connector.deadband import Deadband
+from sick_tag_loc_connector.filters import (
+    DEFAULT_FILTER_ALPHA,
+    DEFAULT_FILTER_BETA,
+    DEFAULT_FILTER_MEASUREMENT_NOISE,
+    DEFAULT_FILTER_PROCESS_NOISE,
+    FILTER_ALPHA_BETA,
+    FILTER_KALMAN,
+    FILTER_NONE,
+    POSITION_FILTERS,
+    AlphaBetaFilter,
+    KalmanFilter,
+    PositionFilter,
+)
+from sick_tag_loc_connector.heading import (
+    DEFAULT_HEADING_HISTORY,
+    DEFAULT_HEADING_MIN_DISPLACEMENT,
+    DEFAULT_HEADING_SMOOTHING,
+    HeadingEstimator,
+)
+from sick_tag_loc_connector.publisher import (
+    DEFAULT_PUBLISH_MAX_RATE,
+    DEFAULT_PUBLISH_MAX_LATENCY,
+    PUBLISH_MODE_POLL,
+    PUBLISH_MODES,
+)
+from sick_tag_loc_connector.api.rest import (
+    DEFAULT_POOL_SIZE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
+)
 
 # Accepted/default values
 CONNECTOR_TYPE = "sick_tag_loc"
 DEFAULT_RTLS_REST_API_PORT = 8080
 DEFAULT_RTLS_WS_PORT = 80
+DEFAULT_RTLS_WS_POOL_SIZE = 1
+DEFAULT_RTLS_WS_ENGINE = WEBSOCKET_ENGINE_THREAD
+DEFAULT_MESSAGE_PARSER = PARSER_TARGETED
+DEFAULT_CONNECTOR_CONCURRENCY = 16
+DEFAULT_CONNECTOR_TIMEOUT = 30.0
+DEFAULT_WORKER_RESTART_DELAY = 1.0
+DEFAULT_WORKER_HEARTBEAT_TIMEOUT = 30.0
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_RTLS_TIMEZONE = "UTC"
+
+
+class DeadbandSpec(BaseModel):
+    """Per-tag overrides of the publish deadband.
+
+    Attributes:
+        distance (float | None, optional): The minimum distance in meters to publish a
+            pose right away; defaults to `publish_deadband_distance`
+        time (float | None, optional): The seconds after which a changed pose is
+            published regardless of the distance; defaults to `publish_deadband_time`
+    """
+
+    distance: Optional[float] = None
+    time: Optional[float] = None
+
+    # noinspection PyMethodParameters
+    @field_validator("distance", "time")
+    def non_negative_validation(cls, value: float | None) -> float | None:
+        """Validates a value is not negative.
+
+        Args:
+            value (float | None): The value to validate
+
+        Returns:
+            float | None: The validated value
+
+        Raises:
+            ValueError: If the value is less than zero
+        """
+
+        if value is not None and value < 0:
+            raise ValueError("Must not be negative")
+        return value
 
 
 class SickTagLocConfigModel(BaseModel):
@@ -33,9 +124,112 @@ class SickTagLocConfigModel(BaseModel):
         sick_rtls_http_server_address (HttpUrl): The URL of the SICK RTLS server
         sick_rtls_rest_api_port (int, optional): The port SICK RTLS REST API
         sick_rtls_websocket_port (int, optional): The port SICK RTLS WebSocket
+        sick_rtls_websocket_pool_size (int, optional): The number of WebSocket
+            connections shared by all the tag streams
+        sick_rtls_websocket_engine (str, optional): The WebSocket client
+            implementation, either "thread" (one thread per connection) or "asyncio"
+            (all connections driven by one event loop)
+        sick_rtls_websocket_open_timeout (float, optional): Seconds to wait for a
+            WebSocket connection to open
+        sick_rtls_websocket_reconnect (bool, optional): If lost WebSocket connections
+            are reopened (and their feeds subscribed again)
+        sick_rtls_websocket_reconnect_backoff (float, optional): The upper bound in
+            seconds of the random delay before the first reconnect attempt, doubled
+            on every failed attempt
+        sick_rtls_websocket_reconnect_max_delay (float, optional): The upper bound in
+            seconds of the delay between reconnect attempts
+        sick_rtls_websocket_ping_interval (float, optional): Seconds between the
+            keepalive pings of every WebSocket connection (0 disables them)
+        sick_rtls_websocket_ping_timeout (float, optional): Seconds to wait for the
+            pong of a keepalive ping before dropping the connection as dead; must be
+            shorter than the ping interval
+        sick_rtls_record_path (str | None, optional): The file every stream message
+            received is recorded to, for replaying it later (disabled if not set)
+        sick_rtls_record_compress (bool, optional): If the recording is gzip
+            compressed
         sick_rtls_api_key (str | None, optional): The SICK RTLS API key
+        sick_rtls_timezone (str, optional): The IANA timezone of the SICK RTLS
+            datastream timestamps (i.e., "America/Montevideo")
+        sick_rtls_http_pool_size (int, optional): The number of REST API connections
+            kept alive
+        sick_rtls_http_connect_timeout (float, optional): Seconds to wait for a REST
+            API connection
+        sick_rtls_http_read_timeout (float, optional): Seconds to wait for a REST API
+            response
+        sick_rtls_http_max_retries (int, optional): The maximum number of retries of
+            failed REST API requests
+        sick_rtls_http_backoff_factor (float, optional): The base delay in seconds
+            between REST API retries, doubled on every attempt
+        sick_rtls_page_size (int, optional): The number of tags requested per page
+        sick_rtls_page_prefetch (int, optional): The number of pages of tags requested
+            concurrently ahead of the page being processed
+        tag_refresh_interval (float, optional): Seconds between reloads of the tag
+            list to connect new tags and disconnect removed ones (0 disables it)
+        shard_index (int, optional): The shard of the tags connected by this instance,
+            from 0 to `shard_count` - 1
+        shard_count (int, optional): The number of connector instances the tags are
+            split across; each tag is placed in a shard by consistent hashing of its
+            ID, so adding an instance only moves the tags the new one takes over
+        connector_concurrency (int, optional): The maximum number of connectors started
+            or stopped at the same time
+        connector_timeout (float, optional): Seconds to wait for a connector to start
+            or stop before reporting it as timed out
+        multiprocess (bool, optional): If the tags are split across several worker
+            processes, so they don't contend for a single interpreter lock
+        worker_processes (int | None, optional): The number of worker processes;
+            defaults to the number of CPU cores
+        worker_restart_delay (float, optional): Seconds to wait before restarting a
+            worker process that exited
+        worker_heartbeat_timeout (float, optional): Seconds without a heartbeat after
+            which a worker process is considered hung and restarted (a new worker is
+            given `connector_timeout` seconds more, to start its connectors)
+        publish_mode (str, optional): When poses are published, either "poll" (on
+            every execution loop tick, at `update_freq`) or "event" (as soon as a new
+            pose arrives, at most `publish_max_rate` times per second)
+        publish_batching (bool, optional): If the poses of all tags are coalesced and
+            published together by a shared publisher instead of by each connector
+        publish_max_rate (float, optional): The maximum number of batched publishes
+            per second, or of publishes of each tag in the "event" publish mode
+        publish_max_latency (float, optional): The maximum number of seconds a pose
+            waits to be published when batching
+        publish_deadband_distance (float, optional): The minimum distance in meters a
+            tag must move for its pose to be published right away (0 publishes every
+            change)
+        publish_deadband_time (float, optional): The seconds after which a changed
+            pose is published regardless of the distance (0 disables it)
+        tag_deadbands (Dict[str, DeadbandSpec], optional): Deadband overrides by tag
+            ID
+        position_filter (str, optional): The smoothing filter applied to the positions
+            before publishing them, either "none", "alpha_beta" or "kalman"
+        filter_alpha (float, optional): The alpha-beta filter position gain
+        filter_beta (float, optional): The alpha-beta filter velocity gain
+        filter_process_noise (float, optional): The Kalman filter standard deviation
+            of the tag acceleration in m/s²
+        filter_measurement_noise (float, optional): The Kalman filter standard
+            deviation of the positions in meters
+        heading_from_motion (bool, optional): If the heading (yaw) of the tags is
+            estimated from their recent trajectory instead of being left unknown
+        heading_min_displacement (float, optional): The minimum distance in meters a
+            tag must move across its recent positions to update its heading
+        heading_smoothing (float, optional): The weight of the newest heading in the
+            moving average of headings (1 disables smoothing)
+        heading_history (int, optional): The number of recent positions of each tag
+            used to estimate its heading
+        metrics_port (int | None, optional): The port the Prometheus metrics of the
+            connector internals are served on (disabled if not set)
+        metrics_host (str, optional): The host the metrics are served on
+        latency_tracing (bool, optional): If the latency percentiles of the poses of
+            each tag are recorded, from the SICK timestamp to the InOrbit publish
+        publish_source_timestamp (bool, optional): If poses are published with their
+            SICK timestamp instead of the time they are published
+        message_parser (str, optional): How positions are extracted from stream
+            messages, either "targeted" (only the position datastreams are decoded) or
+            "json" (the whole message is decoded)
         translation_x (float, optional): The coordinate translation in the X dimension
         translation_y (float, optional): The coordinate translation in the Y dimension
+        transform_matrix (List[List[float]] | None, optional): The 2x3 affine matrix
+            mapping SICK positions to InOrbit, as fitted by `scripts/transform.py`;
+            takes precedence over the translation settings
         footprints (Dict[str, RobotFootprintSpec], optional): List of defined
             footprints for tags. Should include the footprint and radius.
         tag_footprints (Dict[str, str]): Mapping of tag IDs to `RobotFootprintSpec`
@@ -45,33 +239,354 @@ class SickTagLocConfigModel(BaseModel):
     sick_rtls_http_server_address: HttpUrl
     sick_rtls_rest_api_port: int = DEFAULT_RTLS_REST_API_PORT
     sick_rtls_websocket_port: int = DEFAULT_RTLS_WS_PORT
+    sick_rtls_websocket_pool_size: int = DEFAULT_RTLS_WS_POOL_SIZE
+    sick_rtls_websocket_engine: str = DEFAULT_RTLS_WS_ENGINE
+    sick_rtls_websocket_open_timeout: float = DEFAULT_OPEN_TIMEOUT
+    sick_rtls_websocket_reconnect: bool = True
+    sick_rtls_websocket_reconnect_backoff: float = DEFAULT_RECONNECT_BACKOFF
+    sick_rtls_websocket_reconnect_max_delay: float = DEFAULT_RECONNECT_MAX_DELAY
+    sick_rtls_websocket_ping_interval: float = DEFAULT_PING_INTERVAL
+    sick_rtls_websocket_ping_timeout: float = DEFAULT_PING_TIMEOUT
+    sick_rtls_record_path: Optional[str] = None
+    sick_rtls_record_compress: bool = False
     sick_rtls_api_key: str = os.getenv("SICK_RTLS_API_KEY")
+    sick_rtls_timezone: str = DEFAULT_RTLS_TIMEZONE
+    sick_rtls_http_pool_size: int = DEFAULT_POOL_SIZE
+    sick_rtls_http_connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    sick_rtls_http_read_timeout: float = DEFAULT_READ_TIMEOUT
+    sick_rtls_http_max_retries: int = DEFAULT_MAX_RETRIES
+    sick_rtls_http_backoff_factor: float = DEFAULT_BACKOFF_FACTOR
+    sick_rtls_page_size: int = DEFAULT_PAGE_SIZE
+    sick_rtls_page_prefetch: int = 0
+    tag_refresh_interval: float = 0.0
+    shard_index: int = 0
+    shard_count: int = 1
+    connector_concurrency: int = DEFAULT_CONNECTOR_CONCURRENCY
+    connector_timeout: float = DEFAULT_CONNECTOR_TIMEOUT
+    multiprocess: bool = False
+    worker_processes: Optional[int] = None
+    worker_restart_delay: float = DEFAULT_WORKER_RESTART_DELAY
+    worker_heartbeat_timeout: float = DEFAULT_WORKER_HEARTBEAT_TIMEOUT
+    publish_mode: str = PUBLISH_MODE_POLL
+    publish_batching: bool = False
+    publish_max_rate: float = DEFAULT_PUBLISH_MAX_RATE
+    publish_max_latency: float = DEFAULT_PUBLISH_MAX_LATENCY
+    publish_deadband_distance: float = 0.0
+    publish_deadband_time: float = 0.0
+    tag_deadbands: Dict[str, DeadbandSpec] = {}
+    position_filter: str = FILTER_NONE
+    filter_alpha: float = DEFAULT_FILTER_ALPHA
+    filter_beta: float = DEFAULT_FILTER_BETA
+    filter_process_noise: float = DEFAULT_FILTER_PROCESS_NOISE
+    filter_measurement_noise: float = DEFAULT_FILTER_MEASUREMENT_NOISE
+    heading_from_motion: bool = False
+    heading_min_displacement: float = DEFAULT_HEADING_MIN_DISPLACEMENT
+    heading_smoothing: float = DEFAULT_HEADING_SMOOTHING
+    heading_history: int = DEFAULT_HEADING_HISTORY
+    metrics_port: Optional[int] = None
+    metrics_host: str = DEFAULT_METRICS_HOST
+    latency_tracing: bool = False
+    publish_source_timestamp: bool = False
+    message_parser: str = DEFAULT_MESSAGE_PARSER
     translation_x: float = 0.0
     translation_y: float = 0.0
+    transform_matrix: Optional[List[List[float]]] = None
     footprints: Optional[List[Dict[str, Any]]] = {}
     tag_footprints: Dict[str, RobotFootprintSpec] = {}
 
     # noinspection PyMethodParameters
-    @field_validator("sick_rtls_rest_api_port", "sick_rtls_websocket_port")
-    def port_validation(cls, value: int) -> int:
-        """Validates the SICK API ports.
+    @field_validator(
+        "sick_rtls_rest_api_port", "sick_rtls_websocket_port", "metrics_port"
+    )
+    def port_validation(cls, value: int | None) -> int | None:
+        """Validates the SICK API and metrics ports.
 
         Validates the port is greater than 0 and less than 65536.
 
         Args:
-            value (int): The SICK API port to validate
+            value (int | None): The port to validate
 
         Returns:
-            str: The validated SICK API port
+            str: The validated port
 
         Raises:
-            ValueError: If the SICK API port
+            ValueError: If the port is out of range
         """
 
-        if value < 1 or value > 65535:
+        if value is not None and (value < 1 or value > 65535):
             raise ValueError("Invalid port")
         return value
 
+    # noinspection PyMethodParameters
+    @field_validator(
+        "sick_rtls_websocket_pool_size",
+        "sick_rtls_websocket_open_timeout",
+        "sick_rtls_websocket_reconnect_backoff",
+        "sick_rtls_websocket_reconnect_max_delay",
+        "sick_rtls_websocket_ping_timeout",
+        "sick_rtls_http_pool_size",
+        "sick_rtls_http_connect_timeout",
+        "sick_rtls_http_read_timeout",
+        "sick_rtls_page_size",
+        "shard_count",
+        "connector_concurrency",
+        "connector_timeout",
+        "worker_heartbeat_timeout",
+        "publish_max_rate",
+        "publish_max_latency",
+        "filter_process_noise",
+        "filter_measurement_noise",
+    )
+    def positive_validation(cls, value: int | float) -> int | float:
+        """Validates a value is positive and non-zero.
+
+        Args:
+            value (int | float): The value to validate
+
+        Returns:
+            int | float: The validated value
+
+        Raises:
+            ValueError: If the value is less than or equal to zero
+        """
+
+        if value <= 0:
+            raise ValueError("Must be positive and non-zero")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator(
+        "sick_rtls_websocket_ping_interval",
+        "sick_rtls_http_max_retries",
+        "sick_rtls_http_backoff_factor",
+        "sick_rtls_page_prefetch",
+        "tag_refresh_interval",
+        "shard_index",
+        "worker_restart_delay",
+        "publish_deadband_distance",
+        "publish_deadband_time",
+        "heading_min_displacement",
+    )
+    def non_negative_validation(cls, value: int | float) -> int | float:
+        """Validates a value is not negative.
+
+        Args:
+            value (int | float): The value to validate
+
+        Returns:
+            int | float: The validated value
+
+        Raises:
+            ValueError: If the value is less than zero
+        """
+
+        if value < 0:
+            raise ValueError("Must not be negative")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("worker_processes")
+    def worker_processes_validation(cls, value: int | None) -> int | None:
+        """Validates the number of worker processes, if set, is at least 1.
+
+        Args:
+            value (int | None): The number of worker processes to validate
+
+        Returns:
+            int | None: The validated number of worker processes
+
+        Raises:
+            ValueError: If the number of worker processes is less than 1
+        """
+
+        if value is not None and value < 1:
+            raise ValueError("Must be at least 1")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("sick_rtls_websocket_engine")
+    def websocket_engine_validation(cls, value: str) -> str:
+        """Validates the WebSocket engine is a known implementation.
+
+        Args:
+            value (str): The WebSocket engine to validate
+
+        Returns:
+            str: The validated WebSocket engine
+
+        Raises:
+            ValueError: If the WebSocket engine is not supported
+        """
+
+        if value not in WEBSOCKET_ENGINES:
+            raise ValueError(
+                f"Invalid WebSocket engine, expected one of {list(WEBSOCKET_ENGINES)}"
+            )
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("message_parser")
+    def message_parser_validation(cls, value: str) -> str:
+        """Validates the message parser is a known implementation.
+
+        Args:
+            value (str): The message parser to validate
+
+        Returns:
+            str: The validated message parser
+
+        Raises:
+            ValueError: If the message parser is not supported
+        """
+
+        if value not in POSITION_PARSERS:
+            raise ValueError(
+                f"Invalid message parser, expected one of {list(POSITION_PARSERS)}"
+            )
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("sick_rtls_timezone")
+    def timezone_validation(cls, value: str) -> str:
+        """Validates the timezone is a known IANA timezone.
+
+        Args:
+            value (str): The timezone to validate
+
+        Returns:
+            str: The validated timezone
+
+        Raises:
+            ValueError: If the timezone is not known
+        """
+
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone '{value}'")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("publish_mode")
+    def publish_mode_validation(cls, value: str) -> str:
+        """Validates the publish mode is a known mode.
+
+        Args:
+            value (str): The publish mode to validate
+
+        Returns:
+            str: The validated publish mode
+
+        Raises:
+            ValueError: If the publish mode is not supported
+        """
+
+        if value not in PUBLISH_MODES:
+            raise ValueError(
+                f"Invalid publish mode, expected one of {list(PUBLISH_MODES)}"
+            )
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("position_filter")
+    def position_filter_validation(cls, value: str) -> str:
+        """Validates the position filter is a known implementation.
+
+        Args:
+            value (str): The position filter to validate
+
+        Returns:
+            str: The validated position filter
+
+        Raises:
+            ValueError: If the position filter is not supported
+        """
+
+        filters = [FILTER_NONE, *POSITION_FILTERS]
+        if value not in filters:
+            raise ValueError(f"Invalid position filter, expected one of {filters}")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("filter_alpha", "heading_smoothing")
+    def unit_interval_validation(cls, value: float) -> float:
+        """Validates a weight is in (0, 1].
+
+        This is used for the alpha-beta filter position gain and the heading smoothing.
+
+        Args:
+            value (float): The weight to validate
+
+        Returns:
+            float: The validated weight
+
+        Raises:
+            ValueError: If the weight is not in (0, 1]
+        """
+
+        if not 0 < value <= 1:
+            raise ValueError("Must be greater than 0 and at most 1")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("filter_beta")
+    def filter_beta_validation(cls, value: float) -> float:
+        """Validates the alpha-beta filter velocity gain.
+
+        Args:
+            value (float): The velocity gain to validate
+
+        Returns:
+            float: The validated velocity gain
+
+        Raises:
+            ValueError: If the velocity gain is not in [0, 2)
+        """
+
+        if not 0 <= value < 2:
+            raise ValueError("Must be at least 0 and less than 2")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("heading_history")
+    def heading_history_validation(cls, value: int) -> int:
+        """Validates the number of positions used to estimate the heading.
+
+        Args:
+            value (int): The number of positions to validate
+
+        Returns:
+            int: The validated number of positions
+
+        Raises:
+            ValueError: If fewer than 2 positions are used
+        """
+
+        if value < 2:
+            raise ValueError("Must be at least 2")
+        return value
+
+    # noinspection PyMethodParameters
+    @field_validator("transform_matrix")
+    def transform_matrix_validation(
+        cls, value: List[List[float]] | None
+    ) -> List[List[float]] | None:
+        """Validates the transform matrix is a 2x3 affine matrix.
+
+        Args:
+            value (List[List[float]] | None): The transform matrix to validate
+
+        Returns:
+            List[List[float]] | None: The validated transform matrix
+
+        Raises:
+            ValueError: If the transform matrix does not have 2 rows of 3 values
+        """
+
+        if value is not None and (len(value) != 2 or any(len(r) != 3 for r in value)):
+            raise ValueError("Must be a 2x3 matrix")
+        return value
+
     # noinspection PyMethodParameters
     @field_validator("sick_rtls_api_key")
     def check_whitespace(cls, value: str) -> str:
@@ -132,6 +647,41 @@ class SickTagLocConfigModel(BaseModel):
 
         return data
 
+    @model_validator(mode="after")
+    def check_shard_index(self) -> "SickTagLocConfigModel":
+        """Validates the shard index is one of the shards.
+
+        Returns:
+            SickTagLocConfigModel: The validated model
+
+        Raises:
+            ValueError: If the shard index is not less than the shard count
+        """
+
+        if self.shard_index >= self.shard_count:
+            raise ValueError("The shard index must be less than the shard count")
+        return self
+
+    @model_validator(mode="after")
+    def check_ping_timeout(self) -> "SickTagLocConfigModel":
+        """Validates the WebSocket ping timeout is shorter than the ping interval.
+
+        Returns:
+            SickTagLocConfigModel: The validated model
+
+        Raises:
+            ValueError: If keepalive pings are enabled and the ping timeout is not
+                        shorter than the ping interval
+        """
+
+        if (
+            self.sick_rtls_websocket_ping_interval
+            and self.sick_rtls_websocket_ping_timeout
+            >= self.sick_rtls_websocket_ping_interval
+        ):
+            raise ValueError("The ping timeout must be shorter than the ping interval")
+        return self
+
     def get_rest_api_url(self):
         """Returns the REST API URL for the Sick RTLS system.
 
@@ -149,6 +699,96 @@ class SickTagLocConfigModel(BaseModel):
         components = (scheme, netloc, url, "", "", "")
         return urlunparse(components)
 
+    def get_deadband(self, tag_id: str) -> Deadband:
+        """Returns the publish deadband of a tag.
+
+        The global deadband values are used unless overridden for the tag.
+
+        Args:
+            tag_id (str): The ID of the tag
+
+        Returns:
+            A new Deadband for the tag
+        """
+        spec = self.tag_deadbands.get(tag_id, DeadbandSpec())
+        distance = spec.distance
+        if distance is None:
+            distance = self.publish_deadband_distance
+        time = spec.time
+        if time is None:
+            time = self.publish_deadband_time
+        return Deadband(distance, time)
+
+    def get_position_filter(self) -> PositionFilter | None:
+        """Returns a new position filter bank for the configured filter.
+
+        Returns:
+            The PositionFilter shared by all tags, or None if filtering is disabled
+        """
+        if self.position_filter == FILTER_ALPHA_BETA:
+            return AlphaBetaFilter(self.filter_alpha, self.filter_beta)
+        if self.position_filter == FILTER_KALMAN:
+            return KalmanFilter(
+                self.filter_process_noise, self.filter_measurement_noise
+            )
+        return None
+
+    def get_heading_estimator(self) -> HeadingEstimator | None:
+        """Returns a new heading estimator for a tag.
+
+        Returns:
+            The HeadingEstimator of the tag, or None if the heading is not estimated
+        """
+        if not self.heading_from_motion:
+            return None
+        return HeadingEstimator(
+            self.heading_min_displacement, self.heading_smoothing, self.heading_history
+        )
+
+    def get_worker_processes(self) -> int:
+        """Returns the number of worker processes to split the tags across.
+
+        Returns:
+            int: The configured number of worker processes, or the number of CPU cores
+        """
+        return self.worker_processes or os.cpu_count() or 1
+
+    def get_timezone(self) -> tzinfo:
+        """Returns the timezone of the SICK RTLS timestamps.
+
+        Returns:
+            The tzinfo of the configured timezone
+        """
+        return ZoneInfo(self.sick_rtls_timezone)
+
+    def get_transform_matrix(self) -> List[List[float]]:
+        """Returns the transform from SICK to InOrbit coordinates.
+
+        If no transform matrix is configured, it is built from the translation.
+
+        Returns:
+            The 2x3 affine transform matrix
+        """
+        if self.transform_matrix is not None:
+            return self.transform_matrix
+        return translation_matrix(self.translation_x, self.translation_y)
+
+    def get_frame_transform(self) -> FrameTransform:
+        """Returns the transform from SICK to InOrbit coordinates, ready to apply.
+
+        Returns:
+            The FrameTransform of the configured transform matrix
+        """
+        return FrameTransform(self.get_transform_matrix())
+
+    def get_websocket_client_class(self):
+        """Returns the WebSocket client implementation for the configured engine.
+
+        Returns:
+            The WebSocketClient (sub)class to instantiate
+        """
+        return WEBSOCKET_ENGINES[self.sick_rtls_websocket_engine]
+
     def get_websocket_url(self):
         """Returns the REST API URL for the Sick RTLS system.
 
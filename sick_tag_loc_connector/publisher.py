@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import heapq
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+
+# Third-party
+from inorbit_edge.robot import RobotSession
+
+# InOrbit
+from sick_tag_loc_connector.deadband import Deadband
+from sick_tag_loc_connector.metrics import REGISTRY
+from sick_tag_loc_connector.tracing import PoseTrace, publish_pose
+
+DEFAULT_PUBLISH_MAX_RATE = 10.0
+DEFAULT_PUBLISH_MAX_LATENCY = 0.2
+# When connectors publish their poses: on every execution loop tick (at `update_freq`)
+# or as soon as a new pose arrives (at most `publish_max_rate` times per second)
+PUBLISH_MODE_POLL = "poll"
+PUBLISH_MODE_EVENT = "event"
+PUBLISH_MODES = (PUBLISH_MODE_POLL, PUBLISH_MODE_EVENT)
+
+# Metrics, shared by the connectors that publish on their own
+POSES_PUBLISHED = REGISTRY.counter("sick_poses_published_total", "Poses published")
+PUBLISH_FAILURES = REGISTRY.counter(
+    "sick_publish_failures_total", "Poses that failed to be published"
+)
+POSES_COALESCED = REGISTRY.counter(
+    "sick_publish_coalesced_total",
+    "Poses replaced by a newer pose of the same tag before being published",
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "sick_publish_queue_depth", "Poses waiting for the next batched publish"
+)
+FLUSH_DURATION = REGISTRY.histogram(
+    "sick_publish_flush_duration_seconds", "Time spent publishing each batch of poses"
+)
+
+
+class PosePublisher:
+    """Shared publisher stage for the poses of many tags.
+
+    Instead of every connector publishing its pose on its own schedule, connectors
+    submit poses to the PosePublisher, which keeps only the latest pose of each tag
+    and flushes all of them together from a single thread. Flushes happen at most
+    `max_rate` times per second, and a submitted pose is never held back for longer
+    than `max_latency` seconds (the latency bound wins over the rate limit). Poses that
+    did not change since they were last published are skipped.
+
+    Poses submitted with the deadband of their tag are only queued if it lets them
+    through. The latest pose it held back is published once the time deadband is up,
+    unless a newer pose of the tag is queued first.
+
+    Attributes:
+        max_rate (float): The maximum number of flushes per second
+        max_latency (float): The maximum number of seconds a pose waits to be flushed
+        submitted (int): The number of poses submitted
+        coalesced (int): The number of poses replaced by a newer one before a flush
+        published (int): The number of poses published
+        flushes (int): The number of flushes that published at least one pose
+    """
+
+    def __init__(
+        self,
+        max_rate: float = DEFAULT_PUBLISH_MAX_RATE,
+        max_latency: float = DEFAULT_PUBLISH_MAX_LATENCY,
+    ) -> None:
+        """PosePublisher Constructor
+
+        A call to start/stop should be made after initialization.
+
+        Args:
+            max_rate (float, optional): The maximum number of flushes per second
+            max_latency (float, optional): The maximum number of seconds a pose waits
+                                           to be flushed
+        """
+        if max_rate <= 0 or max_latency <= 0:
+            raise ValueError("The maximum rate and latency must be positive")
+
+        self.logger = logging.getLogger(name=self.__class__.__name__)
+        self.max_rate = max_rate
+        self.max_latency = max_latency
+        self.submitted = 0
+        self.coalesced = 0
+        self.published = 0
+        self.flushes = 0
+
+        self._pending: Dict[str, Tuple[RobotSession, dict, PoseTrace | None]] = {}
+        # The latest pose of each tag held back by its deadband, with when it is due
+        self._held: Dict[
+            str, Tuple[float, RobotSession, dict, PoseTrace | None, Deadband]
+        ] = {}
+        # When the held-back poses are due, by tag; entries of replaced poses are
+        # skipped when they come up
+        self._held_due: List[Tuple[float, str]] = []
+        self._last_published: Dict[str, dict] = {}
+        self._first_pending_at = 0.0
+        self._last_flush_at = 0.0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self) -> None:
+        """Start flushing submitted poses in the background."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name=self.__class__.__name__, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background flushes, publishing the poses still pending."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def submit(
+        self,
+        key: str,
+        session: RobotSession,
+        pose: dict,
+        trace: PoseTrace | None = None,
+        deadband: Deadband | None = None,
+    ) -> None:
+        """Submit the latest pose of a tag.
+
+        A pose still pending for the same tag is replaced.
+
+        Args:
+            key (str): The ID of the tag the pose belongs to
+            session (RobotSession): The InOrbit session to publish the pose through
+            pose (dict): The keyword arguments for `RobotSession.publish_pose`
+            trace (PoseTrace | None, optional): The latency trace of the pose, if any
+            deadband (Deadband | None, optional): The deadband of the tag, checked
+                                                  with the lock held
+        """
+        with self._condition:
+            self.submitted += 1
+            if deadband is None or deadband.check(pose):
+                self._held.pop(key, None)
+                self._enqueue(key, session, pose, trace)
+            else:
+                self._hold(key, session, pose, trace, deadband)
+
+    def discard(self, key: str) -> None:
+        """Drop the pending and last published poses of a tag.
+
+        Args:
+            key (str): The ID of the tag whose poses are dropped
+        """
+        with self._condition:
+            self._pending.pop(key, None)
+            self._held.pop(key, None)
+            self._last_published.pop(key, None)
+            QUEUE_DEPTH.set(len(self._pending))
+
+    def flush(self) -> int:
+        """Publish every pending pose right away.
+
+        Returns:
+            int: The number of poses published
+        """
+        with self._condition:
+            batch, self._pending = self._pending, {}
+            self._last_flush_at = time.monotonic()
+            QUEUE_DEPTH.set(0)
+
+        start = time.perf_counter()
+        published = 0
+        for key, (session, pose, trace) in batch.items():
+            if self._last_published.get(key) == pose:
+                continue
+            try:
+                publish_pose(session, pose, trace)
+            except Exception as e:
+                PUBLISH_FAILURES.inc()
+                self.logger.error(f"Failed to publish the pose of {key}: {e}")
+                continue
+            self._last_published[key] = pose
+            published += 1
+
+        if published:
+            self.published += published
+            self.flushes += 1
+            POSES_PUBLISHED.inc(published)
+            FLUSH_DURATION.observe(time.perf_counter() - start)
+        return published
+
+    def _enqueue(
+        self,
+        key: str,
+        session: RobotSession,
+        pose: dict,
+        trace: PoseTrace | None,
+    ) -> None:
+        """Queue a pose for the next flush; must be called with the lock held.
+
+        Args:
+            key (str): The ID of the tag the pose belongs to
+            session (RobotSession): The InOrbit session to publish the pose through
+            pose (dict): The keyword arguments for `RobotSession.publish_pose`
+            trace (PoseTrace | None): The latency trace of the pose, if any
+        """
+        if not self._pending:
+            self._first_pending_at = time.monotonic()
+            self._condition.notify()
+        elif key in self._pending:
+            self.coalesced += 1
+            POSES_COALESCED.inc()
+        self._pending[key] = (session, pose, trace)
+        QUEUE_DEPTH.set(len(self._pending))
+
+    def _hold(
+        self,
+        key: str,
+        session: RobotSession,
+        pose: dict,
+        trace: PoseTrace | None,
+        deadband: Deadband,
+    ) -> None:
+        """Hold back a pose rejected by the deadband; must be called with the lock held.
+
+        Args:
+            key (str): The ID of the tag the pose belongs to
+            session (RobotSession): The InOrbit session to publish the pose through
+            pose (dict): The keyword arguments for `RobotSession.publish_pose`
+            trace (PoseTrace | None): The latency trace of the pose, if any
+            deadband (Deadband): The deadband of the tag
+        """
+        now = time.monotonic()
+        if (retry := deadband.retry_after(now)) is None:
+            # Only the distance counts, the pose is dropped
+            return
+        due = now + retry
+        held = self._held.get(key)
+        self._held[key] = (due, session, pose, trace, deadband)
+        if held is None or held[0] != due:
+            heapq.heappush(self._held_due, (due, key))
+            self._condition.notify()
+
+    def _release_held(self, now: float) -> float | None:
+        """Queue the held-back poses that are due; must be called with the lock held.
+
+        Args:
+            now (float): The current time.monotonic() time
+
+        Returns:
+            float | None: The time.monotonic() time the next held-back pose is due, or
+                          None if no pose is held back
+        """
+        while self._held_due:
+            due, key = self._held_due[0]
+            held = self._held.get(key)
+            if held is not None and held[0] == due and due > now:
+                return due
+            heapq.heappop(self._held_due)
+            if held is None or held[0] != due:
+                # Replaced or discarded since
+                continue
+            del self._held[key]
+            _, session, pose, trace, deadband = held
+            # Still rejected if it is the pose last published
+            if deadband.check(pose, now):
+                self._enqueue(key, session, pose, trace)
+        return None
+
+    def _next_flush_at(self) -> float:
+        """Get when the pending poses are due, honoring the rate and latency bounds.
+
+        Must be called with the lock held and poses pending.
+
+        Returns:
+            float: The time.monotonic() time of the next flush
+        """
+        rate_limited = max(
+            self._last_flush_at + 1.0 / self.max_rate, self._first_pending_at
+        )
+        return min(rate_limited, self._first_pending_at + self.max_latency)
+
+    def _run(self) -> None:
+        """Flush the pending poses until the publisher is stopped."""
+        while True:
+            with self._condition:
+                while self._running:
+                    now = time.monotonic()
+                    wake_at = self._release_held(now)
+                    if self._pending:
+                        if (flush_at := self._next_flush_at()) <= now:
+                            break
+                        wake_at = min(flush_at, wake_at or flush_at)
+                    self._condition.wait(None if wake_at is None else wake_at - now)
+                if not self._running:
+                    return
+            self.flush()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import hashlib
+
+# Keeps the split of the tags across the workers of an instance independent of the
+# split across instances
+WORKER_SALT = "worker:"
+
+_MASK_64 = (1 << 64) - 1
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """Map a key to a bucket with jump consistent hashing.
+
+    Keys are spread evenly across the buckets and, when a bucket is added, only the
+    keys that move to the new bucket change: 1 / buckets of them, the least possible.
+    See "A Fast, Minimal Memory, Consistent Hash Algorithm" (Lamping and Veach).
+
+    Args:
+        key (int): A 64-bit key
+        buckets (int): The number of buckets
+
+    Returns:
+        int: The bucket of the key, from 0 to buckets - 1
+    """
+    bucket, jump = -1, 0
+    while jump < buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & _MASK_64
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def shard_of(key: str, count: int, salt: str = "") -> int:
+    """Get the shard a key belongs to.
+
+    Unlike `hash`, which is salted differently in every process, the shard of a key
+    is the same in every process, host and restart. Changing the number of shards
+    moves as few keys as possible.
+
+    Args:
+        key (str): The key to place (i.e., a tag ID)
+        count (int): The number of shards
+        salt (str, optional): Makes the placement independent of placements with
+                              other salts
+
+    Returns:
+        int: The index of the shard, from 0 to count - 1
+    """
+    if count == 1:
+        return 0
+    digest = hashlib.blake2b(f"{salt}{key}".encode(), digest_size=8).digest()
+    return jump_hash(int.from_bytes(digest, "big"), count)
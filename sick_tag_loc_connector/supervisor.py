@@ -0,0 +1,377 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from dataclasses import dataclass, replace
+from multiprocessing.process import BaseProcess
+from typing import Callable, Dict, List
+
+# InOrbit
+from sick_tag_loc_connector.controller import (
+    ControllerHealth,
+    SickTagLocMasterController,
+)
+from sick_tag_loc_connector.metrics import REGISTRY, MetricsServer
+from sick_tag_loc_connector.models import SickTagLocConfig
+
+# Seconds between the heartbeats of the workers, and between supervisor checks
+HEARTBEAT_INTERVAL = 1.0
+
+# Metrics
+WORKER_UP = REGISTRY.gauge(
+    "sick_worker_up", "If the worker process is running, by worker", ["worker"]
+)
+WORKER_RESTARTS = REGISTRY.counter(
+    "sick_worker_restarts_total",
+    "Worker processes restarted after exiting or hanging, by worker",
+    ["worker"],
+)
+WORKER_CONNECTORS = REGISTRY.gauge(
+    "sick_worker_connectors",
+    "Tags managed by the worker process, by worker",
+    ["worker"],
+)
+
+
+@dataclass
+class WorkerHealth:
+    """The state of a worker process, as seen by the supervisor.
+
+    Attributes:
+        index (int): The index of the worker, which is the shard of its tags
+        pid (int | None): The process ID of the worker, if it was started
+        alive (bool): If the worker process is running
+        restarts (int): The number of times the worker was restarted
+        exitcode (int | None): The exit code of the last worker process that exited
+        started (float | None): When the worker process was started, in
+            `time.monotonic` seconds
+        last_heartbeat (float | None): When the last heartbeat of the worker process
+            was received, in `time.monotonic` seconds
+        controller (ControllerHealth | None): The state of the worker controller, as
+            of its last heartbeat
+    """
+
+    index: int
+    pid: int | None = None
+    alive: bool = False
+    restarts: int = 0
+    exitcode: int | None = None
+    started: float | None = None
+    last_heartbeat: float | None = None
+    controller: ControllerHealth | None = None
+
+
+def worker_config(config: SickTagLocConfig, index: int) -> SickTagLocConfig:
+    """Get the configuration of a worker process.
+
+    Every worker serves its metrics on its own port, right after the port of the
+    supervisor, and records the stream to its own file.
+
+    Args:
+        config (SickTagLocConfig): The configuration of the supervisor
+        index (int): The index of the worker
+
+    Returns:
+        SickTagLocConfig: The configuration of the worker
+    """
+    connector_config = config.connector_config
+    update = {}
+    if connector_config.metrics_port is not None:
+        update["metrics_port"] = connector_config.metrics_port + 1 + index
+    if connector_config.sick_rtls_record_path:
+        update["sick_rtls_record_path"] = (
+            f"{connector_config.sick_rtls_record_path}.{index}"
+        )
+    return config.model_copy(
+        update={"connector_config": connector_config.model_copy(update=update)}
+    )
+
+
+def run_worker(
+    config: SickTagLocConfig,
+    index: int,
+    count: int,
+    heartbeats: multiprocessing.Queue,
+    stop: multiprocessing.Event,
+    log_level: int = logging.INFO,
+) -> None:
+    """Run the connectors of a shard of the tags, until the supervisor stops them.
+
+    This is the entry point of the worker processes. Shutdown signals are ignored, so
+    the connectors are only stopped by the supervisor; a worker whose supervisor is
+    gone stops on its own. The heartbeats are only sent once the controller started,
+    each one carrying a health snapshot taken through the controller, so a worker
+    whose controller hangs starting or deadlocks stops sending them.
+
+    Args:
+        config (SickTagLocConfig): The configuration of the supervisor
+        index (int): The shard of the tags to run
+        count (int): The number of shards the tags are split into
+        heartbeats (multiprocessing.Queue): Where the heartbeats are sent to
+        stop (multiprocessing.Event): Set by the supervisor to stop the worker
+        log_level (int, optional): The logging level of the worker
+    """
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, signal.SIG_IGN)
+    logging.basicConfig(
+        level=log_level, format=f"%(levelname)s:worker-{index}:%(name)s:%(message)s"
+    )
+    parent = multiprocessing.parent_process()
+    controller = SickTagLocMasterController(worker_config(config, index), index, count)
+    controller.start()
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            if parent and not parent.is_alive():
+                break
+            heartbeats.put((index, os.getpid(), controller.get_health()))
+    finally:
+        controller.stop()
+
+
+class WorkerSupervisor:
+    """Runs the connectors in several worker processes.
+
+    All the connectors of a single process contend for the same interpreter lock, so
+    parsing, transforming and publishing the poses of many tags is bound to a single
+    core. The supervisor splits the tags across worker processes, each one running
+    the connectors of its own shard of the tags, so the throughput scales with the
+    cores.
+
+    Workers that exit are restarted after `worker_restart_delay` seconds, and workers
+    that stop sending heartbeats for `worker_heartbeat_timeout` seconds are killed and
+    restarted; new workers get `connector_timeout` seconds more to send their first
+    heartbeat, as they only send them once their connectors started. Their health is
+    collected from the heartbeats. It has the same start/stop contract as the
+    SickTagLocMasterController.
+
+    Attributes:
+        config (SickTagLocConfig): The configuration of the connectors
+        worker_count (int): The number of worker processes
+        restart_delay (float): Seconds to wait before restarting a worker
+        heartbeat_timeout (float): Seconds without heartbeats before a worker is
+                                   restarted
+        start_timeout (float): Seconds a new worker is given to start, on top of the
+                               heartbeat timeout
+        metrics_server (MetricsServer | None): Serves the supervisor metrics, if
+                                               enabled
+    """
+
+    def __init__(self, config: SickTagLocConfig, target: Callable = run_worker):
+        """WorkerSupervisor Constructor
+
+        A call to start/stop should be made after initialization.
+
+        Args:
+            config (SickTagLocConfig): The configuration of the connectors
+            target (Callable, optional): The entry point of the worker processes,
+                                         called with the arguments of `run_worker`
+        """
+        self.logger = logging.getLogger(name=self.__class__.__name__)
+        self.config = config
+        connector_config = config.connector_config
+        self.worker_count = connector_config.get_worker_processes()
+        self.restart_delay = connector_config.worker_restart_delay
+        self.heartbeat_timeout = connector_config.worker_heartbeat_timeout
+        self.start_timeout = connector_config.connector_timeout
+        self.metrics_server = None
+        if connector_config.metrics_port is not None:
+            self.metrics_server = MetricsServer(
+                REGISTRY, connector_config.metrics_host, connector_config.metrics_port
+            )
+
+        self._target = target
+        # Workers are spawned, as forking a process with threads running is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._heartbeats = self._context.Queue()
+        self._stop = self._context.Event()
+        self._health = [WorkerHealth(index) for index in range(self.worker_count)]
+        # The process of each worker, None while it waits to be restarted
+        self._processes: List[BaseProcess | None] = [None] * self.worker_count
+        # When each worker that exited is due to be restarted
+        self._restart_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._monitor_thread = None
+
+        for health in self._health:
+            worker = str(health.index)
+            WORKER_UP.labels(worker).set_function(
+                lambda health=health: float(health.alive)
+            )
+            WORKER_CONNECTORS.labels(worker).set_function(
+                lambda health=health: (
+                    health.controller.connectors if health.controller else 0
+                )
+            )
+
+    def start(self) -> None:
+        """Start all the worker processes and the supervision."""
+        if self.metrics_server:
+            self.metrics_server.start()
+        self._stop.clear()
+        self._stopping.clear()
+        with self._lock:
+            for index in range(self.worker_count):
+                self._spawn(index)
+        self.logger.info(f"Started {self.worker_count} worker processes")
+        self._monitor_thread = threading.Thread(
+            target=self._monitor, name="WorkerSupervisor", daemon=True
+        )
+        self._monitor_thread.start()
+
+    def stop(self) -> None:
+        """Stop the supervision and all the worker processes.
+
+        Workers are given `connector_timeout` seconds to stop their connectors, plus
+        the heartbeat timeout, before they are terminated.
+        """
+        self._stopping.set()
+        if self._monitor_thread:
+            self._monitor_thread.join()
+            self._monitor_thread = None
+        self._stop.set()
+
+        connector_config = self.config.connector_config
+        deadline = (
+            time.monotonic()
+            + connector_config.connector_timeout
+            + connector_config.worker_heartbeat_timeout
+        )
+        with self._lock:
+            for index, process in enumerate(self._processes):
+                if process is None:
+                    continue
+                process.join(max(0.0, deadline - time.monotonic()))
+                if process.is_alive():
+                    self.logger.warning(f"Worker {index} did not stop, terminating it")
+                    process.terminate()
+                    process.join()
+                self._health[index].alive = False
+                self._health[index].exitcode = process.exitcode
+                self._processes[index] = None
+            self._restart_at.clear()
+        if self.metrics_server:
+            self.metrics_server.stop()
+
+    def get_health(self) -> List[WorkerHealth]:
+        """Get the state of every worker process.
+
+        Returns:
+            List[WorkerHealth]: A snapshot of the state of each worker, by index
+        """
+        self._receive_heartbeats()
+        with self._lock:
+            return [replace(health) for health in self._health]
+
+    def healthy(self) -> bool:
+        """Check if every worker process is running and sending heartbeats.
+
+        Returns:
+            bool: If all the workers are alive and none of them missed its heartbeat
+        """
+        now = time.monotonic()
+        return all(
+            health.alive
+            and health.last_heartbeat is not None
+            and now - health.last_heartbeat < self.heartbeat_timeout
+            for health in self.get_health()
+        )
+
+    def _spawn(self, index: int) -> None:
+        """Start the process of a worker; must be called with the lock held.
+
+        Args:
+            index (int): The index of the worker
+        """
+        process = self._context.Process(
+            target=self._target,
+            args=(
+                self.config,
+                index,
+                self.worker_count,
+                self._heartbeats,
+                self._stop,
+                logging.getLogger().getEffectiveLevel(),
+            ),
+            name=f"worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[index] = process
+        health = self._health[index]
+        health.pid = process.pid
+        health.alive = True
+        health.controller = None
+        health.started = time.monotonic()
+        health.last_heartbeat = None
+
+    def _monitor(self) -> None:
+        """Check the workers periodically until the supervisor is stopped."""
+        while not self._stopping.wait(HEARTBEAT_INTERVAL):
+            try:
+                self._check()
+            except Exception as e:
+                self.logger.error(f"Worker supervision failed: {e}")
+
+    def _check(self) -> None:
+        """Restart the workers that exited or hung."""
+        self._receive_heartbeats()
+        now = time.monotonic()
+        with self._lock:
+            for index, process in enumerate(self._processes):
+                health = self._health[index]
+                if process is None:
+                    if now >= self._restart_at.get(index, now):
+                        self._restart_at.pop(index, None)
+                        self.logger.info(f"Restarting worker {index}")
+                        health.restarts += 1
+                        WORKER_RESTARTS.labels(str(index)).inc()
+                        self._spawn(index)
+                    continue
+                if process.is_alive():
+                    # A new worker is given the connector timeout to start its
+                    # connectors, on top of the heartbeat timeout
+                    if health.last_heartbeat is None:
+                        silent = now - health.started - self.start_timeout
+                    else:
+                        silent = now - health.last_heartbeat
+                    if silent < self.heartbeat_timeout:
+                        continue
+                    self.logger.error(
+                        f"Worker {index} sent no heartbeat for {silent:.1f}s, "
+                        f"killing it"
+                    )
+                    process.kill()
+                    process.join()
+                else:
+                    self.logger.error(
+                        f"Worker {index} exited with code {process.exitcode}"
+                    )
+                health.alive = False
+                health.exitcode = process.exitcode
+                self._processes[index] = None
+                self._restart_at[index] = now + self.restart_delay
+
+    def _receive_heartbeats(self) -> None:
+        """Update the health of the workers with the heartbeats received."""
+        now = time.monotonic()
+        while True:
+            try:
+                index, pid, controller = self._heartbeats.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                health = self._health[index]
+                # Heartbeats sent by a process already replaced are dropped
+                if health.pid == pid and health.alive:
+                    health.last_heartbeat = now
+                    health.controller = controller
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+# Third-party
+from inorbit_edge.robot import RobotSession
+
+# InOrbit
+from sick_tag_loc_connector.metrics import REGISTRY
+
+# Latency stages of a pose
+STAGE_RECEIVE = "receive"
+STAGE_WAIT = "wait"
+STAGE_PUBLISH = "publish"
+STAGE_TOTAL = "total"
+LATENCY_STAGES = (STAGE_RECEIVE, STAGE_WAIT, STAGE_PUBLISH, STAGE_TOTAL)
+
+# Metrics
+POSE_LATENCY = REGISTRY.summary(
+    "sick_pose_latency_seconds",
+    "Latency of the poses by tag and stage: from the SICK timestamp to the message "
+    "being received (receive), from then to the start of the publish (wait), of the "
+    "publish itself (publish) and from the SICK timestamp to the end of the publish "
+    "(total)",
+    ["tag", "stage"],
+)
+
+
+@dataclass
+class PoseTrace:
+    """The timing of a pose on its way from SICK RTLS to InOrbit.
+
+    Attributes:
+        received (float): When the message was received, in seconds since the epoch
+        source (float | None): The SICK timestamp of the position, in seconds since
+            the epoch, if known
+        ts (int | None): The timestamp in milliseconds the pose is published with, or
+            None to publish it with the time of the publish
+        tracer (LatencyTracer | None): The tracer the latencies are reported to, if any
+    """
+
+    received: float
+    source: float | None = None
+    ts: int | None = None
+    tracer: "LatencyTracer | None" = None
+
+
+class LatencyTracer:
+    """Records the latency percentiles of the poses of a tag.
+
+    The latencies are observed into the `sick_pose_latency_seconds` summary, which
+    keeps the quantiles of the most recent poses of each stage.
+
+    Attributes:
+        tag_id (str): The ID of the tag
+    """
+
+    def __init__(self, tag_id: str) -> None:
+        """LatencyTracer Constructor
+
+        Args:
+            tag_id (str): The ID of the tag
+        """
+        self.tag_id = tag_id
+        # Resolved once, they are updated on every pose
+        self._stages = {
+            stage: POSE_LATENCY.labels(tag_id, stage) for stage in LATENCY_STAGES
+        }
+
+    def received(self, trace: PoseTrace) -> None:
+        """Record the receive lag of a pose.
+
+        Args:
+            trace (PoseTrace): The trace of the pose
+        """
+        if trace.source is not None:
+            self._stages[STAGE_RECEIVE].observe(trace.received - trace.source)
+
+    def published(self, trace: PoseTrace, started: float, finished: float) -> None:
+        """Record the wait, publish and total latencies of a published pose.
+
+        Args:
+            trace (PoseTrace): The trace of the pose
+            started (float): When the publish started, in seconds since the epoch
+            finished (float): When the publish finished, in seconds since the epoch
+        """
+        self._stages[STAGE_WAIT].observe(started - trace.received)
+        self._stages[STAGE_PUBLISH].observe(finished - started)
+        if trace.source is not None:
+            self._stages[STAGE_TOTAL].observe(finished - trace.source)
+
+    def percentiles(self) -> Dict[str, Dict[float, float]]:
+        """Get the latency percentiles of the recent poses.
+
+        Returns:
+            Dict[str, Dict[float, float]]: The value in seconds of each quantile, by
+                                           stage (NaN if nothing was observed yet)
+        """
+        return {stage: value.get_quantiles() for stage, value in self._stages.items()}
+
+
+def publish_pose(
+    session: RobotSession, pose: dict, trace: PoseTrace | None = None
+) -> None:
+    """Publish a pose, reporting its latencies if it is traced.
+
+    Args:
+        session (RobotSession): The InOrbit session to publish the pose through
+        pose (dict): The keyword arguments for `RobotSession.publish_pose`
+        trace (PoseTrace | None, optional): The trace of the pose, if any
+    """
+    if trace is None:
+        session.publish_pose(**pose)
+        return
+    started = time.time()
+    if trace.ts is None:
+        session.publish_pose(**pose)
+    else:
+        session.publish_pose(**pose, ts=trace.ts)
+    if trace.tracer:
+        trace.tracer.published(trace, started, time.time())
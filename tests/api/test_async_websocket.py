@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+import threading
+import time
+from http import HTTPStatus
+from unittest.mock import MagicMock
+
+# Third-party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api.async_websocket import (
+    AsyncWebSocketClient,
+    EventLoopThread,
+)
+
+websockets_server = pytest.importorskip("websockets.asyncio.server")
+
+
+class TestAsyncWebSocketClient:
+    @pytest.fixture
+    def loop_thread(self):
+        loop_thread = EventLoopThread()
+        yield loop_thread
+        loop_thread.stop()
+
+    @pytest.fixture
+    def server(self, loop_thread):
+        """A local WebSocket server echoing updates for every subscribed feed."""
+        received = []
+
+        async def handler(ws):
+            async for msg in ws:
+                received.append(msg)
+                request = json.loads(msg)
+                if request["method"] == "subscribe":
+                    await ws.send(
+                        json.dumps(
+                            {"body": {"id": "1"}, "resource": request["resource"]}
+                        )
+                    )
+
+        async def serve():
+            return await websockets_server.serve(handler, "127.0.0.1", 0)
+
+        server = loop_thread.run(serve()).result()
+        port = server.sockets[0].getsockname()[1]
+        yield f"ws://127.0.0.1:{port}", received
+        loop_thread.run(self._close_server(server)).result()
+
+    @staticmethod
+    async def _close_server(server):
+        server.close()
+        await server.wait_closed()
+
+    @pytest.fixture
+    def ws_client(self, server, loop_thread):
+        url, _ = server
+        return AsyncWebSocketClient(
+            url, "key", "my_feed_id", MagicMock(), loop_thread=loop_thread
+        )
+
+    def test_init(self, ws_client, loop_thread):
+        assert ws_client.headers == {"X-ApiKey": "key"}
+        assert ws_client.feed_id == "my_feed_id"
+        assert ws_client.ws is None
+        assert ws_client.connected() is False
+        assert ws_client._loop_thread is loop_thread
+
+    def test_shared_loop(self):
+        assert EventLoopThread.shared() is EventLoopThread.shared()
+        assert EventLoopThread.shared().loop.is_running()
+
+    def test_send_not_connected(self, ws_client):
+        ws_client.send("test_data")
+        assert ws_client.connected() is False
+
+    def test_open_close(self, ws_client):
+        ws_client.open()
+        assert ws_client.connected() is True
+        ws_client.close()
+        assert ws_client.connected() is False
+
+    def test_open_error(self, loop_thread):
+        ws_client = AsyncWebSocketClient(
+            "ws://127.0.0.1:1", "key", "feed_id", MagicMock(), loop_thread=loop_thread
+        )
+        with pytest.raises(OSError):
+            ws_client.open()
+        assert ws_client.connected() is False
+
+    def test_subscribe(self, ws_client, server):
+        _, received = server
+        done = threading.Event()
+        ws_client._on_message_cb = MagicMock(side_effect=lambda msg: done.set())
+
+        ws_client.subscribe()
+        assert done.wait(5)
+        assert received == [
+            '{"headers":{"X-ApiKey":"key"}, '
+            '"method":"subscribe", '
+            '"resource":"/feeds/my_feed_id"}'
+        ]
+        ws_client._on_message_cb.assert_called_once_with(
+            '{"body": {"id": "1"}, "resource": "/feeds/my_feed_id"}'
+        )
+        ws_client.close()
+
+    def test_reconnect(self, loop_thread):
+        received = []
+
+        async def handler(ws):
+            async for msg in ws:
+                received.append(msg)
+                await ws.send(json.dumps({"resource": json.loads(msg)["resource"]}))
+
+        async def serve(port):
+            return await websockets_server.serve(handler, "127.0.0.1", port)
+
+        server = loop_thread.run(serve(0)).result()
+        port = server.sockets[0].getsockname()[1]
+        messages = []
+        ws_client = AsyncWebSocketClient(
+            f"ws://127.0.0.1:{port}",
+            "key",
+            "my_feed_id",
+            messages.append,
+            reconnect_backoff=0.05,
+            loop_thread=loop_thread,
+        )
+        ws_client.subscribe()
+        assert wait_for(lambda: len(messages) == 1)
+
+        # The server restarts
+        loop_thread.run(self._close_server(server)).result()
+        assert wait_for(ws_client.reconnecting)
+        time.sleep(0.2)
+        server = loop_thread.run(serve(port)).result()
+
+        # The client reconnects and subscribes again on its own
+        assert wait_for(lambda: len(messages) == 2)
+        assert ws_client.connected() is True
+        assert ws_client.reconnects == 1
+        assert ws_client.get_downtime() >= 0.2
+        assert received == [received[0]] * 2
+
+        ws_client.close()
+        loop_thread.run(self._close_server(server)).result()
+
+    def test_reconnect_rejected(self, loop_thread):
+        state = {"reject": False}
+
+        async def handler(ws):
+            async for msg in ws:
+                await ws.send(json.dumps({"resource": json.loads(msg)["resource"]}))
+
+        def process_request(connection, request):
+            if state["reject"]:
+                return connection.respond(HTTPStatus.SERVICE_UNAVAILABLE, "Restarting")
+
+        async def serve():
+            return await websockets_server.serve(
+                handler, "127.0.0.1", 0, process_request=process_request
+            )
+
+        server = loop_thread.run(serve()).result()
+        port = server.sockets[0].getsockname()[1]
+        messages = []
+        ws_client = AsyncWebSocketClient(
+            f"ws://127.0.0.1:{port}",
+            "key",
+            "my_feed_id",
+            messages.append,
+            reconnect_backoff=0.05,
+            reconnect_max_delay=0.1,
+            loop_thread=loop_thread,
+        )
+        ws_client.on_error = MagicMock()
+        ws_client.subscribe()
+        assert wait_for(lambda: len(messages) == 1)
+
+        # The server rejects the handshakes for a while
+        state["reject"] = True
+        loop_thread.loop.call_soon_threadsafe(ws_client.ws.transport.abort)
+        assert wait_for(lambda: ws_client.on_error.call_count >= 2)
+        assert "503" in ws_client.on_error.call_args.args[0]
+        assert ws_client.connected() is False
+        state["reject"] = False
+
+        # The client keeps backing off until it is accepted again
+        assert wait_for(lambda: len(messages) == 2)
+        assert ws_client.connected() is True
+        assert ws_client.reconnects == 1
+
+        ws_client.close()
+        loop_thread.run(self._close_server(server)).result()
+
+    def test_dead_link(self, loop_thread):
+        state = {"mute": True}
+        muted = []
+
+        async def handler(ws):
+            async for msg in ws:
+                await ws.send(json.dumps({"resource": json.loads(msg)["resource"]}))
+                if state["mute"]:
+                    # Pings are no longer answered, as over a half-open connection
+                    ws.transport.pause_reading()
+                    muted.append(ws.transport)
+
+        async def serve():
+            return await websockets_server.serve(handler, "127.0.0.1", 0)
+
+        server = loop_thread.run(serve()).result()
+        port = server.sockets[0].getsockname()[1]
+        messages = []
+        ws_client = AsyncWebSocketClient(
+            f"ws://127.0.0.1:{port}",
+            "key",
+            "my_feed_id",
+            messages.append,
+            reconnect_backoff=0.05,
+            ping_interval=0.2,
+            ping_timeout=0.1,
+            loop_thread=loop_thread,
+        )
+        ws_client.subscribe()
+        assert wait_for(lambda: ws_client.ping_timeouts == 1)
+
+        # The dead connection is replaced, and the new one keeps answering pings
+        state["mute"] = False
+        assert wait_for(lambda: ws_client.reconnects == 1)
+        assert wait_for(lambda: len(messages) == 2)
+        assert wait_for(lambda: ws_client.rtt is not None)
+        assert ws_client.rtt < 0.1
+        assert ws_client.ping_timeouts == 1
+
+        ws_client.close()
+        # Let the server notice the aborted connection
+        for transport in muted:
+            loop_thread.loop.call_soon_threadsafe(transport.resume_reading)
+        loop_thread.run(self._close_server(server)).result()
+
+    def test_close_while_reconnecting(self, ws_client, loop_thread):
+        ws_client.reconnect_backoff = 60.0
+        ws_client.open()
+        # The connection drops
+        loop_thread.loop.call_soon_threadsafe(ws_client.ws.transport.abort)
+        assert wait_for(ws_client.reconnecting)
+        start = time.monotonic()
+        ws_client.close()
+        assert time.monotonic() - start < 1
+        assert ws_client.reconnecting() is False
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
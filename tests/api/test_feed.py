@@ -10,8 +10,14 @@ from unittest.mock import Mock, MagicMock
 import pytest
 
 # InOrbit
-from sick_tag_loc_connector.api import Feed, RestClient, ENDPOINT_FEEDS
-from sick_tag_loc_connector.api.feed import SICK_RTLS_ID_PREFIX
+from sick_tag_loc_connector.api import (
+    AsyncWebSocketClient,
+    Feed,
+    RestClient,
+    WebSocketClient,
+    ENDPOINT_FEEDS,
+)
+from sick_tag_loc_connector.api.feed import SICK_RTLS_ID_PREFIX, iter_pages
 
 
 class TestFeed:
@@ -247,3 +253,76 @@ class TestFeed:
         assert client.headers == {"X-ApiKey": "my_api_key"}
         assert client.feed_id == "my_feed_id"
         assert client._on_message_cb == callback
+        assert type(client) is WebSocketClient
+
+    def test_get_websocket_client_class(self):
+        rest_client = RestClient("http://localhost:8080/api", "my_api_key")
+
+        feed = Feed(rest_client, id="my_feed_id")
+        client = feed.get_websocket_client(9999, MagicMock(), AsyncWebSocketClient)
+
+        assert isinstance(client, AsyncWebSocketClient)
+        assert client.url == "ws://localhost:9999"
+        assert client.feed_id == "my_feed_id"
+
+
+class TestIterPages:
+
+    @staticmethod
+    def paginated_client(total: int, ignore_params: bool = False) -> Mock:
+        results = [{"id": str(i)} for i in range(total)]
+
+        def get(endpoint, params=None):
+            if ignore_params:
+                return {"results": results}
+            start = params["offset"]
+            end = start + params["limit"]
+            return {"results": results[start:end]}
+
+        rest_client = Mock(spec=RestClient)
+        rest_client.get.side_effect = get
+        return rest_client
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_pages(self, prefetch):
+        rest_client = self.paginated_client(25)
+        pages = list(iter_pages(rest_client, "feeds", 10, prefetch))
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert [r["id"] for page in pages for r in page] == [str(i) for i in range(25)]
+        rest_client.get.assert_any_call("feeds", params={"limit": 10, "offset": 0})
+        rest_client.get.assert_any_call("feeds", params={"limit": 10, "offset": 20})
+
+    def test_exact_pages(self):
+        rest_client = self.paginated_client(20)
+        pages = list(iter_pages(rest_client, "feeds", 10))
+        assert [len(page) for page in pages] == [10, 10]
+        # The empty page marks the end
+        assert rest_client.get.call_count == 3
+
+    def test_empty(self):
+        assert list(iter_pages(self.paginated_client(0), "feeds", 10)) == []
+
+    @pytest.mark.parametrize("total", [5, 10, 30])
+    def test_server_without_pagination(self, total):
+        rest_client = self.paginated_client(total, ignore_params=True)
+        pages = list(iter_pages(rest_client, "feeds", 10))
+        assert sum(len(page) for page in pages) == total
+        assert rest_client.get.call_count <= 2
+
+    def test_lazy(self):
+        rest_client = self.paginated_client(100)
+        pages = iter_pages(rest_client, "feeds", 10)
+        next(pages)
+        assert rest_client.get.call_count == 1
+        pages.close()
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError, match="The page size must be at least 1"):
+            list(iter_pages(self.paginated_client(1), "feeds", 0))
+
+    def test_iter_all(self):
+        rest_client = self.paginated_client(15)
+        feeds = list(Feed.iter_all(rest_client, page_size=10, prefetch=1))
+        assert [feed.get_id() for feed in feeds] == [str(i) for i in range(15)]
+        assert all(isinstance(feed, Feed) for feed in feeds)
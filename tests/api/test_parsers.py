@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+# Third-party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api.parsers import (
+    POSITION_PARSERS,
+    parse_position_json,
+    parse_position_targeted,
+    parse_timestamp,
+)
+
+
+def build_message(*datastreams: dict) -> str:
+    return json.dumps(
+        {
+            "body": {"id": "12", "datastreams": list(datastreams)},
+            "resource": "/feeds/12",
+        }
+    )
+
+
+@pytest.mark.parametrize("parser", POSITION_PARSERS.values())
+class TestPositionParsers:
+
+    def test_position(self, parser):
+        msg = build_message(
+            {"id": "posZ", "current_value": "  1.00"},
+            {"id": "posX", "current_value": "  12.79"},
+            {"id": "posY", "current_value": " -1.86"},
+        )
+        assert parser(msg) == {"x": 12.79, "y": -1.86}
+        assert parser(msg.encode()) == {"x": 12.79, "y": -1.86}
+
+    def test_key_order(self, parser):
+        msg = build_message(
+            {"at": "2024-06-10 15:05:31", "current_value": "1.5", "id": "posX"},
+            {"current_value": "-2", "id": "posY", "tags": []},
+        )
+        assert parser(msg) == {"x": 1.5, "y": -2.0, "at": "2024-06-10 15:05:31"}
+
+    def test_timestamp(self, parser):
+        # Only the timestamp of the X position is kept
+        msg = build_message(
+            {"id": "posY", "current_value": "2", "at": "2024-06-10 15:05:32.5"},
+            {"id": "posX", "current_value": "1", "at": "2024-06-10 15:05:31.25"},
+            {"id": "clr", "current_value": "1", "at": "2024-06-10 15:05:33"},
+        )
+        assert parser(msg)["at"] == "2024-06-10 15:05:31.25"
+
+    def test_numeric_value(self, parser):
+        msg = build_message(
+            {"id": "posX", "current_value": 1.5},
+            {"id": "posY", "current_value": -2e-1},
+        )
+        assert parser(msg) == {"x": 1.5, "y": -0.2}
+
+    def test_missing_position(self, parser):
+        assert parser(build_message({"id": "posX", "current_value": "1"})) is None
+        assert parser(build_message({"id": "clr", "current_value": "1"})) is None
+
+    def test_recorded_messages(self, parser, recorded_messages):
+        for msg in recorded_messages:
+            assert parser(msg) == parse_position_json(msg)
+
+
+class TestParsePositionTargeted:
+
+    def test_fallback(self):
+        # Nested objects inside the datastream are not handled by the fast path
+        msg = build_message(
+            {"id": "posX", "meta": {"a": 1}, "current_value": "1"},
+            {"id": "posY", "current_value": "2"},
+        )
+        assert parse_position_targeted(msg) == {"x": 1.0, "y": 2.0}
+
+    def test_no_datastreams(self):
+        assert parse_position_targeted('{"status":"subscribed"}') is None
+
+
+class TestParseTimestamp:
+
+    def test_utc(self):
+        expected = datetime(2024, 6, 10, 15, 5, 31, 425717, timezone.utc).timestamp()
+        assert parse_timestamp("2024-06-10 15:05:31.425717") == expected
+
+    def test_timezone(self):
+        tz = ZoneInfo("America/Montevideo")
+        expected = datetime(2024, 6, 10, 18, 5, 31, tzinfo=timezone.utc).timestamp()
+        assert parse_timestamp("2024-06-10 15:05:31", tz) == expected
+        # An explicit UTC offset takes precedence over the timezone
+        assert parse_timestamp("2024-06-10 18:05:31+00:00", tz) == expected
+
+    @pytest.mark.parametrize("value", ["", "yesterday", "2024-13-10 15:05:31", None])
+    def test_invalid(self, value):
+        assert parse_timestamp(value) is None
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import gzip
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api.recorder import (
+    FRAME_HEADER,
+    StreamRecorder,
+    read_recording,
+)
+
+
+class TestStreamRecorder:
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip(self, tmp_path, compress):
+        path = str(tmp_path / "stream.rec")
+        recorder = StreamRecorder(path, compress)
+        recorder.record('{"body":{"id":"1"}}', ts=1.5)
+        recorder.record(b"\x00binary\nframe", ts=2.5)
+        recorder.close()
+
+        assert recorder.frames == 2
+        assert list(read_recording(path)) == [
+            (1.5, '{"body":{"id":"1"}}'),
+            (2.5, b"\x00binary\nframe"),
+        ]
+        with open(path, "rb") as file:
+            assert (file.read(2) == b"\x1f\x8b") is compress
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_append(self, tmp_path, compress):
+        path = str(tmp_path / "stream.rec")
+        for ts in (1.0, 2.0):
+            recorder = StreamRecorder(path, compress)
+            recorder.record("frame", ts=ts)
+            recorder.close()
+        assert [ts for ts, _ in read_recording(path)] == [1.0, 2.0]
+
+    def test_default_timestamp(self, tmp_path):
+        path = str(tmp_path / "stream.rec")
+        recorder = StreamRecorder(path)
+        recorder.record("frame")
+        recorder.close()
+        ((ts, _),) = read_recording(path)
+        assert ts > 1e9
+
+    def test_record_after_close(self, tmp_path):
+        recorder = StreamRecorder(str(tmp_path / "stream.rec"))
+        recorder.close()
+        recorder.record("frame")
+        recorder.flush()
+        assert recorder.frames == 0
+
+    def test_compact(self, tmp_path, recorded_messages):
+        path = str(tmp_path / "stream.rec")
+        recorder = StreamRecorder(path, compress=True)
+        for msg in recorded_messages:
+            recorder.record(msg)
+        recorder.close()
+        raw_size = sum(len(msg) + FRAME_HEADER.size for msg in recorded_messages)
+        with open(path, "rb") as file:
+            assert len(file.read()) < raw_size / 2
+
+    def test_truncated(self, tmp_path):
+        path = str(tmp_path / "stream.rec")
+        recorder = StreamRecorder(path)
+        recorder.record("complete", ts=1.0)
+        recorder.record("truncated", ts=2.0)
+        recorder.close()
+        with open(path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(data[:-3])
+        assert list(read_recording(path)) == [(1.0, "complete")]
+
+    def test_interrupted_compressed(self, tmp_path):
+        # Flushed, but the process died before closing the recording
+        path = str(tmp_path / "stream.rec")
+        recorder = StreamRecorder(path, compress=True)
+        recorder.record("flushed", ts=1.0)
+        recorder.flush()
+        assert list(read_recording(path)) == [(1.0, "flushed")]
+
+        # A closed recording cut short, within its last frame
+        recorder.record(str(list(range(100))), ts=2.0)
+        recorder.close()
+        with open(path, "rb") as file:
+            data = file.read()
+        with open(path, "wb") as file:
+            file.write(data[:-20])
+        assert list(read_recording(path)) == [(1.0, "flushed")]
+
+    def test_gzip_members(self, tmp_path):
+        # Recordings can be concatenated
+        path = str(tmp_path / "stream.rec")
+        with gzip.open(path, "ab") as file:
+            file.write(FRAME_HEADER.pack(1.0, 1, True) + b"a")
+        with gzip.open(path, "ab") as file:
+            file.write(FRAME_HEADER.pack(2.0, 1, True) + b"b")
+        assert list(read_recording(path)) == [(1.0, "a"), (2.0, "b")]
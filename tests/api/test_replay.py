@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import time
+from unittest.mock import MagicMock
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api.async_websocket import (
+    AsyncWebSocketClient,
+    EventLoopThread,
+)
+from sick_tag_loc_connector.api.recorder import StreamRecorder
+from sick_tag_loc_connector.api.replay import ReplayServer
+from sick_tag_loc_connector.api.stream import StreamManager, get_feed_id
+
+pytest.importorskip("websockets.asyncio.server")
+
+
+class TestReplayServer:
+    @pytest.fixture
+    def loop_thread(self):
+        loop_thread = EventLoopThread()
+        yield loop_thread
+        loop_thread.stop()
+
+    @pytest.fixture
+    def recording(self, tmp_path, recorded_messages):
+        """The recorded messages, 10ms apart (0.5s in total).
+
+        The first message, which doesn't belong to any feed, leaves 0.1s for all the
+        subscriptions to be sent after the replay starts.
+        """
+        path = str(tmp_path / "stream.rec")
+        recorder = StreamRecorder(path, compress=True)
+        recorder.record('{"status":"ok"}', ts=1000.0)
+        for i, msg in enumerate(recorded_messages):
+            recorder.record(msg, ts=1000.1 + i * 0.01)
+        recorder.close()
+        return path
+
+    def replay(self, recording, loop_thread, recorded_messages, speed, feed_ids):
+        server = ReplayServer(recording, speed=speed, loop_thread=loop_thread)
+        server.start()
+        manager = StreamManager(server.url, "key", 1, AsyncWebSocketClient)
+        callbacks = {feed_id: MagicMock() for feed_id in feed_ids}
+        try:
+            for feed_id, callback in callbacks.items():
+                manager.subscribe(feed_id, callback)
+            start = time.monotonic()
+            assert server.wait_done(10)
+            elapsed = time.monotonic() - start
+            expected = [m for m in recorded_messages if get_feed_id(m) in feed_ids]
+            # Wait for the last frames to be delivered
+            deadline = time.monotonic() + 5
+            while (
+                sum(c.call_count for c in callbacks.values()) < len(expected)
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+        finally:
+            manager.close()
+            server.stop()
+
+        received = [
+            call.args[0]
+            for callback in callbacks.values()
+            for call in callback.call_args_list
+        ]
+        return server, sorted(received), sorted(expected), elapsed
+
+    def test_replay_real_time(self, recording, loop_thread, recorded_messages):
+        server, received, expected, elapsed = self.replay(
+            recording, loop_thread, recorded_messages, 1.0, {"12", "27"}
+        )
+        assert received == expected
+        # Including the first message, that is sent to every client
+        assert server.frames_sent == len(expected) + 1
+        assert elapsed >= 0.4
+
+    def test_replay_accelerated(self, recording, loop_thread, recorded_messages):
+        server, received, expected, elapsed = self.replay(
+            recording, loop_thread, recorded_messages, 0, {"13"}
+        )
+        assert received == expected
+        assert elapsed < 0.3
+
+    def test_replay_failed(self, tmp_path, loop_thread):
+        server = ReplayServer(str(tmp_path / "missing.rec"), loop_thread=loop_thread)
+        server.start()
+        manager = StreamManager(server.url, "key", 1, AsyncWebSocketClient)
+        try:
+            manager.subscribe("12", MagicMock())
+            # The failure is logged and the waiters are released
+            assert server.wait_done(5)
+        finally:
+            manager.close()
+            server.stop()
+        assert server.frames_sent == 0
+
+    def test_invalid_speed(self, recording):
+        with pytest.raises(ValueError, match="must not be negative"):
+            ReplayServer(recording, speed=-1)
@@ -10,6 +10,14 @@ import requests_mock
 
 # InOrbit
 from sick_tag_loc_connector.api import RestClient
+from sick_tag_loc_connector.api.rest import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    REQUEST_DURATION,
+    REQUEST_ERRORS,
+    REQUESTS,
+    RETRY_STATUS_CODES,
+)
 
 
 class TestRestClient:
@@ -22,6 +30,48 @@ class TestRestClient:
         with requests_mock.Mocker() as m:
             yield m
 
+    def test_init(self, client):
+        assert client.url == "https://fakeurl.com/"
+        assert client.timeout == (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+        assert client.session.headers["X-ApiKey"] == "fake_api_key"
+        assert client.session.headers["Content-Type"] == "application/json"
+
+    def test_session_pool(self):
+        client = RestClient(
+            "https://fakeurl.com/",
+            "fake_api_key",
+            pool_size=4,
+            connect_timeout=1.0,
+            read_timeout=2.0,
+            max_retries=5,
+            backoff_factor=0.1,
+        )
+        assert client.timeout == (1.0, 2.0)
+        for prefix in ("http://", "https://"):
+            adapter = client.session.get_adapter(f"{prefix}fakeurl.com")
+            assert adapter._pool_connections == 4
+            assert adapter._pool_maxsize == 4
+            assert adapter.max_retries.total == 5
+            assert adapter.max_retries.backoff_factor == 0.1
+            assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUS_CODES)
+
+    def test_session_reuse(self, m, client):
+        m.get("https://fakeurl.com/test-endpoint", json={})
+        m.post("https://fakeurl.com/test-endpoint", json={})
+        client.get("test-endpoint")
+        client.post("test-endpoint", {})
+
+        assert m.call_count == 2
+        for request in m.request_history:
+            assert request.headers["X-ApiKey"] == "fake_api_key"
+            assert request.timeout == (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+    def test_timeout(self, m, client):
+        m.get("https://fakeurl.com/test-endpoint", exc=requests.exceptions.ReadTimeout)
+
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get("test-endpoint")
+
     def test_get(self, m, client):
         endpoint = "test-endpoint"
         url = f"https://fakeurl.com/{endpoint}"
@@ -97,3 +147,23 @@ class TestRestClient:
 
         with pytest.raises(requests.exceptions.HTTPError):
             client.delete(endpoint)
+
+    def test_metrics(self, m, client):
+        ok = REQUESTS.labels("GET", 200).get()
+        not_found = REQUESTS.labels("DELETE", 404).get()
+        errors = REQUEST_ERRORS.labels("GET").get()
+        durations = sum(REQUEST_DURATION.labels("GET").totals()[:-1])
+
+        m.get("https://fakeurl.com/ok", json={})
+        m.delete("https://fakeurl.com/missing", status_code=404)
+        m.get("https://fakeurl.com/down", exc=requests.exceptions.ConnectTimeout)
+        client.get("ok")
+        with pytest.raises(requests.HTTPError):
+            client.delete("missing")
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get("down")
+
+        assert REQUESTS.labels("GET", 200).get() == ok + 1
+        assert REQUESTS.labels("DELETE", 404).get() == not_found + 1
+        assert REQUEST_ERRORS.labels("GET").get() == errors + 1
+        assert sum(REQUEST_DURATION.labels("GET").totals()[:-1]) == durations + 2
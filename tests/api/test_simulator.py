@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import time
+from unittest.mock import MagicMock
+
+# Third Party
+import numpy as np
+import pytest
+import requests
+
+# InOrbit
+from sick_tag_loc_connector.api import RestClient, Tag
+from sick_tag_loc_connector.api.async_websocket import (
+    AsyncWebSocketClient,
+    EventLoopThread,
+)
+from sick_tag_loc_connector.api.parsers import parse_position_json
+from sick_tag_loc_connector.api.simulator import RtlsSimulator
+from sick_tag_loc_connector.api.stream import StreamManager, get_feed_id
+
+pytest.importorskip("websockets.asyncio.server")
+
+
+class TestRtlsSimulator:
+    @pytest.fixture
+    def loop_thread(self):
+        loop_thread = EventLoopThread()
+        yield loop_thread
+        loop_thread.stop()
+
+    @pytest.fixture
+    def simulator(self, loop_thread):
+        simulator = RtlsSimulator(
+            250, update_rate=20, api_key="key", seed=1, loop_thread=loop_thread
+        )
+        simulator.start()
+        yield simulator
+        simulator.stop()
+
+    @pytest.fixture
+    def rest_client(self, simulator):
+        rest_client = RestClient(simulator.rest_url, "key", max_retries=0)
+        yield rest_client
+        rest_client.close()
+
+    def test_tags(self, simulator, rest_client):
+        tags = Tag.get_all(rest_client, page_size=100)
+        assert len(tags) == 250
+        assert {tag._id for tag in tags} == {tag["id"] for tag in simulator.tags}
+        tag = Tag.get(rest_client, "42")
+        assert tag.title == "0x240463870029"
+        assert tag._type == "tag"
+
+    def test_feeds(self, rest_client):
+        results = rest_client.get("/feeds", params={"limit": 10, "offset": 245})
+        assert [feed["id"] for feed in results["results"]] == [
+            "246",
+            "247",
+            "248",
+            "249",
+            "250",
+        ]
+
+    def test_not_found(self, rest_client):
+        with pytest.raises(requests.HTTPError, match="404"):
+            Tag.get(rest_client, "251")
+        with pytest.raises(requests.HTTPError, match="404"):
+            rest_client.get("/anchors")
+
+    def test_unauthorized(self, simulator):
+        rest_client = RestClient(simulator.rest_url, "wrong", max_retries=0)
+        with pytest.raises(requests.HTTPError, match="401"):
+            Tag.get(rest_client, "1")
+        rest_client.close()
+
+    def test_stream(self, simulator):
+        manager = StreamManager(simulator.url, "key", 2, AsyncWebSocketClient)
+        callbacks = {feed_id: MagicMock() for feed_id in ("1", "2", "250")}
+        try:
+            for feed_id, callback in callbacks.items():
+                manager.subscribe(feed_id, callback)
+            deadline = time.monotonic() + 5
+            while (
+                min(c.call_count for c in callbacks.values()) < 5
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+            manager.unsubscribe("2")
+        finally:
+            manager.close()
+
+        for feed_id, callback in callbacks.items():
+            assert callback.call_count >= 5
+            for call in callback.call_args_list:
+                msg = call.args[0]
+                assert get_feed_id(msg) == feed_id
+                position = parse_position_json(msg)
+                assert 0 <= position["x"] <= 50
+                assert 0 <= position["y"] <= 50
+        assert simulator.messages_sent >= 15
+
+    def test_step(self, loop_thread):
+        simulator = RtlsSimulator(
+            100, speed=2.0, area=(10.0, 5.0), seed=2, loop_thread=loop_thread
+        )
+        start = simulator.positions()
+        simulator.step(0.1)
+        moved = np.linalg.norm(simulator.positions() - start, axis=1)
+        # Tags bouncing off an edge move less than the full distance
+        assert np.all(moved <= 0.2 + 1e-9)
+        assert np.median(moved) == pytest.approx(0.2)
+        for _ in range(1000):
+            simulator.step(0.1)
+            positions = simulator.positions()
+            assert np.all(positions >= 0)
+            assert np.all(positions <= [10.0, 5.0])
+
+    def test_build_message(self, loop_thread):
+        simulator = RtlsSimulator(3, seed=3, loop_thread=loop_thread)
+        msg = simulator.build_message(2, "2024-06-10 15:05:31.425717")
+        x, y = simulator.positions()[2]
+        assert get_feed_id(msg) == "3"
+        assert parse_position_json(msg) == {
+            "x": pytest.approx(x, abs=0.005),
+            "y": pytest.approx(y, abs=0.005),
+            "at": "2024-06-10 15:05:31.425717",
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"num_tags": 0}, "at least 1"),
+            ({"update_rate": 0}, "must be positive"),
+        ],
+    )
+    def test_invalid(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            RtlsSimulator(**kwargs)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import threading
+from unittest.mock import MagicMock
+
+# Third-party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api.stream import (
+    CONNECTIONS,
+    MESSAGES_DROPPED,
+    SUBSCRIPTIONS,
+    StreamManager,
+    get_feed_id,
+)
+from sick_tag_loc_connector.api.websocket import (
+    DEFAULT_OPEN_TIMEOUT,
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+    DEFAULT_RECONNECT_BACKOFF,
+    DEFAULT_RECONNECT_MAX_DELAY,
+    WebSocketClient,
+)
+
+
+class TestStreamManager:
+    @pytest.fixture
+    def client_factory(self):
+        return MagicMock(
+            side_effect=lambda *args, **kwargs: MagicMock(spec=WebSocketClient)
+        )
+
+    @pytest.fixture
+    def manager(self, client_factory):
+        return StreamManager("ws://test-url", "key", 2, client_factory)
+
+    def test_init(self, manager):
+        assert manager.url == "ws://test-url"
+        assert manager.api_key == "key"
+        assert manager.pool_size == 2
+        assert manager.subscriptions() == 0
+        assert manager.connections() == 0
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError, match="The pool size must be at least 1"):
+            StreamManager("ws://test-url", "key", 0)
+
+    def test_subscribe(self, manager, client_factory):
+        manager.subscribe("1", MagicMock())
+        client_factory.assert_called_once_with(
+            "ws://test-url",
+            "key",
+            None,
+            manager._dispatch,
+            DEFAULT_OPEN_TIMEOUT,
+            reconnect=True,
+            reconnect_backoff=DEFAULT_RECONNECT_BACKOFF,
+            reconnect_max_delay=DEFAULT_RECONNECT_MAX_DELAY,
+            ping_interval=DEFAULT_PING_INTERVAL,
+            ping_timeout=DEFAULT_PING_TIMEOUT,
+            name="shared-0",
+        )
+        manager._clients[0].subscribe.assert_called_once_with("1")
+        assert manager.subscriptions() == 1
+        assert manager.connections() == 1
+
+    def test_subscribe_pool_is_bounded(self, manager, client_factory):
+        for feed_id in range(10):
+            manager.subscribe(str(feed_id), MagicMock())
+        assert manager.connections() == 2
+        assert client_factory.call_count == 2
+        # Subscriptions are balanced across the pool
+        for client in manager._clients:
+            assert client.subscribe.call_count == 5
+
+    def test_subscribe_twice(self, manager):
+        callback = MagicMock()
+        manager.subscribe("1", MagicMock())
+        manager.subscribe("1", callback)
+        manager._clients[0].subscribe.assert_called_once_with("1")
+        assert manager._callbacks["1"] is callback
+
+    def test_subscribe_error(self, manager, client_factory):
+        client_factory.side_effect = None
+        client_factory.return_value.subscribe.side_effect = TimeoutError
+        with pytest.raises(TimeoutError):
+            manager.subscribe("1", MagicMock())
+        assert manager.subscriptions() == 0
+        assert "1" not in manager._callbacks
+
+    def test_subscribe_while_opening(self, manager):
+        opening, opened = threading.Event(), threading.Event()
+        manager.subscribe("1", MagicMock())
+        manager.subscribe("2", MagicMock())
+        manager._clients[0].subscribe.side_effect = lambda _: (
+            opening.set(),
+            opened.wait(5),
+        )
+        # A connection being opened only holds back its own subscriptions
+        thread = threading.Thread(target=manager.subscribe, args=("3", MagicMock()))
+        thread.start()
+        assert opening.wait(5)
+        manager.subscribe("4", MagicMock())
+        assert thread.is_alive()
+        manager._clients[1].subscribe.assert_called_with("4")
+        assert manager.subscriptions() == 4
+
+        # Unsubscribed before the subscription was sent
+        manager.unsubscribe("3")
+        opened.set()
+        thread.join()
+        manager._clients[0].unsubscribe.assert_called_with("3")
+        assert manager.subscriptions() == 3
+
+    def test_unsubscribe(self, manager):
+        manager.subscribe("1", MagicMock())
+        manager.unsubscribe("1")
+        manager._clients[0].unsubscribe.assert_called_once_with("1")
+        assert manager.subscriptions() == 0
+        # Unknown feeds are ignored
+        manager.unsubscribe("2")
+
+    def test_dispatch(self, manager):
+        callback_1, callback_2 = MagicMock(), MagicMock()
+        manager.subscribe("1", callback_1)
+        manager.subscribe("2", callback_2)
+
+        msg = '{"body":{"id":"2","datastreams":[]},"resource":"/feeds/2"}'
+        manager._dispatch(msg)
+        callback_2.assert_called_once_with(msg)
+        callback_1.assert_not_called()
+
+        # Messages for unknown feeds are dropped
+        dropped = MESSAGES_DROPPED.get()
+        manager._dispatch('{"body":{"id":"3"},"resource":"/feeds/3"}')
+        callback_1.assert_not_called()
+        callback_2.assert_called_once()
+        assert MESSAGES_DROPPED.get() == dropped + 1
+
+    def test_dispatch_records(self, client_factory):
+        recorder = MagicMock()
+        manager = StreamManager(
+            "ws://test-url", "key", 1, client_factory, None, recorder
+        )
+        msg = '{"body":{"id":"3"},"resource":"/feeds/3"}'
+        manager._dispatch(msg)
+        recorder.record.assert_called_once_with(msg)
+
+    def test_gauges(self, manager):
+        manager.subscribe("1", MagicMock())
+        manager.subscribe("2", MagicMock())
+        manager.subscribe("3", MagicMock())
+        assert SUBSCRIPTIONS.get() == 3
+        assert CONNECTIONS.get() == 2
+        manager.unsubscribe("3")
+        assert SUBSCRIPTIONS.get() == 2
+        manager.close()
+        assert SUBSCRIPTIONS.get() == 0
+        assert CONNECTIONS.get() == 0
+
+    def test_close(self, manager):
+        manager.subscribe("1", MagicMock())
+        manager.subscribe("2", MagicMock())
+        clients = list(manager._clients)
+        manager.close()
+        for client in clients:
+            client.close.assert_called_once()
+        assert manager.subscriptions() == 0
+        assert manager.connections() == 0
+
+
+class TestGetFeedId:
+    def test_resource(self):
+        assert get_feed_id('{"body":{"id":"7"}, "resource": "/feeds/12"}') == "12"
+
+    def test_bytes(self):
+        assert get_feed_id(b'{"body":{},"resource":"/feeds/12"}') == "12"
+
+    def test_body_id(self):
+        assert get_feed_id('{"body":{"id":12,"datastreams":[]}}') == "12"
+
+    def test_unknown(self):
+        assert get_feed_id('{"body":{"datastreams":[]}}') is None
+        assert get_feed_id('{"status":"ok"}') is None
+        assert get_feed_id("not-json") is None
@@ -218,3 +218,15 @@ class TestTag:
                 self.validate_tag_data(feed, rest_client, tag_data_2)
             else:
                 self.validate_tag_data(feed, rest_client, tag_data)
+
+    def test_iter_all(self, tag_data):
+        rest_client = Mock(spec=RestClient)
+        rest_client.get.side_effect = [
+            {"results": [dict(tag_data, id="1"), dict(tag_data, id="2")]},
+            {"results": [dict(tag_data, id="3")]},
+        ]
+
+        tags = Tag.iter_all(rest_client, page_size=2)
+        assert [tag.get_id() for tag in tags] == ["1", "2", "3"]
+        rest_client.get.assert_any_call("/tags", params={"limit": 2, "offset": 0})
+        rest_client.get.assert_any_call("/tags", params={"limit": 2, "offset": 2})
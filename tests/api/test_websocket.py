@@ -10,21 +10,24 @@ import threading
 
 # Third-party
 import pytest
-from websocket import WebSocketApp
+from websocket import WebSocketApp, WebSocketTimeoutException
 
 # InOrbit
-from sick_tag_loc_connector.api.websocket import WebSocketClient
+from sick_tag_loc_connector.api.websocket import WebSocketClient, backoff_delay
+from sick_tag_loc_connector.metrics import REGISTRY
 
 
 class TestWebSocketClient:
     @pytest.fixture
     def ws_client(self):
-        return WebSocketClient(
+        ws_client = WebSocketClient(
             "ws://test-url",
             "key",
             "my_feed_id",
             MagicMock(),
         )
+        yield ws_client
+        ws_client.close()
 
     @pytest.fixture
     def mock_websocket(self):
@@ -72,6 +75,15 @@ class TestWebSocketClient:
         assert ws_client.connected() is True
         assert ws_client.url == ws_client.ws.url
 
+    def test_open_timeout(self):
+        ws_client = WebSocketClient(
+            "ws://127.0.0.1:1", "key", "my_feed_id", MagicMock(), open_timeout=0.01
+        )
+        assert ws_client.open_timeout == 0.01
+        with pytest.raises(TimeoutError, match="Timed out opening connection"):
+            ws_client.open()
+        assert ws_client.connected() is False
+
     def test_close(self, ws_client, mock_websocket):
         ws_client.ws = mock_websocket
         ws_client._thread = MagicMock(spec=threading.Thread)
@@ -108,3 +120,124 @@ class TestWebSocketClient:
             '"resource":"/feeds/my_feed_id"}'
         )
         assert ws_client.connected() is True
+
+    def test_subscribe_opens_once(self, ws_client, mock_websocket):
+        def open():
+            # Slow to open, as the other subscriptions wait for it
+            threading.Event().wait(0.1)
+            ws_client.ws = mock_websocket
+            ws_client.on_open()
+
+        ws_client.open = MagicMock(side_effect=open)
+        threads = [
+            threading.Thread(target=ws_client.subscribe, args=(feed_id,))
+            for feed_id in ("1", "2", "3")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ws_client.open.assert_called_once()
+        assert mock_websocket.send.call_count == 3
+
+    def test_subscribe_feed_id(self, ws_client, mock_websocket):
+        ws_client.on_open()
+        ws_client.ws = mock_websocket
+        ws_client.subscribe("other_feed_id")
+        ws_client.ws.send.assert_called_once_with(
+            '{"headers":{"X-ApiKey":"key"}, '
+            '"method":"subscribe", '
+            '"resource":"/feeds/other_feed_id"}'
+        )
+
+    def test_unsubscribe(self, ws_client, mock_websocket):
+        ws_client.on_open()
+        ws_client.ws = mock_websocket
+        ws_client.unsubscribe()
+        ws_client.ws.send.assert_called_once_with(
+            '{"headers":{"X-ApiKey":"key"}, '
+            '"method":"unsubscribe", '
+            '"resource":"/feeds/my_feed_id"}'
+        )
+
+    def test_unsubscribe_not_connected(self, ws_client, mock_websocket):
+        ws_client.ws = mock_websocket
+        ws_client.unsubscribe()
+        mock_websocket.send.assert_not_called()
+
+    def test_reconnect(self, ws_client, mock_websocket):
+        ws_client.on_open()
+        ws_client.ws = mock_websocket
+        ws_client.subscribe()
+        ws_client.subscribe("other_feed_id")
+        ws_client.unsubscribe("other_feed_id")
+        mock_websocket.send.reset_mock()
+
+        # A lost connection is down until it is reopened
+        ws_client.on_close(1006, "")
+        assert ws_client.reconnecting() is True
+        assert ws_client.get_downtime() > 0
+        # Feeds subscribed meanwhile don't open another connection
+        ws_client.subscribe("new_feed_id")
+        mock_websocket.send.assert_not_called()
+
+        ws_client.on_open()
+        assert ws_client.reconnecting() is False
+        assert ws_client.reconnects == 1
+        sent = sorted(call.args[0] for call in mock_websocket.send.call_args_list)
+        assert sent == [
+            ws_client._build_message("subscribe", "my_feed_id"),
+            ws_client._build_message("subscribe", "new_feed_id"),
+        ]
+        downtime = ws_client.get_downtime()
+        assert downtime > 0
+        assert ws_client.get_downtime() == downtime
+
+    def test_close_is_not_lost(self, ws_client, mock_websocket):
+        ws_client.on_open()
+        ws_client.ws = mock_websocket
+        ws_client.close()
+        ws_client.on_close(1000, "")
+        assert ws_client.reconnecting() is False
+        assert ws_client.get_downtime() == 0
+
+    def test_close_unexports_downtime(self, ws_client, mock_websocket):
+        series = f'sick_websocket_downtime_seconds_total{{stream="{ws_client.name}"}}'
+        ws_client.on_open()
+        assert series in REGISTRY.render()
+        ws_client.ws = mock_websocket
+        ws_client.close()
+        # The registry doesn't keep the closed client around
+        assert series not in REGISTRY.render()
+        # Reopening the connection exports it again
+        ws_client.on_open()
+        assert series in REGISTRY.render()
+
+    def test_on_pong(self, ws_client, mock_websocket):
+        count, _ = ws_client._rtt.totals()
+        mock_websocket.last_ping_tm = 100.0
+        mock_websocket.last_pong_tm = 100.25
+        ws_client._on_app_pong(mock_websocket, b"")
+        assert ws_client.rtt == 0.25
+        # Pongs not answering a keepalive ping are ignored
+        mock_websocket.last_ping_tm = 0.0
+        ws_client._on_app_pong(mock_websocket, b"")
+        assert ws_client.rtt == 0.25
+        assert ws_client._rtt.totals()[0] == count + 1
+
+    def test_ping_timeout(self, ws_client, mock_websocket):
+        error = WebSocketTimeoutException("ping/pong timed out")
+        ws_client._on_app_error(mock_websocket, error)
+        assert ws_client.ping_timeouts == 0
+        ws_client.on_open()
+        ws_client._on_app_error(mock_websocket, error)
+        assert ws_client.ping_timeouts == 1
+
+
+def test_backoff_delay():
+    delays = [backoff_delay(0, 0.5, 30.0) for _ in range(1000)]
+    assert all(0 <= delay <= 0.5 for delay in delays)
+    # The delays are spread out, not all the same
+    assert max(delays) - min(delays) > 0.25
+    assert all(0 <= backoff_delay(3, 0.5, 30.0) <= 4.0 for _ in range(1000))
+    assert all(backoff_delay(1000, 0.5, 30.0) <= 30.0 for _ in range(1000))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector import __version__
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """The measurements of the session, written to --benchmark-results if set.
+
+    The file can be compared with scripts/compare_benchmarks.py to find regressions
+    between releases.
+    """
+    results = []
+    yield results
+    if path := request.config.getoption("--benchmark-results"):
+        report = {
+            "version": __version__,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with open(path, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+@pytest.fixture
+def measure_rate(request, benchmark_results):
+    """Measure how many times per second a function can be called.
+
+    Every measurement is recorded under the test ID and the function name (or the
+    given name).
+    """
+
+    def measure(
+        func: Callable,
+        items: Iterable,
+        min_time: float = 0.2,
+        name: str | None = None,
+        per_call: int = 1,
+    ) -> float:
+        items = list(items)
+        calls = 0
+        start = time.perf_counter()
+        while (elapsed := time.perf_counter() - start) < min_time:
+            for item in items:
+                func(item)
+            calls += len(items)
+        rate = calls * per_call / elapsed
+        benchmark_results.append(
+            {
+                "test": request.node.nodeid,
+                "name": name or func.__name__,
+                "rate": rate,
+                "calls": calls,
+                "elapsed": elapsed,
+            }
+        )
+        return rate
+
+    return measure
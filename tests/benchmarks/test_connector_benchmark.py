@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import itertools
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api import Tag, WebSocketClient
+from sick_tag_loc_connector.connector import SickTagLocConnector
+from sick_tag_loc_connector.models import (
+    CONNECTOR_TYPE,
+    SickTagLocConfig,
+    SickTagLocConfigModel,
+)
+
+# The full stream rate the hot path must keep up with on a single core
+TAG_COUNT = 1000
+TAG_UPDATE_RATE = 10.0
+REQUIRED_RATE = TAG_COUNT * TAG_UPDATE_RATE
+
+pytestmark = pytest.mark.benchmark
+
+
+def tag_data(i):
+    """The REST API data of a tag."""
+    return {
+        "id": str(i),
+        "alias": f"tag {i}",
+        "title": f"0x{0x240463870000 + i:012X}",
+        "private": "0",
+        "description": "",
+        "feed": "1.0.0",
+        "updated": "2024-06-10 15:05:31.425717",
+        "created": "2023-12-18 21:37:53.746653",
+        "creator": "admin",
+        "version": "1.0.0",
+        "website": "",
+        "type": "tag",
+        "tags": [],
+    }
+
+
+class TestConnectorBenchmark:
+
+    @pytest.fixture
+    def connector(self):
+        model = SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/", sick_rtls_api_key="key"
+        )
+        config = SickTagLocConfig(connector_type=CONNECTOR_TYPE, connector_config=model)
+        connector = SickTagLocConnector(config, Tag(MagicMock(), **tag_data(12)))
+        # Publishing costs nothing, only the connector code is measured
+        connector._robot_session = SimpleNamespace(publish_pose=lambda **pose: None)
+        return connector
+
+    @pytest.fixture
+    def poses(self):
+        return [
+            {"x": i * 0.01, "y": -i * 0.01, "yaw": float("inf")} for i in range(1000)
+        ]
+
+    def test_parse_pose(self, measure_rate, recorded_messages, connector):
+        rate = measure_rate(connector._parse_pose_from_ws, recorded_messages)
+        assert rate > REQUIRED_RATE
+
+    def test_transform(self, measure_rate, connector, poses):
+        rate = measure_rate(connector._transform, poses)
+        assert rate > REQUIRED_RATE
+
+    def test_publish_decision(self, measure_rate, connector, poses):
+        def publish(pose):
+            connector.mailbox.put(pose)
+            connector._execution_loop()
+
+        def skip(_):
+            connector._execution_loop()
+
+        published = measure_rate(publish, poses, name="publish")
+        skipped = measure_rate(skip, poses, name="unchanged")
+        assert published > REQUIRED_RATE
+        assert skipped > REQUIRED_RATE
+
+    def test_subscribe_message(self, measure_rate):
+        client = WebSocketClient("ws://localhost:8080", "key", None, None)
+        rate = measure_rate(
+            lambda feed_id: client._build_message("subscribe", feed_id),
+            [str(i) for i in range(TAG_COUNT)],
+            name="_build_message",
+        )
+        # Subscribing the whole fleet must take a small fraction of a second
+        assert rate > 10 * TAG_COUNT
+
+    @pytest.mark.parametrize("tag_count", [10, 100, 1000, 10000])
+    def test_tag_get_all(self, measure_rate, tag_count):
+        tags = [tag_data(i) for i in range(tag_count)]
+        rest_client = MagicMock()
+        rest_client.get.side_effect = lambda endpoint, params: {
+            "results": list(
+                itertools.islice(
+                    tags, params["offset"], params["offset"] + params["limit"]
+                )
+            )
+        }
+
+        rate = measure_rate(
+            lambda _: Tag.get_all(rest_client),
+            [None],
+            name="get_all",
+            per_call=tag_count,
+        )
+        assert len(Tag.get_all(rest_client)) == tag_count
+        assert rate > REQUIRED_RATE
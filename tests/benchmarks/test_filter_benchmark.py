@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import itertools
+import time
+
+# Third Party
+import numpy as np
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api.parsers import parse_position_targeted
+from sick_tag_loc_connector.filters import AlphaBetaFilter, KalmanFilter
+
+# The full stream rate the filters must keep up with on a single core
+TAG_COUNT = 1000
+TAG_UPDATE_RATE = 10.0
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("filter_class", [AlphaBetaFilter, KalmanFilter])
+class TestFilterBenchmark:
+
+    def test_messages_per_second(self, measure_rate, recorded_messages, filter_class):
+        position_filter = filter_class()
+        tag_ids = itertools.cycle([str(i) for i in range(TAG_COUNT)])
+
+        def parse_and_filter(msg):
+            position = parse_position_targeted(msg)
+            position_filter.update(
+                next(tag_ids), position["x"], position["y"], time.monotonic()
+            )
+
+        rate = measure_rate(parse_and_filter, recorded_messages)
+        assert rate > TAG_COUNT * TAG_UPDATE_RATE
+
+    def test_batch_positions_per_second(self, measure_rate, filter_class):
+        position_filter = filter_class()
+        slots = position_filter.slots(str(i) for i in range(TAG_COUNT))
+        x, y = np.zeros(TAG_COUNT), np.zeros(TAG_COUNT)
+        ticks = itertools.count()
+
+        def update_all(_):
+            t = np.full(TAG_COUNT, next(ticks) / TAG_UPDATE_RATE)
+            position_filter.update_batch(slots, x, y, t)
+
+        rate = measure_rate(update_all, [None], per_call=TAG_COUNT)
+        assert rate > TAG_COUNT * TAG_UPDATE_RATE
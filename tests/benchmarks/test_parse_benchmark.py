@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api.parsers import (
+    parse_position_json,
+    parse_position_targeted,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+def parse_position_baseline(msg):
+    """The original parse of SickTagLocConnector._parse_pose_from_ws()."""
+    parsed_json = json.loads(msg)
+    datastreams = parsed_json["body"]["datastreams"]
+    pose_data = {}
+    for datastream in datastreams:
+        if (ds_id := datastream["id"]) == "posX":
+            pose_data["x"] = float(datastream["current_value"].strip())
+        elif ds_id == "posY":
+            pose_data["y"] = float(datastream["current_value"].strip())
+    return pose_data
+
+
+class TestParseBenchmark:
+
+    def test_messages_per_second(self, measure_rate, recorded_messages):
+        baseline = measure_rate(parse_position_baseline, recorded_messages)
+        measure_rate(parse_position_json, recorded_messages)
+        targeted = measure_rate(parse_position_targeted, recorded_messages)
+        assert targeted > 2 * baseline
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+from types import SimpleNamespace
+
+# Third Party
+import numpy as np
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.calibration import FrameTransform
+from sick_tag_loc_connector.connector import SickTagLocConnector
+
+BATCH_SIZE = 10000
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestTransformBenchmark:
+
+    def test_positions_per_second(self, measure_rate):
+        frame_transform = FrameTransform([[0.99, 0.11, -22.9], [0.11, -0.99, -7.4]])
+        rng = np.random.default_rng(0)
+        x, y = rng.uniform(-50.0, 50.0, size=(2, BATCH_SIZE))
+        poses = [
+            {"x": px, "y": py, "yaw": float("inf")}
+            for px, py in zip(x.tolist(), y.tolist())
+        ]
+
+        # The per-tag path of the connector, one dict per pose
+        connector = SimpleNamespace(frame_transform=frame_transform)
+        per_dict = measure_rate(
+            lambda pose: SickTagLocConnector._transform(connector, pose),
+            poses,
+            name="per_dict",
+        )
+        batched = measure_rate(
+            lambda _: frame_transform.apply_batch(x, y),
+            [None],
+            name="batched",
+            per_call=BATCH_SIZE,
+        )
+        assert batched > 10 * per_dict
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import os
+
+# Third Party
+import pytest
+
+RECORDED_STREAM = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data/sick_stream.jsonl"
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        help="run the benchmarks, which are skipped by default",
+    )
+    parser.addoption(
+        "--benchmark-results",
+        metavar="PATH",
+        help="write the benchmark measurements to a JSON file (implies --benchmark)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing-dependent benchmark, run with --benchmark"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Timing depends on the machine and its load, so benchmarks are opt-in
+    if config.getoption("--benchmark") or config.getoption("--benchmark-results"):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def recorded_messages():
+    """Messages recorded from a SICK RTLS stream, one per line."""
+    with open(RECORDED_STREAM) as file:
+        return file.read().splitlines()
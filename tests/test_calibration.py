@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Third Party
+import numpy as np
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.calibration import (
+    FrameTransform,
+    fit_transform,
+    translation_matrix,
+)
+
+
+def apply(matrix, points):
+    matrix = np.asarray(matrix)
+    return np.asarray(points) @ matrix[:, :2].T + matrix[:, 2]
+
+
+@pytest.fixture
+def sick_points():
+    return np.random.default_rng(0).uniform(-20.0, 20.0, size=(8, 2))
+
+
+def to_inorbit(points, rotation, scale, translation):
+    cos, sin = np.cos(rotation), np.sin(rotation)
+    linear = scale * np.array([[cos, -sin], [sin, cos]]) @ np.diag([1.0, -1.0])
+    return np.asarray(points) @ linear.T + translation
+
+
+class TestFitTransform:
+    @pytest.mark.parametrize("mode", ["rigid", "similarity", "affine"])
+    def test_rigid(self, sick_points, mode):
+        inorbit_points = to_inorbit(sick_points, 0.3, 1.0, [2.0, -3.0])
+        calibration = fit_transform(sick_points, inorbit_points, mode)
+        assert calibration.rotation == pytest.approx(0.3)
+        assert calibration.scale == pytest.approx(1.0)
+        assert calibration.rms == pytest.approx(0.0, abs=1e-9)
+        assert np.allclose(apply(calibration.matrix, sick_points), inorbit_points)
+
+    def test_similarity(self, sick_points):
+        inorbit_points = to_inorbit(sick_points, -2.5, 1.05, [10.0, 4.0])
+        calibration = fit_transform(sick_points, inorbit_points, "similarity")
+        assert calibration.rotation == pytest.approx(-2.5)
+        assert calibration.scale == pytest.approx(1.05)
+        assert calibration.max_residual == pytest.approx(0.0, abs=1e-9)
+
+        # A rigid fit cannot absorb the scale and reports it in the residuals
+        calibration = fit_transform(sick_points, inorbit_points, "rigid")
+        assert calibration.scale == pytest.approx(1.0)
+        assert calibration.rms > 0.1
+
+    def test_noisy_residuals(self, sick_points):
+        noise = np.random.default_rng(1).normal(0.0, 0.05, size=sick_points.shape)
+        inorbit_points = to_inorbit(sick_points, 0.1, 1.0, [1.0, 1.0]) + noise
+        calibration = fit_transform(sick_points, inorbit_points)
+        assert len(calibration.residuals) == len(sick_points)
+        assert calibration.rotation == pytest.approx(0.1, abs=0.01)
+        assert 0 < calibration.rms < 0.1
+        assert calibration.max_residual >= calibration.rms
+
+    def test_translation_only(self):
+        # The previous translation-only calibration is a special case
+        sick_points = [(12.79, -1.86), (13.29, -1.13), (11.77, -3.41)]
+        inorbit_points = apply(translation_matrix(20.0, 5.0), sick_points)
+        assert np.allclose(inorbit_points[0], [12.79 - 20.0, 1.86 - 5.0])
+        calibration = fit_transform(sick_points, inorbit_points)
+        assert np.allclose(calibration.matrix, translation_matrix(20.0, 5.0))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Invalid calibration mode"):
+            fit_transform([(0, 0), (1, 1)], [(0, 0), (1, 1)], "projective")
+        with pytest.raises(ValueError, match="needs an InOrbit counterpart"):
+            fit_transform([(0, 0), (1, 1)], [(0, 0)])
+        with pytest.raises(ValueError, match="At least 2 points"):
+            fit_transform([(0, 0)], [(0, 0)])
+        with pytest.raises(ValueError, match="At least 3 points"):
+            fit_transform([(0, 0), (1, 1)], [(0, 0), (1, 1)], "affine")
+
+
+class TestFrameTransform:
+    @pytest.fixture
+    def frame_transform(self):
+        return FrameTransform([[0.0, -1.0, 2.0], [1.0, 0.0, -3.0]])
+
+    def test_apply(self, frame_transform):
+        assert frame_transform.apply(1.0, 2.0) == (0.0, -2.0)
+
+    def test_apply_batch(self, frame_transform, sick_points):
+        x, y = frame_transform.apply_batch(sick_points[:, 0], sick_points[:, 1])
+        expected = apply(frame_transform.matrix, sick_points)
+        assert np.allclose(np.column_stack([x, y]), expected)
+        # The single position path gives the same results
+        for point, batched in zip(sick_points, expected):
+            assert np.allclose(frame_transform.apply(*point), batched)
+
+    def test_apply_batch_lists(self, frame_transform):
+        x, y = frame_transform.apply_batch([1.0, 0.0], [2.0, 0.0])
+        assert x.tolist() == [0.0, 2.0]
+        assert y.tolist() == [-2.0, -3.0]
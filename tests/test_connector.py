@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+import time
+from unittest.mock import MagicMock
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api import Tag
+from sick_tag_loc_connector.connector import SickTagLocConnector
+from sick_tag_loc_connector.metrics import REGISTRY
+from sick_tag_loc_connector.models import (
+    CONNECTOR_TYPE,
+    SickTagLocConfig,
+    SickTagLocConfigModel,
+)
+from sick_tag_loc_connector.publisher import PosePublisher
+
+
+def build_message(x: float, y: float) -> str:
+    return json.dumps(
+        {
+            "body": {
+                "id": "12",
+                "datastreams": [
+                    {"id": "posX", "current_value": str(x)},
+                    {"id": "posY", "current_value": str(y)},
+                ],
+            },
+            "resource": "/feeds/12",
+        }
+    )
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestEventDrivenPublishing:
+    @pytest.fixture
+    def connector(self):
+        connectors = []
+
+        def create(**kwargs):
+            model = SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                sick_rtls_api_key="key",
+                publish_mode="event",
+                **kwargs,
+            )
+            config = SickTagLocConfig(
+                connector_type=CONNECTOR_TYPE, connector_config=model, update_freq=10.0
+            )
+            tag = Tag(MagicMock(), id="12", title="0x240463870012", type="tag")
+            connector = SickTagLocConnector(config, tag)
+            connector._robot_session = MagicMock()
+            # Only the execution loop runs, without any connection
+            connector._connect = MagicMock()
+            connector._disconnect = MagicMock()
+            connector.start()
+            connectors.append(connector)
+            return connector
+
+        yield create
+        for connector in connectors:
+            connector.stop()
+
+    def test_publishes_on_arrival(self, connector):
+        connector = connector()
+        publish_pose = connector._robot_session.publish_pose
+        assert connector.event_driven
+        connector._parse_pose_from_ws(build_message(1.0, 2.0))
+        assert wait_for(lambda: publish_pose.call_count == 1)
+        publish_pose.assert_called_once_with(x=1.0, y=-2.0, yaw=float("inf"))
+
+        # Unchanged poses don't publish again
+        connector._parse_pose_from_ws(build_message(1.0, 2.0))
+        time.sleep(0.2)
+        assert publish_pose.call_count == 1
+
+    def test_max_rate(self, connector):
+        connector = connector(publish_max_rate=5.0)
+        publish_pose = connector._robot_session.publish_pose
+        connector._parse_pose_from_ws(build_message(1.0, 2.0))
+        assert wait_for(lambda: publish_pose.call_count == 1)
+        # Poses arriving before the next publish is due are coalesced
+        for i in range(10):
+            connector._parse_pose_from_ws(build_message(2.0 + i, 2.0))
+        time.sleep(0.1)
+        assert publish_pose.call_count == 1
+        assert wait_for(lambda: publish_pose.call_count == 2)
+        assert publish_pose.call_args.kwargs["x"] == 11.0
+        time.sleep(0.3)
+        assert publish_pose.call_count == 2
+
+    def test_deadband_time(self, connector):
+        connector = connector(publish_deadband_distance=1.0, publish_deadband_time=0.2)
+        publish_pose = connector._robot_session.publish_pose
+        connector._parse_pose_from_ws(build_message(1.0, 2.0))
+        assert wait_for(lambda: publish_pose.call_count == 1)
+        # Jitter is held back until the time deadband is up, without new messages
+        connector._parse_pose_from_ws(build_message(1.1, 2.0))
+        time.sleep(0.1)
+        assert publish_pose.call_count == 1
+        assert wait_for(lambda: publish_pose.call_count == 2)
+        assert publish_pose.call_args.kwargs["x"] == 1.1
+
+    def test_stop(self, connector):
+        connector = connector()
+        start = time.monotonic()
+        connector.stop()
+        # The blocked execution loop is woken up, not waiting for a new pose
+        assert time.monotonic() - start < 0.5
+
+
+class TestPollPublishing:
+    @pytest.fixture
+    def connector(self):
+        model = SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_api_key="key",
+            publish_deadband_distance=1.0,
+            publish_deadband_time=10.0,
+        )
+        config = SickTagLocConfig(connector_type=CONNECTOR_TYPE, connector_config=model)
+        tag = Tag(MagicMock(), id="12", title="0x240463870012", type="tag")
+        connector = SickTagLocConnector(config, tag)
+        connector._robot_session = MagicMock()
+        return connector
+
+    def test_overwritten_poses(self, connector):
+        publish_pose = connector._robot_session.publish_pose
+        connector.stream_manager = MagicMock()
+        connector._connect()
+        for i in range(5):
+            connector._parse_pose_from_ws(build_message(i, 0.0))
+        connector._execution_loop()
+        # Only the newest pose is published, the others are counted as overwritten
+        publish_pose.assert_called_once_with(x=4.0, y=0.0, yaw=float("inf"))
+        assert connector.mailbox.seq == 5
+        assert connector.mailbox.overwritten == 4
+        assert 'sick_tag_poses_overwritten_total{tag="12"} 4' in REGISTRY.render()
+        # The registry doesn't keep the disconnected connector around
+        connector._disconnect()
+        assert 'sick_tag_poses_overwritten_total{tag="12"}' not in REGISTRY.render()
+
+    def test_held_back_pose(self, connector):
+        publish_pose = connector._robot_session.publish_pose
+        connector._parse_pose_from_ws(build_message(0.0, 0.0))
+        connector._execution_loop()
+        connector._parse_pose_from_ws(build_message(0.5, 0.0))
+        connector._execution_loop()
+        assert publish_pose.call_count == 1
+        # The pose held back by the deadband is still published once its time is up
+        connector._deadband._last_at -= 10.0
+        connector._execution_loop()
+        assert publish_pose.call_count == 2
+        assert publish_pose.call_args.kwargs["x"] == 0.5
+        connector._execution_loop()
+        assert publish_pose.call_count == 2
+
+
+class TestSharedPublisher:
+    @pytest.fixture
+    def publisher(self):
+        publisher = PosePublisher(max_rate=100.0, max_latency=0.01)
+        publisher.start()
+        yield publisher
+        publisher.stop()
+
+    def test_deadband_time(self, publisher):
+        model = SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_api_key="key",
+            publish_deadband_distance=1.0,
+            publish_deadband_time=0.2,
+        )
+        config = SickTagLocConfig(connector_type=CONNECTOR_TYPE, connector_config=model)
+        tag = Tag(MagicMock(), id="12", title="0x240463870012", type="tag")
+        connector = SickTagLocConnector(config, tag, publisher=publisher)
+        connector._robot_session = MagicMock()
+        publish_pose = connector._robot_session.publish_pose
+
+        connector._parse_pose_from_ws(build_message(1.0, 2.0))
+        assert wait_for(lambda: publish_pose.call_count == 1)
+        # Jitter is held back until the time deadband is up, without new messages
+        connector._parse_pose_from_ws(build_message(1.1, 2.0))
+        time.sleep(0.1)
+        assert publish_pose.call_count == 1
+        assert wait_for(lambda: publish_pose.call_count == 2)
+        assert publish_pose.call_args.kwargs["x"] == 1.1
+        time.sleep(0.3)
+        assert publish_pose.call_count == 2
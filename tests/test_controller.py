@@ -4,7 +4,10 @@
 # Copyright 2024 InOrbit, Inc.
 
 # Standard
-from unittest.mock import Mock
+import copy
+import threading
+import time
+from unittest.mock import Mock, patch
 
 # Third Party
 import pytest
@@ -12,7 +15,15 @@ import requests_mock
 
 # InOrbit
 from sick_tag_loc_connector.api import Tag
-from sick_tag_loc_connector.controller import SickTagLocMasterController
+from sick_tag_loc_connector.connector import SickTagLocConnector
+from sick_tag_loc_connector.controller import (
+    CONNECTORS,
+    SickTagLocMasterController,
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+)
+from sick_tag_loc_connector.metrics import REGISTRY
 from sick_tag_loc_connector.models import (
     SickTagLocConfig,
     SickTagLocConfigModel,
@@ -88,11 +99,18 @@ class TestSickTagLocMasterController:
         assert controller.config is sick_tag_loc_config
         assert controller.rest_client.headers == headers
         assert controller.rest_client.url == url
+        assert controller.rest_client.timeout == (
+            connector_config.sick_rtls_http_connect_timeout,
+            connector_config.sick_rtls_http_read_timeout,
+        )
+        assert controller.stream_manager.url == connector_config.get_websocket_url()
+        assert controller.stream_manager.pool_size == 1
 
         assert len(controller.connectors) == 2
         validations = 0
         for connector in controller.connectors:
             assert connector.config is sick_tag_loc_config
+            assert connector.stream_manager is controller.stream_manager
             assert isinstance(connector.tag, Tag)
             for data in tags_data["results"]:
                 if data["id"] == connector.tag._id:
@@ -100,6 +118,52 @@ class TestSickTagLocMasterController:
                     validations = validations + 1
         assert validations == len(controller.connectors)
 
+    def test_init_paginated(self, m, sick_tag_loc_config, tags_data):
+        sick_tag_loc_config.connector_config.sick_rtls_page_size = 1
+        url = f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags"
+        for offset, page in enumerate([[tag] for tag in tags_data["results"]] + [[]]):
+            m.get(f"{url}?limit=1&offset={offset}", json={"results": page})
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+
+        assert [c.tag.get_id() for c in controller.connectors] == ["12", "12_test"]
+        assert m.call_count == 3
+
+    def test_init_sharded(self, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        shards = [
+            SickTagLocMasterController(sick_tag_loc_config, index, 2)
+            for index in range(2)
+        ]
+        tag_ids = [
+            connector.tag.get_id()
+            for controller in shards
+            for connector in controller.connectors
+        ]
+        # Every tag is managed by exactly one shard
+        assert sorted(tag_ids) == ["12", "12_test"]
+        assert shards[0].get_health().connectors == len(shards[0].connectors)
+
+        with pytest.raises(ValueError, match="The worker index must be between"):
+            SickTagLocMasterController(sick_tag_loc_config, 2, 2)
+
+    def test_init_instance_shards(self, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        tag_ids = []
+        for index in range(4):
+            config = copy.deepcopy(sick_tag_loc_config)
+            config.connector_config.shard_index = index
+            config.connector_config.shard_count = 4
+            controller = SickTagLocMasterController(config)
+            tag_ids.extend(c.tag.get_id() for c in controller.connectors)
+        # Every tag is connected by exactly one instance
+        assert sorted(tag_ids) == ["12", "12_test"]
+
     def test_start(self, m, sick_tag_loc_config, tags_data):
         m.get(
             f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
@@ -114,6 +178,124 @@ class TestSickTagLocMasterController:
         for connector in controller.connectors:
             connector.start.assert_called_once()
 
+    def test_start_parallel(self, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+
+        # Both connectors must be starting at the same time to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        for connector in controller.connectors:
+            connector.start = Mock(side_effect=barrier.wait)
+
+        controller.start()
+        assert sorted(r.tag_id for r in controller.start_report) == ["12", "12_test"]
+        assert all(r.status == STATUS_OK for r in controller.start_report)
+
+    def test_start_timeout_and_error(self, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        sick_tag_loc_config.connector_config.connector_timeout = 0.1
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+
+        release = threading.Event()
+        controller._connectors["12"].start = Mock(side_effect=lambda: release.wait(5))
+        controller._connectors["12_test"].start = Mock(side_effect=OSError("refused"))
+
+        start = time.perf_counter()
+        controller.start()
+        release.set()
+
+        # The slow connector does not hold back the controller
+        assert time.perf_counter() - start < 2
+        reports = {r.tag_id: r for r in controller.start_report}
+        assert reports["12"].status == STATUS_TIMEOUT
+        assert reports["12"].duration >= 0.1
+        assert reports["12_test"].status == STATUS_ERROR
+        assert reports["12_test"].error == "refused"
+
+    @patch.object(SickTagLocConnector, "stop")
+    @patch.object(SickTagLocConnector, "start")
+    def test_publish_batching(self, start, stop, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        sick_tag_loc_config.connector_config.publish_batching = True
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        assert controller.publisher is not None
+        for connector in controller.connectors:
+            assert connector.publisher is controller.publisher
+
+        controller.publisher.start = Mock()
+        controller.publisher.stop = Mock()
+        controller.start()
+        controller.publisher.start.assert_called_once()
+        controller.stop()
+        controller.publisher.stop.assert_called_once()
+
+    def test_publish_batching_disabled(self, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        assert controller.publisher is None
+        assert all(c.publisher is None for c in controller.connectors)
+
+    def test_position_filter(self, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        sick_tag_loc_config.connector_config.position_filter = "kalman"
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        assert controller.position_filter is not None
+        for connector in controller.connectors:
+            assert connector.position_filter is controller.position_filter
+
+    def test_record(self, m, sick_tag_loc_config, tags_data, tmp_path):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        path = str(tmp_path / "stream.rec")
+        sick_tag_loc_config.connector_config.sick_rtls_record_path = path
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        assert controller.recorder.path == path
+        assert controller.stream_manager.recorder is controller.recorder
+
+        for connector in controller.connectors:
+            connector.stop = Mock()
+        controller.stop()
+        controller.recorder.record("frame")
+        assert controller.recorder.frames == 0
+
+    @patch("sick_tag_loc_connector.controller.MetricsServer")
+    def test_metrics(self, metrics_server, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        assert controller.metrics_server is None
+        assert CONNECTORS.get() == 2
+
+        sick_tag_loc_config.connector_config.metrics_port = 9100
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        metrics_server.assert_called_once_with(REGISTRY, "127.0.0.1", 9100)
+        for connector in controller.connectors:
+            connector.start = Mock()
+            connector.stop = Mock()
+        controller.start()
+        controller.metrics_server.start.assert_called_once()
+        controller.stop()
+        controller.metrics_server.stop.assert_called_once()
+
     def test_stop(self, m, sick_tag_loc_config, tags_data):
         m.get(
             f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
@@ -123,7 +305,113 @@ class TestSickTagLocMasterController:
 
         for connector in controller.connectors:
             connector.stop = Mock()
+        controller.stream_manager.close = Mock()
+        controller.rest_client.close = Mock()
 
         controller.stop()
         for connector in controller.connectors:
             connector.stop.assert_called_once()
+        assert all(r.status == STATUS_OK for r in controller.stop_report)
+        controller.stream_manager.close.assert_called_once()
+        controller.rest_client.close.assert_called_once()
+
+    def test_refresh(self, m, sick_tag_loc_config, tags_data):
+        url = f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags"
+        m.get(url, json=tags_data)
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        kept = controller._connectors["12"]
+
+        # Tag "12_test" is removed and "13" is added
+        new_data = copy.deepcopy(tags_data)
+        new_data["results"][1]["id"] = "13"
+        m.get(url, json=new_data)
+        report = controller.refresh()
+
+        assert report.added == ["13"]
+        assert report.removed == ["12_test"]
+        assert report.duration > 0
+        assert controller.last_refresh is report
+        assert controller.refresh_count == 1
+        assert controller.refresh_total_duration == report.duration
+        assert sorted(controller._connectors) == ["12", "13"]
+        assert controller._connectors["12"] is kept
+
+        # Nothing changes on a refresh without differences
+        report = controller.refresh()
+        assert report.added == report.removed == []
+        assert controller.refresh_count == 2
+
+    @patch.object(SickTagLocConnector, "stop")
+    @patch.object(SickTagLocConnector, "start")
+    def test_refresh_running(self, start, stop, m, sick_tag_loc_config, tags_data):
+        url = f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags"
+        m.get(url, json=tags_data)
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        controller.start()
+        assert start.call_count == 2
+
+        new_data = copy.deepcopy(tags_data)
+        new_data["results"][1]["id"] = "13"
+        m.get(url, json=new_data)
+        controller.refresh()
+
+        # Only the added tag is started and only the removed tag is stopped
+        assert start.call_count == 3
+        assert stop.call_count == 1
+        controller.stop()
+        assert stop.call_count == 3
+
+    @patch.object(SickTagLocConnector, "stop")
+    @patch.object(SickTagLocConnector, "start")
+    def test_refresh_readers(self, start, stop, m, sick_tag_loc_config, tags_data):
+        url = f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags"
+        m.get(url, json=tags_data)
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        controller.start()
+
+        starting, release = threading.Event(), threading.Event()
+        start.side_effect = lambda: (starting.set(), release.wait(5))
+        new_data = copy.deepcopy(tags_data)
+        new_data["results"][1]["id"] = "13"
+        m.get(url, json=new_data)
+        thread = threading.Thread(target=controller.refresh)
+        thread.start()
+        assert starting.wait(5)
+
+        # The connectors can be read while the new one is starting
+        begin = time.monotonic()
+        assert sorted(c.tag.get_id() for c in controller.connectors) == ["12", "13"]
+        assert controller.get_health().connectors == 2
+        assert time.monotonic() - begin < 1
+        release.set()
+        thread.join()
+        controller.stop()
+
+    @patch.object(SickTagLocConnector, "stop")
+    @patch.object(SickTagLocConnector, "start")
+    def test_refresh_loop(self, start, stop, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        sick_tag_loc_config.connector_config.tag_refresh_interval = 0.01
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        controller.start()
+        deadline = time.monotonic() + 5
+        while controller.refresh_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        controller.stop()
+
+        assert controller.refresh_count >= 2
+        assert controller._refresh_thread is None
+
+    def test_refresh_loop_disabled(self, m, sick_tag_loc_config, tags_data):
+        m.get(
+            f"{sick_tag_loc_config.connector_config.get_rest_api_url()}/tags",
+            json=tags_data,
+        )
+        controller = SickTagLocMasterController(sick_tag_loc_config)
+        for connector in controller.connectors:
+            connector.start = Mock()
+        controller.start()
+        assert controller._refresh_thread is None
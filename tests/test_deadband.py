@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# InOrbit
+from sick_tag_loc_connector.deadband import Deadband
+
+
+class TestDeadband:
+    def test_first_pose(self):
+        assert Deadband(distance=1.0, time=10.0).check({"x": 0.0, "y": 0.0}, 0.0)
+
+    def test_no_deadband(self):
+        deadband = Deadband()
+        assert deadband.check({"x": 0.0, "y": 0.0}, 0.0)
+        assert deadband.check({"x": 0.001, "y": 0.0}, 0.1)
+        # Unchanged poses are never published
+        assert not deadband.check({"x": 0.001, "y": 0.0}, 100.0)
+
+    def test_distance(self):
+        deadband = Deadband(distance=0.05)
+        assert deadband.check({"x": 0.0, "y": 0.0}, 0.0)
+        # Jitter is filtered out, even after a long time
+        assert not deadband.check({"x": 0.01, "y": -0.02}, 1.0)
+        assert not deadband.check({"x": 0.03, "y": 0.03}, 1000.0)
+        # The distance is measured from the last published pose
+        assert deadband.check({"x": 0.04, "y": 0.04}, 1000.1)
+        assert not deadband.check({"x": 0.0, "y": 0.04}, 1000.2)
+
+    def test_time(self):
+        deadband = Deadband(distance=0.05, time=5.0)
+        assert deadband.check({"x": 0.0, "y": 0.0}, 0.0)
+        assert not deadband.check({"x": 0.01, "y": 0.0}, 4.9)
+        assert deadband.check({"x": 0.01, "y": 0.0}, 5.0)
+        assert not deadband.check({"x": 0.01, "y": 0.0}, 50.0)
+        assert not deadband.check({"x": 0.02, "y": 0.0}, 9.9)
+        assert deadband.check({"x": 0.02, "y": 0.0}, 10.0)
+
+    def test_reset(self):
+        deadband = Deadband(distance=1.0)
+        assert deadband.check({"x": 0.0, "y": 0.0}, 0.0)
+        assert not deadband.check({"x": 0.0, "y": 0.0}, 1.0)
+        deadband.reset()
+        assert deadband.check({"x": 0.0, "y": 0.0}, 2.0)
+
+    def test_retry_after(self):
+        deadband = Deadband(distance=0.05, time=5.0)
+        assert deadband.retry_after(0.0) is None
+        assert deadband.check({"x": 0.0, "y": 0.0}, 0.0)
+        assert not deadband.check({"x": 0.01, "y": 0.0}, 1.5)
+        assert deadband.retry_after(1.5) == 3.5
+        assert deadband.retry_after(6.0) == 0.0
+        # Without a time deadband, held back poses are never published
+        deadband = Deadband(distance=0.05)
+        assert deadband.check({"x": 0.0, "y": 0.0}, 0.0)
+        assert deadband.retry_after(1.0) is None
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Third Party
+import numpy as np
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.filters import (
+    INITIAL_CAPACITY,
+    AlphaBetaFilter,
+    KalmanFilter,
+    PositionFilter,
+)
+
+
+@pytest.fixture(params=[AlphaBetaFilter, KalmanFilter])
+def position_filter(request):
+    return request.param()
+
+
+class TestPositionFilter:
+    def test_abstract(self):
+        class IncompleteFilter(PositionFilter):
+            def _initial_state(self, x, y):
+                return [x, y]
+
+        # Fails when it is created rather than on its first position
+        with pytest.raises(TypeError, match="abstract"):
+            IncompleteFilter()
+
+    def test_first_update(self, position_filter):
+        assert position_filter.update("1", 1.0, 2.0, 0.0) == (1.0, 2.0)
+        assert len(position_filter) == 1
+
+    def test_smooths_jitter(self, position_filter):
+        rng = np.random.default_rng(0)
+        noise = rng.normal(0.0, 0.1, size=(300, 2))
+        filtered = np.array(
+            [
+                position_filter.update("1", 1.0 + dx, 2.0 + dy, i * 0.1)
+                for i, (dx, dy) in enumerate(noise)
+            ]
+        )
+        settled = filtered[100:]
+        assert settled.std(axis=0).max() < noise[100:].std(axis=0).min()
+        assert np.allclose(settled.mean(axis=0), [1.0, 2.0], atol=0.05)
+
+    def test_tracks_motion(self, position_filter):
+        for i in range(100):
+            x, y = position_filter.update("1", i * 0.1, -i * 0.05, i * 0.1)
+        assert x == pytest.approx(9.9, abs=0.01)
+        assert y == pytest.approx(-4.95, abs=0.01)
+
+    def test_restart(self, position_filter):
+        position_filter.update("1", 0.0, 0.0, 0.0)
+        position_filter.update("1", 0.1, 0.0, 0.1)
+        # A gap longer than the reset gap starts over from the measured position
+        assert position_filter.update("1", 5.0, 5.0, 100.0) == (5.0, 5.0)
+        # So do a reset and a time going backwards
+        position_filter.reset("1")
+        assert position_filter.update("1", 1.0, 1.0, 100.1) == (1.0, 1.0)
+        assert position_filter.update("1", 2.0, 2.0, 50.0) == (2.0, 2.0)
+        # Resetting unknown tags is ignored
+        position_filter.reset("2")
+
+    def test_grows(self, position_filter):
+        for i in range(INITIAL_CAPACITY * 2 + 1):
+            position_filter.update(str(i), float(i), 0.0, 0.0)
+        assert len(position_filter) == INITIAL_CAPACITY * 2 + 1
+        assert position_filter.update("0", 0.0, 0.0, 0.1) == (0.0, 0.0)
+
+    def test_batch_matches_scalar(self, position_filter):
+        scalar = type(position_filter)()
+        rng = np.random.default_rng(1)
+        keys = ["a", "b", "c", "d"]
+        slots = position_filter.slots(keys)
+        for i in range(20):
+            x, y = rng.normal(size=4), rng.normal(size=4)
+            # Tag "d" misses updates and restarts after the gap
+            t = np.array([i * 0.1] * 3 + [i * 10.0])
+            batch_x, batch_y = position_filter.update_batch(slots, x, y, t)
+            expected = [
+                scalar.update(*args) for args in zip(keys, x.tolist(), y.tolist(), t)
+            ]
+            assert np.allclose(np.column_stack([batch_x, batch_y]), expected)
+
+
+class TestFilterParameters:
+    def test_alpha_beta(self):
+        with pytest.raises(ValueError, match="Alpha must be in"):
+            AlphaBetaFilter(alpha=0)
+        with pytest.raises(ValueError, match="Alpha must be in"):
+            AlphaBetaFilter(beta=2)
+
+    def test_kalman(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            KalmanFilter(process_noise=0)
+        with pytest.raises(ValueError, match="must be positive"):
+            KalmanFilter(measurement_noise=0)
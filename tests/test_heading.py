@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import math
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.heading import HeadingEstimator
+
+
+class TestHeadingEstimator:
+    def test_unknown_until_moving(self):
+        estimator = HeadingEstimator(min_displacement=0.2)
+        assert estimator.update(0.0, 0.0) == math.inf
+        assert estimator.update(0.1, 0.0) == math.inf
+        assert estimator.update(0.3, 0.0) == 0.0
+        assert estimator.yaw == 0.0
+
+    def test_directions(self):
+        for angle in (0.0, math.pi / 2, -math.pi / 2, 3 * math.pi / 4):
+            estimator = HeadingEstimator(min_displacement=0.1, smoothing=1.0)
+            for i in range(5):
+                yaw = estimator.update(i * math.cos(angle), i * math.sin(angle))
+            assert yaw == pytest.approx(angle)
+
+    def test_jitter_keeps_heading(self):
+        estimator = HeadingEstimator(min_displacement=0.2, history=3)
+        for i in range(5):
+            yaw = estimator.update(i * 0.5, 0.0)
+        for _ in range(3):
+            estimator.update(2.0, 0.0)
+        # Parked with centimeter jitter
+        for dx, dy in [(0.01, 0.02), (-0.02, 0.01), (0.0, -0.03), (0.02, 0.0)]:
+            assert estimator.update(2.0 + dx, dy) == yaw
+
+    def test_smoothing(self):
+        estimator = HeadingEstimator(min_displacement=0.1, smoothing=0.5, history=2)
+        estimator.update(0.0, 0.0)
+        estimator.update(1.0, 0.0)
+        # A sudden turn is followed halfway on the first update
+        yaw = estimator.update(1.0, 1.0)
+        assert 0 < yaw < math.pi / 2
+        for i in range(2, 20):
+            yaw = estimator.update(1.0, float(i))
+        assert yaw == pytest.approx(math.pi / 2, abs=1e-3)
+
+    def test_wraps_around(self):
+        estimator = HeadingEstimator(min_displacement=0.1, smoothing=0.5, history=2)
+        # Heading just above -π and then just below π
+        estimator.update(0.0, 0.0)
+        estimator.update(-1.0, -0.01)
+        yaw = estimator.update(-2.0, -0.0)
+        assert abs(yaw) == pytest.approx(math.pi, abs=0.01)
+
+    def test_reset(self):
+        estimator = HeadingEstimator(min_displacement=0.1)
+        estimator.update(0.0, 0.0)
+        estimator.update(1.0, 0.0)
+        estimator.reset()
+        assert estimator.yaw == math.inf
+        assert estimator.update(5.0, 5.0) == math.inf
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            HeadingEstimator(min_displacement=-1)
+        with pytest.raises(ValueError):
+            HeadingEstimator(smoothing=0)
+        with pytest.raises(ValueError):
+            HeadingEstimator(history=1)
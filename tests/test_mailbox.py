@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import threading
+
+# InOrbit
+from sick_tag_loc_connector.mailbox import PoseMailbox
+from sick_tag_loc_connector.tracing import PoseTrace
+
+
+class TestPoseMailbox:
+    def test_latest_wins(self):
+        mailbox = PoseMailbox()
+        assert mailbox.take() is None
+        assert mailbox.put({"x": 1}) == 1
+        trace = PoseTrace(received=1.0)
+        assert mailbox.put({"x": 2}, trace) == 2
+        letter = mailbox.take()
+        assert (letter.seq, letter.pose, letter.trace) == (2, {"x": 2}, trace)
+        assert mailbox.take() is None
+        assert (mailbox.seq, mailbox.overwritten, mailbox.taken) == (2, 1, 1)
+
+    def test_clear(self):
+        mailbox = PoseMailbox()
+        mailbox.put({"x": 1})
+        mailbox.clear()
+        assert mailbox.take() is None
+        assert mailbox.put({"x": 2}) == 2
+        assert mailbox.overwritten == 0
+
+    def test_concurrent_handoff(self):
+        mailbox = PoseMailbox()
+        count = 20000
+        taken = []
+
+        def consume():
+            while not taken or taken[-1] < count:
+                if letter := mailbox.take():
+                    taken.append(letter.seq)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(count):
+            mailbox.put({"x": i})
+        consumer.join(timeout=10)
+
+        # Poses are taken in order, never twice, and every pose is either taken or
+        # counted as overwritten
+        assert taken == sorted(set(taken))
+        assert taken[-1] == count
+        assert mailbox.taken == len(taken)
+        assert mailbox.taken + mailbox.overwritten == count
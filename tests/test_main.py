@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import os
+import signal
+import threading
+import time
+from unittest.mock import patch
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector import main
+
+
+def send_signal_later(signum: signal.Signals, delay: float) -> threading.Timer:
+    timer = threading.Timer(delay, os.kill, args=(os.getpid(), signum))
+    timer.start()
+    return timer
+
+
+class TestWaitForShutdown:
+
+    @pytest.mark.parametrize("signum", main.SHUTDOWN_SIGNALS)
+    def test_returns_on_signal(self, signum):
+        previous = signal.getsignal(signum)
+        send_signal_later(signum, 0.1)
+        assert main.wait_for_shutdown() is signum
+        # The original handlers are restored
+        assert signal.getsignal(signum) is previous
+
+    def test_idle_cpu(self):
+        wait = 0.5
+        send_signal_later(signal.SIGTERM, wait)
+        wall_start, cpu_start = time.monotonic(), time.process_time()
+        main.wait_for_shutdown()
+        wall, cpu = time.monotonic() - wall_start, time.process_time() - cpu_start
+
+        assert wall >= wait * 0.9
+        # A busy wait would use (at least) one core for the whole wait
+        assert cpu < wall * 0.1
+
+
+class TestStart:
+
+    @patch("sick_tag_loc_connector.main.load_and_validate")
+    @patch("sick_tag_loc_connector.main.SickTagLocMasterController")
+    def test_start_stop(self, controller_cls, load_and_validate):
+        load_and_validate.return_value.connector_config.multiprocess = False
+        controller = controller_cls.return_value
+        send_signal_later(signal.SIGTERM, 0.1)
+        with patch("sys.argv", ["sick-tag-loc-connector", "-c", "config.yaml"]):
+            main.start()
+
+        load_and_validate.assert_called_once_with("config.yaml")
+        controller_cls.assert_called_once_with(load_and_validate.return_value)
+        controller.start.assert_called_once()
+        controller.stop.assert_called_once()
+
+    @patch("sick_tag_loc_connector.main.load_and_validate")
+    @patch("sick_tag_loc_connector.main.WorkerSupervisor")
+    def test_multiprocess(self, supervisor_cls, load_and_validate):
+        load_and_validate.return_value.connector_config.multiprocess = True
+        supervisor = supervisor_cls.return_value
+        send_signal_later(signal.SIGTERM, 0.1)
+        with patch("sys.argv", ["sick-tag-loc-connector", "-c", "config.yaml"]):
+            main.start()
+
+        supervisor_cls.assert_called_once_with(load_and_validate.return_value)
+        supervisor.start.assert_called_once()
+        supervisor.stop.assert_called_once()
+
+    @pytest.mark.parametrize("signum", main.SHUTDOWN_SIGNALS)
+    @patch("sick_tag_loc_connector.main.load_and_validate")
+    @patch("sick_tag_loc_connector.main.SickTagLocMasterController")
+    def test_signal_during_start(self, controller_cls, load_and_validate, signum):
+        load_and_validate.return_value.connector_config.multiprocess = False
+        controller = controller_cls.return_value
+
+        def slow_start():
+            os.kill(os.getpid(), signum)
+            time.sleep(0.1)
+
+        controller.start.side_effect = slow_start
+        with patch("sys.argv", ["sick-tag-loc-connector", "-c", "config.yaml"]):
+            main.start()
+
+        # The connectors are stopped once they are started
+        controller.start.assert_called_once()
+        controller.stop.assert_called_once()
+
+    @patch("sick_tag_loc_connector.main.load_and_validate")
+    @patch("sick_tag_loc_connector.main.SickTagLocMasterController")
+    def test_start_error(self, controller_cls, load_and_validate):
+        load_and_validate.return_value.connector_config.multiprocess = False
+        controller = controller_cls.return_value
+        controller.start.side_effect = RuntimeError("failed")
+        with patch("sys.argv", ["sick-tag-loc-connector", "-c", "config.yaml"]):
+            with pytest.raises(RuntimeError):
+                main.start()
+        controller.stop.assert_called_once()
+
+    @patch("sick_tag_loc_connector.main.load_and_validate")
+    def test_missing_config(self, load_and_validate):
+        load_and_validate.side_effect = FileNotFoundError
+        with patch("sys.argv", ["sick-tag-loc-connector", "-c", "no.yaml"]):
+            with pytest.raises(SystemExit):
+                main.start()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import math
+import threading
+
+# Third Party
+import pytest
+import requests
+
+# InOrbit
+from sick_tag_loc_connector.metrics import (
+    CONTENT_TYPE,
+    MetricsRegistry,
+    MetricsServer,
+)
+
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_counter(self, registry):
+        counter = registry.counter("messages_total", "Messages")
+        counter.inc()
+        counter.inc(2)
+        assert counter.get() == 3
+        assert registry.render() == (
+            "# HELP messages_total Messages\n"
+            "# TYPE messages_total counter\n"
+            "messages_total 3\n"
+        )
+
+    def test_counter_threads(self, registry):
+        value = registry.counter("messages_total", "Messages").labels()
+
+        def count():
+            for _ in range(10000):
+                value.inc()
+
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # No increment is lost, even without locks
+        assert value.get() == 80000
+
+    def test_thread_churn(self, registry):
+        counter = registry.counter("messages_total", "Messages").labels()
+        histogram = registry.histogram("duration_seconds", "Duration").labels()
+
+        def update():
+            counter.inc()
+            histogram.observe(0.01)
+
+        for rounds in range(1, 4):
+            threads = [threading.Thread(target=update) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert counter.get() == 20 * rounds
+        assert histogram.totals()[-1] == pytest.approx(0.6)
+        # The cells of the threads that ended are folded into the totals
+        assert counter._cells == histogram._cells == []
+
+    def test_labels(self, registry):
+        counter = registry.counter("requests_total", "Requests", ["method", "status"])
+        counter.labels("GET", 200).inc()
+        counter.labels("GET", 200).inc()
+        counter.labels("GET", 404).inc()
+        assert counter.labels("GET", "200") is counter.labels("GET", 200)
+        assert registry.render().splitlines()[2:] == [
+            'requests_total{method="GET",status="200"} 2',
+            'requests_total{method="GET",status="404"} 1',
+        ]
+        with pytest.raises(ValueError, match="expects the labels"):
+            counter.labels("GET")
+        with pytest.raises(AttributeError):
+            counter.inc()
+
+    def test_remove(self, registry):
+        gauge = registry.gauge("queue_depth", "Queue depth", ["queue"])
+        gauge.labels("a").set_function(lambda: 1)
+        gauge.labels("b").set(2)
+        gauge.remove("a")
+        gauge.remove("missing")
+        assert registry.render().splitlines()[2:] == ['queue_depth{queue="b"} 2']
+        with pytest.raises(ValueError, match="expects the labels"):
+            gauge.remove()
+
+    def test_escape(self, registry):
+        registry.counter("tags_total", "Tags", ["tag"]).labels('a"b\\c\nd').inc()
+        assert 'tags_total{tag="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+    def test_gauge(self, registry):
+        gauge = registry.gauge("queue_depth", "Queue depth")
+        gauge.set(5)
+        assert "queue_depth 5\n" in registry.render()
+        gauge.set_function(lambda: 7.5)
+        assert "queue_depth 7.5\n" in registry.render()
+
+    def test_histogram(self, registry):
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        assert registry.render().splitlines()[2:] == [
+            'latency_seconds_bucket{le="0.1"} 2',
+            'latency_seconds_bucket{le="1"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 2.65",
+            "latency_seconds_count 4",
+        ]
+
+    def test_summary(self, registry):
+        summary = registry.summary(
+            "latency_seconds", "Latency", quantiles=(0.5, 1), window=4
+        )
+        assert all(math.isnan(v) for v in summary.get_quantiles().values())
+        assert 'latency_seconds{quantile="0.5"} NaN' in registry.render()
+        for value in (10.0, 1.0, 2.0, 3.0, 4.0):
+            summary.observe(value)
+        # Only the most recent values are in the window, the sum and count are exact
+        assert summary.get_quantiles() == {0.5: 2.5, 1: 4.0}
+        assert registry.render().splitlines()[2:] == [
+            'latency_seconds{quantile="0.5"} 2.5',
+            'latency_seconds{quantile="1"} 4',
+            "latency_seconds_sum 20",
+            "latency_seconds_count 5",
+        ]
+
+    def test_get_or_create(self, registry):
+        counter = registry.counter("messages_total", "Messages")
+        assert registry.counter("messages_total", "Messages") is counter
+        assert registry.get("messages_total") is counter
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("messages_total", "Messages")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.counter("messages_total", "Messages", ["tag"])
+
+
+class TestMetricsServer:
+    def test_serve(self):
+        registry = MetricsRegistry()
+        registry.counter("messages_total", "Messages").inc(4)
+        server = MetricsServer(registry)
+        server.start()
+        try:
+            response = requests.get(server.url, timeout=5)
+            assert response.status_code == 200
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.text == registry.render()
+            missing = requests.get(server.url.replace("/metrics", "/other"), timeout=5)
+            assert missing.status_code == 404
+        finally:
+            server.stop()
@@ -8,17 +8,30 @@ import importlib
 import os
 import sys
 from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
 
 # Third Party
 import pytest
 
 # InOrbit
 import sick_tag_loc_connector.models
-from sick_tag_loc_connector.api import RestClient
+from sick_tag_loc_connector.api import (
+    AsyncWebSocketClient,
+    RestClient,
+    WebSocketClient,
+)
+from sick_tag_loc_connector.api.websocket import (
+    DEFAULT_PING_INTERVAL,
+    DEFAULT_PING_TIMEOUT,
+)
+from sick_tag_loc_connector.filters import AlphaBetaFilter, KalmanFilter
 from sick_tag_loc_connector.models import (
     load_and_validate,
     DEFAULT_RTLS_REST_API_PORT,
     DEFAULT_RTLS_WS_PORT,
+    DEFAULT_RTLS_WS_POOL_SIZE,
+    DEFAULT_RTLS_WS_ENGINE,
+    DEFAULT_MESSAGE_PARSER,
     CONNECTOR_TYPE,
 )
 
@@ -44,6 +57,13 @@ class TestSickTagLocConfigModel:
         assert str(model.sick_rtls_http_server_address) == "https://localhost/"
         assert model.sick_rtls_rest_api_port == DEFAULT_RTLS_REST_API_PORT
         assert model.sick_rtls_websocket_port == DEFAULT_RTLS_WS_PORT
+        assert model.sick_rtls_websocket_pool_size == DEFAULT_RTLS_WS_POOL_SIZE
+        assert model.sick_rtls_websocket_engine == DEFAULT_RTLS_WS_ENGINE
+        assert model.get_websocket_client_class() is WebSocketClient
+        assert model.message_parser == DEFAULT_MESSAGE_PARSER
+        assert model.sick_rtls_websocket_reconnect is True
+        assert model.sick_rtls_websocket_ping_interval == DEFAULT_PING_INTERVAL
+        assert model.sick_rtls_websocket_ping_timeout == DEFAULT_PING_TIMEOUT
         assert model.sick_rtls_api_key is None
 
     @patch.dict(os.environ, {"SICK_RTLS_API_KEY": "keep-it-secret"})
@@ -90,6 +110,312 @@ class TestSickTagLocConfigModel:
                 sick_rtls_api_key="key",
             )
 
+    def test_metrics_port_validation(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_api_key="key",
+        )
+        assert model.metrics_port is None
+        assert model.metrics_host == "127.0.0.1"
+
+        with pytest.raises(ValueError, match="Invalid port"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                metrics_port=0,
+                sick_rtls_api_key="key",
+            )
+
+    def test_timezone_validation(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_api_key="key",
+        )
+        assert model.get_timezone() == ZoneInfo("UTC")
+        assert not model.latency_tracing
+        assert not model.publish_source_timestamp
+
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_timezone="America/Montevideo",
+            sick_rtls_api_key="key",
+        )
+        assert model.get_timezone() == ZoneInfo("America/Montevideo")
+
+        for value in ("Mars/Olympus_Mons", "../UTC"):
+            with pytest.raises(ValueError, match="Unknown timezone"):
+                sick_tag_loc_connector.models.SickTagLocConfigModel(
+                    sick_rtls_http_server_address="https://localhost/",
+                    sick_rtls_timezone=value,
+                    sick_rtls_api_key="key",
+                )
+
+    def test_ws_pool_size_validation(self):
+        with pytest.raises(ValueError, match="Must be positive and non-zero"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                sick_rtls_websocket_pool_size=0,
+                sick_rtls_api_key="key",
+            )
+
+    def test_ws_engine_validation(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_websocket_engine="asyncio",
+        )
+        assert model.get_websocket_client_class() is AsyncWebSocketClient
+
+        with pytest.raises(ValueError, match="Invalid WebSocket engine"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                sick_rtls_websocket_engine="fibers",
+            )
+
+    def test_publish_mode_validation(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+        )
+        assert model.publish_mode == "poll"
+
+        with pytest.raises(ValueError, match="Invalid publish mode"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                publish_mode="push",
+            )
+
+    def test_message_parser_validation(self):
+        with pytest.raises(ValueError, match="Invalid message parser"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                message_parser="yaml",
+            )
+
+    def test_http_client_validation(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_http_pool_size=2,
+            sick_rtls_http_connect_timeout=1.5,
+            sick_rtls_http_read_timeout=3,
+            sick_rtls_http_max_retries=0,
+            sick_rtls_http_backoff_factor=0,
+        )
+        assert model.sick_rtls_http_pool_size == 2
+        assert model.sick_rtls_http_connect_timeout == 1.5
+        assert model.sick_rtls_http_read_timeout == 3.0
+        assert model.sick_rtls_http_max_retries == 0
+        assert model.sick_rtls_http_backoff_factor == 0.0
+
+        for field in (
+            "sick_rtls_http_pool_size",
+            "sick_rtls_http_connect_timeout",
+            "sick_rtls_http_read_timeout",
+        ):
+            with pytest.raises(ValueError, match="Must be positive and non-zero"):
+                sick_tag_loc_connector.models.SickTagLocConfigModel(
+                    sick_rtls_http_server_address="https://localhost/", **{field: 0}
+                )
+        for field in ("sick_rtls_http_max_retries", "sick_rtls_http_backoff_factor"):
+            with pytest.raises(ValueError, match="Must not be negative"):
+                sick_tag_loc_connector.models.SickTagLocConfigModel(
+                    sick_rtls_http_server_address="https://localhost/", **{field: -1}
+                )
+
+    def test_pagination_validation(self):
+        with pytest.raises(ValueError, match="Must be positive and non-zero"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                sick_rtls_page_size=0,
+            )
+        with pytest.raises(ValueError, match="Must not be negative"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                sick_rtls_page_prefetch=-1,
+            )
+
+    def test_tag_refresh_interval_validation(self):
+        with pytest.raises(ValueError, match="Must not be negative"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                tag_refresh_interval=-1,
+            )
+
+    @pytest.mark.parametrize(
+        "field",
+        [
+            "sick_rtls_websocket_open_timeout",
+            "sick_rtls_websocket_reconnect_backoff",
+            "sick_rtls_websocket_reconnect_max_delay",
+            "sick_rtls_websocket_ping_timeout",
+            "worker_heartbeat_timeout",
+            "shard_count",
+            "connector_concurrency",
+            "connector_timeout",
+            "publish_max_rate",
+            "publish_max_latency",
+            "filter_process_noise",
+            "filter_measurement_noise",
+        ],
+    )
+    def test_positive_validation(self, field):
+        with pytest.raises(ValueError, match="Must be positive and non-zero"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/", **{field: 0}
+            )
+
+    def test_shard_validation(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            shard_index=2,
+            shard_count=3,
+        )
+        assert (model.shard_index, model.shard_count) == (2, 3)
+        with pytest.raises(ValueError, match="less than the shard count"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                shard_index=3,
+                shard_count=3,
+            )
+        with pytest.raises(ValueError, match="Must not be negative"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/", shard_index=-1
+            )
+
+    def test_worker_processes_validation(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/", worker_processes=3
+        )
+        assert model.get_worker_processes() == 3
+        with pytest.raises(ValueError, match="Must be at least 1"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/", worker_processes=0
+            )
+
+    def test_ping_timeout_validation(self):
+        with pytest.raises(ValueError, match="shorter than the ping interval"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                sick_rtls_websocket_ping_interval=5.0,
+                sick_rtls_websocket_ping_timeout=5.0,
+            )
+        with pytest.raises(ValueError, match="Must not be negative"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                sick_rtls_websocket_ping_interval=-1,
+            )
+        # Any timeout goes with keepalive disabled
+        sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_websocket_ping_interval=0,
+            sick_rtls_websocket_ping_timeout=60.0,
+        )
+
+    def test_deadband(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            publish_deadband_distance=0.05,
+            publish_deadband_time=10.0,
+            tag_deadbands={"tag_1": {"distance": 0.5}, "tag_2": {"time": 0}},
+        )
+        deadband = model.get_deadband("tag_1")
+        assert (deadband.distance, deadband.time) == (0.5, 10.0)
+        deadband = model.get_deadband("tag_2")
+        assert (deadband.distance, deadband.time) == (0.05, 0)
+        deadband = model.get_deadband("other")
+        assert (deadband.distance, deadband.time) == (0.05, 10.0)
+
+    def test_deadband_validation(self):
+        with pytest.raises(ValueError, match="Must not be negative"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                publish_deadband_distance=-1,
+            )
+        with pytest.raises(ValueError, match="Must not be negative"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                tag_deadbands={"tag_1": {"time": -1}},
+            )
+
+    def test_position_filter(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+        )
+        assert model.get_position_filter() is None
+
+        model.position_filter = "alpha_beta"
+        position_filter = model.get_position_filter()
+        assert isinstance(position_filter, AlphaBetaFilter)
+        assert (position_filter.alpha, position_filter.beta) == (0.5, 0.1)
+
+        model.position_filter = "kalman"
+        position_filter = model.get_position_filter()
+        assert isinstance(position_filter, KalmanFilter)
+        assert position_filter.measurement_noise == model.filter_measurement_noise
+
+    def test_position_filter_validation(self):
+        with pytest.raises(ValueError, match="Invalid position filter"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                position_filter="median",
+            )
+        with pytest.raises(ValueError, match="at most 1"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                filter_alpha=1.5,
+            )
+        with pytest.raises(ValueError, match="less than 2"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                filter_beta=-0.1,
+            )
+
+    def test_heading_estimator(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+        )
+        assert model.get_heading_estimator() is None
+
+        model.heading_from_motion = True
+        model.heading_history = 4
+        estimator = model.get_heading_estimator()
+        assert estimator.min_displacement == model.heading_min_displacement
+        assert estimator.smoothing == model.heading_smoothing
+        assert estimator.history == 4
+        assert model.get_heading_estimator() is not estimator
+
+    def test_heading_validation(self):
+        with pytest.raises(ValueError, match="Must be at least 2"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                heading_history=1,
+            )
+        with pytest.raises(ValueError, match="at most 1"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                heading_smoothing=0,
+            )
+        with pytest.raises(ValueError, match="Must not be negative"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                heading_min_displacement=-0.1,
+            )
+
+    def test_transform_matrix(self):
+        model = sick_tag_loc_connector.models.SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            translation_x=1.5,
+            translation_y=-2.0,
+        )
+        assert model.get_transform_matrix() == [[1.0, 0.0, -1.5], [0.0, -1.0, 2.0]]
+
+        model.transform_matrix = [[0.0, 1.0, 3.0], [1.0, 0.0, 4.0]]
+        assert model.get_transform_matrix() == model.transform_matrix
+
+    def test_transform_matrix_validation(self):
+        with pytest.raises(ValueError, match="Must be a 2x3 matrix"):
+            sick_tag_loc_connector.models.SickTagLocConfigModel(
+                sick_rtls_http_server_address="https://localhost/",
+                transform_matrix=[[1.0, 0.0], [0.0, 1.0]],
+            )
+
     def test_api_key_whitespace_check(self):
         with pytest.raises(ValueError, match="Whitespaces are not allowed"):
             sick_tag_loc_connector.models.SickTagLocConfigModel(
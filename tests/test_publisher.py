@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import time
+from unittest.mock import MagicMock
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.deadband import Deadband
+from sick_tag_loc_connector.publisher import PosePublisher
+from sick_tag_loc_connector.tracing import PoseTrace
+
+
+class TestPosePublisher:
+    @pytest.fixture
+    def publisher(self):
+        publisher = PosePublisher(max_rate=10.0, max_latency=0.2)
+        yield publisher
+        publisher.stop()
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            PosePublisher(max_rate=0)
+        with pytest.raises(ValueError, match="must be positive"):
+            PosePublisher(max_latency=0)
+
+    def test_flush_coalesces(self, publisher):
+        session_1, session_2 = MagicMock(), MagicMock()
+        publisher.submit("1", session_1, {"x": 1, "y": 1, "yaw": 0})
+        publisher.submit("1", session_1, {"x": 2, "y": 2, "yaw": 0})
+        publisher.submit("2", session_2, {"x": 3, "y": 3, "yaw": 0})
+
+        assert publisher.flush() == 2
+        session_1.publish_pose.assert_called_once_with(x=2, y=2, yaw=0)
+        session_2.publish_pose.assert_called_once_with(x=3, y=3, yaw=0)
+        assert publisher.submitted == 3
+        assert publisher.coalesced == 1
+        assert publisher.published == 2
+        assert publisher.flushes == 1
+
+    def test_flush_skips_unchanged(self, publisher):
+        session = MagicMock()
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0})
+        publisher.flush()
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0})
+        assert publisher.flush() == 0
+        session.publish_pose.assert_called_once()
+
+        # A discarded tag publishes its pose again
+        publisher.discard("1")
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0})
+        assert publisher.flush() == 1
+
+    def test_flush_error(self, publisher):
+        failing, session = MagicMock(), MagicMock()
+        failing.publish_pose.side_effect = RuntimeError("disconnected")
+        publisher.submit("1", failing, {"x": 1, "y": 1, "yaw": 0})
+        publisher.submit("2", session, {"x": 2, "y": 2, "yaw": 0})
+        assert publisher.flush() == 1
+        session.publish_pose.assert_called_once()
+
+    def test_flush_trace(self, publisher):
+        session, tracer = MagicMock(), MagicMock()
+        trace = PoseTrace(received=time.time(), source=1718031931.5, tracer=tracer)
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0}, trace)
+        trace = PoseTrace(received=time.time(), ts=1718031931500, tracer=tracer)
+        publisher.submit("1", session, {"x": 2, "y": 2, "yaw": 0}, trace)
+        assert publisher.flush() == 1
+        # The trace of the coalesced pose is dropped along with it
+        session.publish_pose.assert_called_once_with(x=2, y=2, yaw=0, ts=1718031931500)
+        tracer.published.assert_called_once()
+        assert tracer.published.call_args.args[0] is trace
+
+    def test_discard(self, publisher):
+        session = MagicMock()
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0})
+        publisher.discard("1")
+        assert publisher.flush() == 0
+        session.publish_pose.assert_not_called()
+
+    def test_deadband(self, publisher):
+        session = MagicMock()
+        deadband = Deadband(distance=1.0, time=0.2)
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0}, deadband=deadband)
+        assert publisher.flush() == 1
+        publisher.submit("1", session, {"x": 1.1, "y": 1, "yaw": 0}, deadband=deadband)
+        publisher.submit("1", session, {"x": 1.2, "y": 1, "yaw": 0}, deadband=deadband)
+        assert publisher.flush() == 0
+
+        # The latest pose held back is published once the time deadband is up
+        publisher.start()
+        start = time.monotonic()
+        while session.publish_pose.call_count < 2 and time.monotonic() - start < 5:
+            time.sleep(0.005)
+        assert 0.1 < time.monotonic() - start < 0.2 + 0.5
+        session.publish_pose.assert_called_with(x=1.2, y=1, yaw=0)
+
+    def test_deadband_replaced(self, publisher):
+        session = MagicMock()
+        deadband = Deadband(distance=1.0, time=0.2)
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0}, deadband=deadband)
+        publisher.flush()
+        publisher.submit("1", session, {"x": 1.1, "y": 1, "yaw": 0}, deadband=deadband)
+        # A pose that passes the deadband replaces the one held back
+        publisher.submit("1", session, {"x": 5, "y": 1, "yaw": 0}, deadband=deadband)
+        publisher.start()
+        time.sleep(0.4)
+        assert session.publish_pose.call_count == 2
+        session.publish_pose.assert_called_with(x=5, y=1, yaw=0)
+
+    def test_background_flush(self, publisher):
+        session = MagicMock()
+        publisher.start()
+        start = time.monotonic()
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0})
+        while not session.publish_pose.called and time.monotonic() - start < 5:
+            time.sleep(0.005)
+        # The pose is published within the latency bound (plus scheduling slack)
+        assert time.monotonic() - start < 0.2 + 0.5
+        session.publish_pose.assert_called_once_with(x=1, y=1, yaw=0)
+
+    def test_background_flush_rate(self):
+        publisher = PosePublisher(max_rate=5.0, max_latency=1.0)
+        session = MagicMock()
+        publisher.start()
+        start = time.monotonic()
+        for i in range(50):
+            publisher.submit("1", session, {"x": i, "y": 0, "yaw": 0})
+            time.sleep(0.01)
+        publisher.stop()
+
+        # At most one flush every 0.2s, plus the final flush on stop
+        elapsed = time.monotonic() - start
+        assert publisher.flushes <= elapsed * 5.0 + 2
+        assert publisher.coalesced > 0
+        session.publish_pose.assert_called_with(x=49, y=0, yaw=0)
+
+    def test_stop_flushes_pending(self):
+        publisher = PosePublisher(max_rate=0.1, max_latency=60.0)
+        session = MagicMock()
+        publisher.start()
+        publisher.flush()
+        publisher.submit("1", session, {"x": 1, "y": 1, "yaw": 0})
+        publisher.stop()
+        session.publish_pose.assert_called_once_with(x=1, y=1, yaw=0)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+from collections import Counter
+
+# InOrbit
+from sick_tag_loc_connector.sharding import WORKER_SALT, jump_hash, shard_of
+
+TAG_IDS = [f"tag-{i}" for i in range(10000)]
+
+
+class TestSharding:
+    def test_jump_hash(self):
+        assert [jump_hash(key, 10) for key in (0, 1, 2, 3, 2**63)] == [0, 6, 6, 8, 5]
+        assert all(jump_hash(key, 1) == 0 for key in range(100))
+
+    def test_stable(self):
+        # Every instance and worker must place the tags the same way, on any host
+        shards = [shard_of(tag_id, 4) for tag_id in ("12", "12_test", "tag-1")]
+        assert shards == [1, 3, 1]
+        assert shard_of("12", 1) == 0
+
+    def test_balanced(self):
+        counts = Counter(shard_of(tag_id, 4) for tag_id in TAG_IDS)
+        assert sorted(counts) == [0, 1, 2, 3]
+        assert all(abs(count - 2500) < 250 for count in counts.values())
+
+    def test_minimal_movement(self):
+        moved = [
+            tag_id for tag_id in TAG_IDS if shard_of(tag_id, 4) != shard_of(tag_id, 5)
+        ]
+        # Only the tags the new shard takes over move, about a fifth of them
+        assert abs(len(moved) - 2000) < 200
+        assert {shard_of(tag_id, 5) for tag_id in moved} == {4}
+
+    def test_salt(self):
+        # The workers of an instance get an even share of the tags of its shard
+        shard = [tag_id for tag_id in TAG_IDS if shard_of(tag_id, 2) == 0]
+        counts = Counter(shard_of(tag_id, 2, WORKER_SALT) for tag_id in shard)
+        assert all(abs(count - len(shard) / 2) < 250 for count in counts.values())
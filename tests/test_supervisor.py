@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import functools
+import itertools
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector import models, supervisor
+from sick_tag_loc_connector.controller import ControllerHealth
+from sick_tag_loc_connector.supervisor import WorkerSupervisor, worker_config
+
+
+# Worker entry points, run in the spawned processes
+def healthy_worker(config, index, count, heartbeats, stop, log_level):
+    while not stop.wait(0.05):
+        heartbeats.put((index, os.getpid(), ControllerHealth(connectors=index + 1)))
+
+
+def crashing_worker(config, index, count, heartbeats, stop, log_level):
+    sys.exit(3)
+
+
+def hung_worker(config, index, count, heartbeats, stop, log_level):
+    time.sleep(60)
+
+
+class FakeController:
+    def __init__(self, config, index, count):
+        self.index = index
+        self.health_calls = itertools.count()
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def get_health(self):
+        return ControllerHealth(connectors=self.index + 1)
+
+
+class StuckController(FakeController):
+    def start(self):
+        threading.Event().wait()
+
+
+class DeadlockedController(FakeController):
+    def get_health(self):
+        # Healthy at first, then stuck as if waiting for a lock that is never freed
+        if next(self.health_calls) >= 3:
+            threading.Event().wait()
+        return super().get_health()
+
+
+def controller_worker(controller_class, *args):
+    # Runs the actual worker entry point with a fake controller
+    with patch.object(supervisor, "SickTagLocMasterController", controller_class):
+        with patch.object(supervisor, "HEARTBEAT_INTERVAL", 0.05):
+            supervisor.run_worker(*args)
+
+
+def build_config(**kwargs) -> models.SickTagLocConfig:
+    # Looked up on every call, as the models module is reloaded by its tests
+    model = models.SickTagLocConfigModel(
+        sick_rtls_http_server_address="https://localhost/",
+        sick_rtls_api_key="key",
+        multiprocess=True,
+        **kwargs,
+    )
+    return models.SickTagLocConfig(
+        connector_type=models.CONNECTOR_TYPE, connector_config=model
+    )
+
+
+def wait_for(condition, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+class TestWorkerConfig:
+    def test_worker_config(self):
+        config = build_config(metrics_port=9100, sick_rtls_record_path="/tmp/s.rec")
+        connector_config = worker_config(config, 2).connector_config
+        assert connector_config.metrics_port == 9103
+        assert connector_config.sick_rtls_record_path == "/tmp/s.rec.2"
+        # The supervisor configuration is left untouched
+        assert config.connector_config.metrics_port == 9100
+
+    def test_defaults(self):
+        connector_config = worker_config(build_config(), 0).connector_config
+        assert connector_config.metrics_port is None
+        assert connector_config.sick_rtls_record_path is None
+        assert connector_config.get_worker_processes() == (os.cpu_count() or 1)
+
+
+class TestWorkerSupervisor:
+    @pytest.fixture(autouse=True)
+    def heartbeat_interval(self, monkeypatch):
+        monkeypatch.setattr(supervisor, "HEARTBEAT_INTERVAL", 0.05)
+
+    @pytest.fixture
+    def create(self):
+        supervisors = []
+
+        def create(target, **kwargs):
+            instance = WorkerSupervisor(build_config(**kwargs), target)
+            instance.start()
+            supervisors.append(instance)
+            return instance
+
+        yield create
+        for instance in supervisors:
+            instance.stop()
+
+    def test_health(self, create):
+        instance = create(healthy_worker, worker_processes=2)
+        assert instance.worker_count == 2
+        assert wait_for(instance.healthy)
+        health = instance.get_health()
+        assert [h.controller.connectors for h in health] == [1, 2]
+        assert all(h.alive and h.restarts == 0 for h in health)
+        assert len({h.pid for h in health}) == 2
+
+        instance.stop()
+        assert not any(h.alive for h in instance.get_health())
+        assert instance.healthy() is False
+
+    def test_restart_crashed(self, create):
+        instance = create(crashing_worker, worker_processes=1, worker_restart_delay=0.1)
+        assert wait_for(lambda: instance.get_health()[0].restarts >= 1)
+        assert instance.get_health()[0].exitcode == 3
+        assert instance.healthy() is False
+
+    def test_restart_hung(self, create):
+        instance = create(
+            hung_worker,
+            worker_processes=1,
+            worker_heartbeat_timeout=0.5,
+            connector_timeout=0.5,
+        )
+        pid = instance.get_health()[0].pid
+        assert wait_for(lambda: instance.get_health()[0].restarts == 1)
+        health = instance.get_health()[0]
+        assert health.pid != pid
+        assert health.exitcode == -9
+
+    def test_run_worker(self, create):
+        instance = create(
+            functools.partial(controller_worker, FakeController), worker_processes=2
+        )
+        assert wait_for(instance.healthy)
+        health = instance.get_health()
+        assert [h.controller.connectors for h in health] == [1, 2]
+        assert all(h.restarts == 0 for h in health)
+
+    @pytest.mark.parametrize(
+        "controller_class", [StuckController, DeadlockedController]
+    )
+    def test_restart_stuck_controller(self, create, controller_class):
+        instance = create(
+            functools.partial(controller_worker, controller_class),
+            worker_processes=1,
+            worker_heartbeat_timeout=0.5,
+            connector_timeout=0.5,
+        )
+        pid = instance.get_health()[0].pid
+        # The worker process keeps running, but the controller makes no progress
+        assert wait_for(lambda: instance.get_health()[0].restarts == 1)
+        health = instance.get_health()[0]
+        assert health.pid != pid
+        assert health.exitcode == -9
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# License: MIT License
+# Copyright 2024 InOrbit, Inc.
+
+# Standard
+import json
+import math
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+# Third Party
+import pytest
+
+# InOrbit
+from sick_tag_loc_connector.api import Tag
+from sick_tag_loc_connector.connector import SickTagLocConnector
+from sick_tag_loc_connector.models import (
+    CONNECTOR_TYPE,
+    SickTagLocConfig,
+    SickTagLocConfigModel,
+)
+from sick_tag_loc_connector.tracing import (
+    LATENCY_STAGES,
+    LatencyTracer,
+    PoseTrace,
+    publish_pose,
+)
+
+
+class TestLatencyTracer:
+    def test_latencies(self):
+        tracer = LatencyTracer("tracer_test")
+        assert list(tracer.percentiles()) == list(LATENCY_STAGES)
+        for quantiles in tracer.percentiles().values():
+            assert all(math.isnan(value) for value in quantiles.values())
+
+        trace = PoseTrace(received=100.5, source=100.0)
+        tracer.received(trace)
+        tracer.published(trace, 101.0, 101.25)
+        percentiles = tracer.percentiles()
+        assert percentiles["receive"][0.5] == pytest.approx(0.5)
+        assert percentiles["wait"][0.5] == pytest.approx(0.5)
+        assert percentiles["publish"][0.5] == pytest.approx(0.25)
+        assert percentiles["total"][0.5] == pytest.approx(1.25)
+
+    def test_unknown_source(self):
+        tracer = LatencyTracer("tracer_test_unknown_source")
+        trace = PoseTrace(received=100.5)
+        tracer.received(trace)
+        tracer.published(trace, 101.0, 101.25)
+        percentiles = tracer.percentiles()
+        assert math.isnan(percentiles["receive"][0.5])
+        assert math.isnan(percentiles["total"][0.5])
+        assert percentiles["wait"][0.5] == pytest.approx(0.5)
+
+
+class TestPublishPose:
+    def test_untraced(self):
+        session = MagicMock()
+        publish_pose(session, {"x": 1, "y": 2, "yaw": 0})
+        session.publish_pose.assert_called_once_with(x=1, y=2, yaw=0)
+
+    def test_traced(self):
+        session, tracer = MagicMock(), MagicMock()
+        received = time.time()
+        trace = PoseTrace(received, ts=1718031931425, tracer=tracer)
+        publish_pose(session, {"x": 1, "y": 2, "yaw": 0}, trace)
+        session.publish_pose.assert_called_once_with(x=1, y=2, yaw=0, ts=1718031931425)
+        _, started, finished = tracer.published.call_args.args
+        assert received <= started <= finished
+
+
+class TestConnectorTracing:
+    AT = "2024-06-10 15:05:31.425"
+    SOURCE = datetime(2024, 6, 10, 15, 5, 31, 425000, timezone.utc).timestamp()
+
+    @pytest.fixture
+    def message(self):
+        return json.dumps(
+            {
+                "body": {
+                    "id": "12",
+                    "datastreams": [
+                        {"id": "posX", "current_value": "1.5", "at": self.AT},
+                        {"id": "posY", "current_value": "-2", "at": self.AT},
+                    ],
+                },
+                "resource": "/feeds/12",
+            }
+        )
+
+    def connector(self, **kwargs):
+        model = SickTagLocConfigModel(
+            sick_rtls_http_server_address="https://localhost/",
+            sick_rtls_api_key="key",
+            **kwargs,
+        )
+        config = SickTagLocConfig(connector_type=CONNECTOR_TYPE, connector_config=model)
+        tag = Tag(MagicMock(), id="12", title="0x240463870012", type="tag")
+        connector = SickTagLocConnector(config, tag)
+        connector._robot_session = MagicMock()
+        return connector
+
+    def test_disabled(self, message):
+        connector = self.connector()
+        connector._parse_pose_from_ws(message)
+        connector._execution_loop()
+        connector._robot_session.publish_pose.assert_called_once_with(
+            x=1.5, y=2.0, yaw=float("inf")
+        )
+        assert connector.get_latency_percentiles() == {}
+
+    def test_latency_tracing(self, message):
+        connector = self.connector(latency_tracing=True)
+        connector._parse_pose_from_ws(message)
+        connector._execution_loop()
+        connector._robot_session.publish_pose.assert_called_once_with(
+            x=1.5, y=2.0, yaw=float("inf")
+        )
+        percentiles = connector.get_latency_percentiles()
+        assert percentiles["receive"][0.5] > 0
+        assert percentiles["wait"][0.5] >= 0
+        assert percentiles["total"][0.5] >= percentiles["receive"][0.5]
+
+    def test_publish_source_timestamp(self, message):
+        connector = self.connector(
+            publish_source_timestamp=True, sick_rtls_timezone="America/Montevideo"
+        )
+        connector._parse_pose_from_ws(message)
+        connector._execution_loop()
+        # Montevideo is 3 hours behind UTC
+        connector._robot_session.publish_pose.assert_called_once_with(
+            x=1.5, y=2.0, yaw=float("inf"), ts=int((self.SOURCE + 3 * 3600) * 1000)
+        )